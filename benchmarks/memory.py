@@ -0,0 +1,147 @@
+"""
+Compare the memory held by many bills as BillInfo models and as BillRecords.
+
+Builds a synthetic parliament's worth of bills whose categorical fields repeat
+as they do on LegisInfo, with fresh string objects per bill as the XML parser
+produces them, and measures each container with tracemalloc.
+
+    python -m benchmarks.memory [--bills 50000] [--json]
+"""
+
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, Iterator
+from src.models.bill import BillInfo
+from src.scraper.records import BillRecord, BillTable
+
+BILL_TYPES = [
+    "House Government Bill",
+    "Private Member's Bill",
+    "Senate Government Bill",
+    "Senate Public Bill",
+    "Senate Private Bill",
+]
+STATUSES = [
+    "Royal Assent",
+    "At consideration in committee in the House of Commons",
+    "Outside the Order of Precedence",
+    "At second reading in the House of Commons",
+    "Bill defeated",
+    "At third reading in the Senate",
+] + [f"Stage {n}" for n in range(24)]
+PARTIES = ["Liberal", "Conservative", "NDP", "Bloc Québécois", "Green Party", "Unknown"]
+
+
+def fresh(value: str) -> str:
+    """A new string object equal to value, as parsing each document yields"""
+    return value.encode().decode()
+
+
+def iter_fields(bills: int, seed: int = 0) -> Iterator[dict[str, str]]:
+    rng = random.Random(seed)
+    sponsors = [(f"Member {n} of Parliament", rng.choice(PARTIES)) for n in range(900)]
+    for n in range(bills):
+        sponsor_name, party = rng.choice(sponsors)
+        yield {
+            "bill_number": f"c-{n}",
+            "bill_type": fresh(rng.choice(BILL_TYPES)),
+            "status": fresh(rng.choice(STATUSES)),
+            "sponsor_name": fresh(sponsor_name),
+            "sponsor_party": fresh(party),
+            "last_updated": f"20{10 + n % 15}-0{1 + n % 9}-1{n % 10}T11:00:00",
+        }
+
+
+def measure(build: Callable[[], Any]) -> tuple[Any, int]:
+    """Build a container and return it with the bytes it keeps allocated"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    container = build()
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return container, held
+
+
+def build_models(bills: int) -> dict[str, BillInfo]:
+    return {
+        f"44-1/c-{n}": BillInfo(**fields) for n, fields in enumerate(iter_fields(bills))
+    }
+
+
+def build_records(bills: int) -> dict[str, BillRecord]:
+    return {
+        f"44-1/c-{n}": BillRecord.from_bill(BillInfo(**fields))
+        for n, fields in enumerate(iter_fields(bills))
+    }
+
+
+def build_table(bills: int) -> BillTable:
+    table = BillTable()
+    for n, fields in enumerate(iter_fields(bills)):
+        table.put(f"44-1/c-{n}", BillInfo(**fields))
+    return table
+
+
+def run(bills: int) -> dict[str, Any]:
+    models, models_bytes = measure(lambda: build_models(bills))
+    del models
+    records, records_bytes = measure(lambda: build_records(bills))
+    del records
+    table, table_bytes = measure(lambda: build_table(bills))
+
+    keys = [f"44-1/c-{n}" for n in range(0, bills, max(bills // 1000, 1))]
+    started = time.perf_counter()
+    for key in keys:
+        table.get(key)
+    to_bill_us = (time.perf_counter() - started) / len(keys) * 1e6
+
+    return {
+        "bills": bills,
+        "billinfo": {
+            "mb": models_bytes / 2**20,
+            "bytes_per_bill": models_bytes / bills,
+        },
+        "records": {
+            "mb": records_bytes / 2**20,
+            "bytes_per_bill": records_bytes / bills,
+        },
+        "indexed_table": {
+            "mb": table_bytes / 2**20,
+            "bytes_per_bill": table_bytes / bills,
+        },
+        "saved_ratio": 1 - records_bytes / models_bytes,
+        "to_bill_us": to_bill_us,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bills", type=int, default=50000, help="Bills to hold")
+    parser.add_argument("--json", action="store_true", help="Print JSON results")
+    args = parser.parse_args()
+
+    results = run(args.bills)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{args.bills} bills, keyed by cache key:")
+    for name in ("billinfo", "records", "indexed_table"):
+        stats = results[name]
+        print(
+            f"  {name:<14}{stats['mb']:>8.1f} MB{stats['bytes_per_bill']:>8.0f} B/bill"
+        )
+    print(f"  records save {results['saved_ratio']:.0%} over BillInfo")
+    print(
+        f"  BillRecord -> BillInfo at the API boundary: {results['to_bill_us']:.2f} us"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,432 @@
+"""
+Benchmark the scrape pipeline end to end against a local stand-in upstream.
+
+The stand-in is a real HTTP/1.1 server on localhost answering for parl.ca and
+ourcommons.ca with the fixture XML from tests/mocks after a configurable
+latency. The app runs with its lifespan, and its pooled upstream client (pool
+limits, keep-alive, timeouts) connects to the stand-in over plain TCP in
+place of TLS to the real hosts. Without TLS there is no ALPN, so the pool
+speaks HTTP/1.1 even when HTTP2_ENABLED is set.
+
+/api/bill and /api/bills/batch are driven in-process through the ASGI app at
+each concurrency level, and throughput, latency percentiles, upstream calls per
+request and the peak memory allocated during each scenario are reported as
+JSON so runs can be compared. Tracing allocations slows them down;
+--no-trace-memory times the pipeline without it.
+
+    python -m benchmarks.pipeline [--concurrency 1 8 32] [--requests 200]
+        [--latency 0.02] [--no-trace-memory] [--output run.json]
+    python -m benchmarks.pipeline --compare before.json after.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+import httpcore
+import httpx
+from src.config.settings import settings
+from src.main import app, lifespan
+from src.scraper.cache import bill_cache, sponsor_cache, validator_cache
+from src.scraper.fastjson import bill_json_cache
+from src.scraper.limits import reset_host_limiters
+from src.scraper.parser import revalidation_stats
+from src.scraper.records import bill_table
+from src.scraper.resilience import reset_resilience
+from src.scraper.singleflight import bill_flight, sponsor_flight
+from src.scraper.xmlparse import use_lxml
+
+MOCKS = Path(__file__).resolve().parent.parent / "tests" / "mocks"
+FIRST_PERSON_ID = 105837
+
+
+class StandInUpstream:
+    """
+    Local HTTP server standing in for parl.ca and ourcommons.ca, told apart by
+    the Host header. Bill C-<n> is sponsored by one of `sponsors` MPs, so
+    sponsor lookups are shared across bills the way they are upstream.
+    """
+
+    def __init__(self, latency: float, jitter: float = 0.0, sponsors: int = 50):
+        self.latency = latency
+        self.jitter = jitter
+        self.sponsors = sponsors
+        self.calls: Counter[str] = Counter()
+        self.bill_xml = (MOCKS / "bill.xml").read_text(encoding="utf-8")
+        self.mp_xml = (MOCKS / "mp_profile.xml").read_text(encoding="utf-8").encode()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        self.server.daemon_threads = True
+        self.server.upstream = self  # type: ignore[attr-defined]
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self.server.server_address[1]
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self._thread.join()
+
+    def bill_document(self, number: str) -> bytes:
+        index = int(number.partition("-")[2] or 0)
+        person_id = str(FIRST_PERSON_ID + index % self.sponsors)
+        return (
+            self.bill_xml.replace("C-422", number.upper())
+            .replace(str(FIRST_PERSON_ID), person_id)
+            .encode()
+        )
+
+    def document(self, host: str, path: str) -> Optional[bytes]:
+        """The body served for a request, or None for a 404"""
+        self.calls[host] += 1
+        time.sleep(self.latency + random.uniform(0, self.jitter))
+
+        parts = path.split("?")[0].strip("/").split("/")
+        if host.endswith("ourcommons.ca"):
+            return self.mp_xml
+        if host.endswith("parl.ca") and parts[-1] == "xml" and len(parts) >= 3:
+            return self.bill_document(parts[-2])
+        return None
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    # Keep connections alive like the real hosts
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        host = self.headers.get("Host", "").partition(":")[0]
+        body = self.server.upstream.document(host, self.path)  # type: ignore[attr-defined]
+        self.send_response(200 if body is not None else 404)
+        self.send_header("Content-Type", "application/xml")
+        self.send_header("Content-Length", str(len(body or b"")))
+        self.end_headers()
+        self.wfile.write(body or b"")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class PlainStream(httpcore.AsyncNetworkStream):
+    """A TCP stream that skips the TLS handshake, since the stand-in has no TLS"""
+
+    def __init__(self, stream: httpcore.AsyncNetworkStream):
+        self.stream = stream
+
+    async def read(self, max_bytes: int, timeout: Optional[float] = None) -> bytes:
+        return await self.stream.read(max_bytes, timeout)
+
+    async def write(self, buffer: bytes, timeout: Optional[float] = None) -> None:
+        await self.stream.write(buffer, timeout)
+
+    async def aclose(self) -> None:
+        await self.stream.aclose()
+
+    async def start_tls(self, ssl_context, server_hostname=None, timeout=None):
+        return self
+
+    def get_extra_info(self, info: str) -> Any:
+        return self.stream.get_extra_info(info)
+
+
+class StandInNetwork(httpcore.AsyncNetworkBackend):
+    """Connects to the stand-in whatever upstream host a request is for"""
+
+    def __init__(self, port: int):
+        self.port = port
+        self.backend = httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self, host, port, timeout=None, local_address=None, socket_options=None
+    ):
+        stream = await self.backend.connect_tcp(
+            "127.0.0.1", self.port, timeout, local_address, socket_options
+        )
+        return PlainStream(stream)
+
+    async def sleep(self, seconds: float) -> None:
+        await self.backend.sleep(seconds)
+
+
+def route_to_stand_in(client: httpx.AsyncClient, port: int) -> None:
+    """
+    Point the app's pooled client at the stand-in, keeping its pool, limits
+    and timeouts. httpx has no public hook for the network backend, so this
+    reaches into the connection pool.
+    """
+    client._transport._pool._network_backend = StandInNetwork(port)  # type: ignore
+
+
+def reset_pipeline() -> None:
+    """Empty every in-process cache so a run starts cold"""
+    bill_cache.clear()
+    sponsor_cache.clear()
+    validator_cache.clear()
+    bill_json_cache.clear()
+    bill_table.clear()
+    bill_flight.reset()
+    sponsor_flight.reset()
+    for counter in revalidation_stats:
+        revalidation_stats[counter] = 0
+    reset_host_limiters()
+    reset_resilience()
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def peak_traced_mb(baseline: int) -> Optional[float]:
+    """Peak traced memory since the last reset_peak(), above `baseline` bytes"""
+    if not tracemalloc.is_tracing():
+        return None
+    _, peak = tracemalloc.get_traced_memory()
+    return (peak - baseline) / (1024 * 1024)
+
+
+async def drive(
+    requests: list[Callable[[], Awaitable[httpx.Response]]], concurrency: int
+) -> tuple[list[float], int, float]:
+    """
+    Run the request callables with `concurrency` workers.
+    Returns the latencies in seconds, the error count and the wall time.
+    """
+    queue = iter(requests)
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        for send in queue:
+            started = time.perf_counter()
+            response = await send()
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started
+
+
+async def run_scenario(
+    name: str,
+    api: httpx.AsyncClient,
+    upstream: StandInUpstream,
+    requests: list[Callable[[], Awaitable[httpx.Response]]],
+    concurrency: int,
+    bills: int,
+) -> dict[str, Any]:
+    upstream.calls.clear()
+    baseline = 0
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+    latencies, errors, duration = await drive(requests, concurrency)
+    latencies.sort()
+    upstream_calls = sum(upstream.calls.values())
+    return {
+        "scenario": name,
+        "concurrency": concurrency,
+        "requests": len(requests),
+        "bills": bills,
+        "errors": errors,
+        "duration_s": duration,
+        "requests_per_s": len(requests) / duration,
+        "bills_per_s": bills / duration,
+        "latency_ms": {
+            "p50": percentile(latencies, 0.50) * 1e3,
+            "p95": percentile(latencies, 0.95) * 1e3,
+            "p99": percentile(latencies, 0.99) * 1e3,
+            "max": latencies[-1] * 1e3 if latencies else 0.0,
+        },
+        "upstream_calls": dict(upstream.calls),
+        "upstream_calls_per_request": upstream_calls / len(requests),
+        "peak_memory_mb": peak_traced_mb(baseline),
+    }
+
+
+async def run_level(
+    api: httpx.AsyncClient,
+    upstream: StandInUpstream,
+    concurrency: int,
+    count: int,
+    batch_size: int,
+) -> list[dict[str, Any]]:
+    """Cold bill lookups, the same lookups warm, then cold batches"""
+    reset_pipeline()
+    urls = [f"https://www.parl.ca/legisinfo/en/bill/44-1/c-{n}" for n in range(count)]
+
+    def get_bill(url: str) -> Callable[[], Awaitable[httpx.Response]]:
+        return lambda: api.get("/api/bill", params={"url": url})
+
+    def post_batch(bills: list[str]) -> Callable[[], Awaitable[httpx.Response]]:
+        return lambda: api.post("/api/bills/batch", json={"bills": bills})
+
+    results = []
+    for name in ("bill_cold", "bill_warm"):
+        results.append(
+            await run_scenario(
+                name,
+                api,
+                upstream,
+                [get_bill(url) for url in urls],
+                concurrency,
+                count,
+            )
+        )
+
+    reset_pipeline()
+    batches = [
+        [f"44-1/c-{n}" for n in range(start, min(start + batch_size, count))]
+        for start in range(0, count, batch_size)
+    ]
+    results.append(
+        await run_scenario(
+            "batch_cold",
+            api,
+            upstream,
+            [post_batch(batch) for batch in batches],
+            concurrency,
+            count,
+        )
+    )
+    return results
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    # Measure the pipeline itself, not the politeness limit towards parl.ca
+    settings.UPSTREAM_RATE_LIMIT = args.rate_limit
+    # Start every run cold and keep the lifespan's background fetches, which
+    # would go out before the client is routed, off the real hosts
+    settings.BILL_PREWARM = []
+    settings.SPONSOR_PREWARM_IDS = []
+    settings.WATCH_LIST = []
+    settings.BILL_STORE_PATH = ""
+    settings.SHARED_CACHE_URL = ""
+    upstream = StandInUpstream(args.latency, args.jitter, args.sponsors)
+    upstream.start()
+    # Leave tracing alone when the caller already started it
+    own_tracing = args.trace_memory and not tracemalloc.is_tracing()
+    if own_tracing:
+        tracemalloc.start()
+
+    results = []
+    try:
+        async with lifespan(app):
+            route_to_stand_in(app.state.http_client, upstream.port)
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://bench"
+            ) as api:
+                for concurrency in args.concurrency:
+                    results.extend(
+                        await run_level(
+                            api, upstream, concurrency, args.requests, args.batch_size
+                        )
+                    )
+    finally:
+        upstream.stop()
+        if own_tracing:
+            tracemalloc.stop()
+
+    return {
+        "meta": {
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "xml_backend": "lxml" if use_lxml() else "etree",
+            "upstream_latency_s": args.latency,
+            "upstream_jitter_s": args.jitter,
+            "upstream_rate_limit": args.rate_limit,
+            "http_max_connections": settings.HTTP_MAX_CONNECTIONS,
+            "http_max_keepalive_connections": settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            "sponsors": args.sponsors,
+            "batch_size": args.batch_size,
+            "trace_memory": args.trace_memory,
+        },
+        "results": results,
+    }
+
+
+def compare(before_path: str, after_path: str) -> None:
+    """Print throughput and p95 latency changes between two result files"""
+    with open(before_path) as f:
+        before = {(r["scenario"], r["concurrency"]): r for r in json.load(f)["results"]}
+    with open(after_path) as f:
+        after = json.load(f)["results"]
+
+    print(
+        f"{'scenario':<12}{'conc':>6}{'req/s':>12}{'change':>9}{'p95 ms':>10}{'change':>9}"
+    )
+    for result in after:
+        old = before.get((result["scenario"], result["concurrency"]))
+        if old is None:
+            continue
+        rps, old_rps = result["requests_per_s"], old["requests_per_s"]
+        p95, old_p95 = result["latency_ms"]["p95"], old["latency_ms"]["p95"]
+        print(
+            f"{result['scenario']:<12}{result['concurrency']:>6}"
+            f"{rps:>12.1f}{(rps / old_rps - 1) * 100:>+8.1f}%"
+            f"{p95:>10.1f}{(p95 / old_p95 - 1) * 100 if old_p95 else 0.0:>+8.1f}%"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument(
+        "--requests", type=int, default=500, help="Distinct bills per scenario"
+    )
+    parser.add_argument("--batch-size", type=int, default=25)
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="Upstream latency in seconds"
+    )
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--sponsors", type=int, default=50, help="Distinct MPs")
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=0.0,
+        help="UPSTREAM_RATE_LIMIT during the run (0 disables it)",
+    )
+    parser.add_argument(
+        "--no-trace-memory",
+        dest="trace_memory",
+        action="store_false",
+        help="Skip the per-scenario peak memory, which slows allocations",
+    )
+    parser.add_argument("--output", help="Write the JSON results to this file")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="Compare two runs"
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    # Per-bill INFO logs would dominate the measurements
+    logging.disable(logging.INFO)
+    results = asyncio.run(run(args))
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
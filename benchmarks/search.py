@@ -0,0 +1,114 @@
+"""
+Time GET /api/bills searches over 50,000 indexed bills.
+
+Fills the bill table with the synthetic bills of benchmarks.memory, then times
+a mix of single, combined, date-bounded and deep-page queries, both against the
+table alone and through the whole app.
+
+    python -m benchmarks.search [--bills 50000] [--repeat 200] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any
+from urllib.parse import urlencode
+from benchmarks.memory import iter_fields
+from benchmarks.serialization import call_app
+from src.models.bill import BillInfo
+from src.scraper.records import bill_table
+
+QUERIES = {
+    "all": {},
+    "party": {"sponsor_party": "NDP"},
+    "status_page_20": {"status": "Royal Assent", "offset": 1000},
+    "party_status": {"sponsor_party": "Liberal", "status": "Royal Assent"},
+    "party_type": {"sponsor_party": "Liberal", "bill_type": "Private Member's Bill"},
+    "party_type_status": {
+        "sponsor_party": "Liberal",
+        "bill_type": "Private Member's Bill",
+        "status": "Royal Assent",
+    },
+    "party_since_2020": {"sponsor_party": "Liberal", "updated_since": "2020-01-01"},
+    "party_type_since_2020": {
+        "sponsor_party": "Liberal",
+        "bill_type": "Private Member's Bill",
+        "updated_since": "2020-01-01",
+    },
+    "sponsor_in_2021": {
+        "sponsor_name": "Member 7 of Parliament",
+        "updated_since": "2021-01-01",
+        "updated_before": "2022-01-01",
+    },
+}
+
+
+def table_query(params: dict[str, Any]) -> tuple[int, list]:
+    params = dict(params)
+    return bill_table.query(
+        {
+            name: params.pop(name)
+            for name in ("status", "sponsor_party", "sponsor_name", "bill_type")
+            if name in params
+        },
+        **params,
+    )
+
+
+async def run(bills: int, repeat: int) -> dict[str, Any]:
+    bill_table.clear()
+    started = time.perf_counter()
+    for n, fields in enumerate(iter_fields(bills)):
+        bill_table.put(f"44-1/c-{n}", BillInfo(**fields))
+    results: dict[str, Any] = {
+        "bills": bills,
+        "index_build_s": time.perf_counter() - started,
+        "queries": {},
+    }
+
+    for name, params in QUERIES.items():
+        started = time.perf_counter()
+        for _ in range(repeat):
+            total, _ = table_query(params)
+        query_us = (time.perf_counter() - started) / repeat * 1e6
+
+        query_string = urlencode(params)
+        started = time.perf_counter()
+        for _ in range(repeat):
+            await call_app("/api/bills", query_string)
+        request_us = (time.perf_counter() - started) / repeat * 1e6
+
+        results["queries"][name] = {
+            "matches": total,
+            "query_us": query_us,
+            "request_us": request_us,
+        }
+
+    bill_table.clear()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bills", type=int, default=50000, help="Bills to index")
+    parser.add_argument("--repeat", type=int, default=200, help="Runs per query")
+    parser.add_argument("--json", action="store_true", help="Print JSON results")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.bills, args.repeat))
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{args.bills} bills indexed in {results['index_build_s']:.1f} s")
+    print(f"{'query':<20}{'matches':>9}{'index':>12}{'request':>12}")
+    for name, timings in results["queries"].items():
+        print(
+            f"{name:<20}{timings['matches']:>9}{timings['query_us']:>9.0f} us"
+            f"{timings['request_us']:>9.0f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
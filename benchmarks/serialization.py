@@ -0,0 +1,158 @@
+"""
+Measure the CPU cost of answering /api/bill from the bill cache.
+
+Times each way of turning a cached BillInfo into a response body: FastAPI's
+response_model path (validate, dump to a dict, json.dumps), pydantic's
+model_dump_json, the orjson dump and the stored bytes of FAST_JSON. Then
+measures CPU time per cache-hit request through the whole app with FAST_JSON
+off and on.
+
+    python -m benchmarks.serialization [--requests 2000] [--repeat 5] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable
+from unittest.mock import patch
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from src.main import app
+from src.models.bill import BillInfo
+from src.scraper.cache import bill_cache
+from src.scraper.fastjson import BillJsonCache, dump_bill, orjson_available
+
+BILL_KEY = "44-1/c-422"
+BILL_URL = f"/api/bill?url=https://www.parl.ca/legisinfo/en/bill/{BILL_KEY}"
+BILL = BillInfo(
+    bill_number="c-422",
+    bill_type="Private Member's Bill",
+    status="Outside the Order of Precedence",
+    sponsor_name="Bonita Zarrillo",
+    sponsor_party="NDP",
+    last_updated="2024-12-02T11:00:00",
+)
+
+
+async def best_of(repeat: int, number: int, fn: Callable[[], Awaitable[Any]]) -> float:
+    """Best mean CPU seconds per call over `repeat` rounds of `number` calls"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.process_time()
+        for _ in range(number):
+            await fn()
+        best = min(best, (time.process_time() - started) / number)
+    return best
+
+
+async def serializers(repeat: int) -> dict[str, float]:
+    """Microseconds to produce the body of one cached bill, per approach"""
+    field = create_response_field("Response_get_bill_info", BillInfo)
+    json_cache = BillJsonCache(maxsize=1)
+
+    async def response_model() -> bytes:
+        content = await serialize_response(field=field, response_content=BILL)
+        return JSONResponse(content).body
+
+    async def model_dump_json() -> bytes:
+        return BILL.model_dump_json().encode()
+
+    async def fast_dump() -> bytes:
+        return dump_bill(BILL)
+
+    async def cached_bytes() -> bytes:
+        return json_cache.get(BILL_KEY, BILL)
+
+    approaches = {
+        "response_model": response_model,
+        "model_dump_json": model_dump_json,
+        "orjson" if orjson_available() else "fast_dump": fast_dump,
+        "cached_bytes": cached_bytes,
+    }
+    return {
+        name: await best_of(repeat, 20000, fn) * 1e6 for name, fn in approaches.items()
+    }
+
+
+async def call_app(path: str, query: str) -> bytes:
+    """Run one GET through the ASGI app directly, without an HTTP client"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+        "app": app,
+    }
+    body = []
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(body)
+
+
+async def requests(count: int, repeat: int) -> dict[str, float]:
+    """CPU microseconds per cache-hit /api/bill request, FAST_JSON off and on"""
+    results = {"default": float("inf"), "fast_json": float("inf")}
+    path, _, query = BILL_URL.partition("?")
+    bill_cache.set(BILL_KEY, BILL)
+    app.state.http_client = None
+    # Alternate the modes every round so drift affects both alike
+    for _ in range(repeat):
+        for name, fast in (("default", False), ("fast_json", True)):
+            with patch("src.api.endpoints.settings.FAST_JSON", fast):
+                cpu = await best_of(1, count, lambda: call_app(path, query)) * 1e6
+            results[name] = min(results[name], cpu)
+    bill_cache.clear()
+    return results
+
+
+async def run(count: int, repeat: int) -> dict[str, Any]:
+    results = {
+        "orjson": orjson_available(),
+        "serialize_us": await serializers(repeat),
+        "request_cpu_us": await requests(count, repeat),
+    }
+    request_cpu = results["request_cpu_us"]
+    results["request_cpu_saved_us"] = request_cpu["default"] - request_cpu["fast_json"]
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per round")
+    parser.add_argument("--repeat", type=int, default=5, help="Rounds, best is kept")
+    parser.add_argument("--json", action="store_true", help="Print JSON results")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.requests, args.repeat))
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print("Serializing one cached bill (CPU):")
+    for name, micros in results["serialize_us"].items():
+        print(f"  {name:<18}{micros:>8.2f} us")
+    print("Cache-hit /api/bill request (CPU, whole app):")
+    for name, micros in results["request_cpu_us"].items():
+        print(f"  {name:<18}{micros:>8.1f} us")
+    print(f"  {'saved':<18}{results['request_cpu_saved_us']:>8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Compare XML parsing backends on bill documents.
+
+Times the ElementTree path as it was before the XML backends (decoded text, one
+find() per field), the single-pass ElementTree backend and the lxml XPath
+backend, for a single-bill document and for a streamed 1,000-bill session feed.
+
+    python -m benchmarks.xml_parse [--bills 1000] [--repeat 5] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Any, Callable
+from unittest.mock import patch
+from src.scraper.parser import bill_fields, extract_bill_fields
+from src.scraper.stream import iter_bill_elements, iter_bytes
+from src.scraper.xmlparse import lxml_available, read_bill_values
+
+FEED_PATH = Path(__file__).parent.parent / "tests" / "mocks" / "session_bills.xml"
+
+
+def legacy_bill_fields(bill: ET.Element) -> dict[str, str]:
+    """Field extraction as done before the XML backends: one find() per field"""
+
+    def text(tag: str) -> str:
+        element = bill.find(tag)
+        if element is not None and element.text:
+            return element.text.strip()
+        return "Unknown"
+
+    status = text("StatusName")
+    dropped = bill.find("IsDroppedFromSenateOrderPaper")
+    if dropped is not None and dropped.text and dropped.text.lower() == "true":
+        status = "Dropped from Senate Order Paper"
+    # Sponsor lookups done by extract_sponsor
+    for tag in (
+        "SponsorPersonId",
+        "SponsorPersonOfficialFirstName",
+        "SponsorPersonOfficialLastName",
+        "IsSenateBill",
+    ):
+        text(tag)
+    return {
+        "bill_number": text("NumberCode").lower(),
+        "bill_type": text("BillDocumentTypeName"),
+        "status": status,
+        "sponsor_name": text("SponsorPersonName"),
+        "last_updated": text("LatestBillEventDateTime"),
+    }
+
+
+def legacy_parse_document(content: bytes) -> dict[str, str]:
+    bill = ET.fromstring(content.decode()).find("Bill")
+    return legacy_bill_fields(bill)
+
+
+def build_feed(template: bytes, bills: int) -> bytes:
+    """A session feed of `bills` copies of the first <Bill> in `template`"""
+    bill = ET.tostring(ET.fromstring(template).find("Bill"))
+    parts = [b'<?xml version="1.0" encoding="utf-8"?>\n<Bills>']
+    for number in range(1, bills + 1):
+        parts.append(bill.replace(b"C-422", f"C-{number}".encode()))
+    parts.append(b"</Bills>")
+    return b"".join(parts)
+
+
+async def stream_feed(feed: bytes, extract: Callable[[Any], dict]) -> int:
+    count = 0
+    chunks = [feed[i : i + 64 * 1024] for i in range(0, len(feed), 64 * 1024)]
+    async for bill in iter_bill_elements(iter_bytes(chunks)):
+        extract(bill)
+        count += 1
+    return count
+
+
+def best_of(repeat: int, number: int, fn: Callable[[], Any]) -> float:
+    """Best mean seconds per call over `repeat` rounds of `number` calls"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best
+
+
+def run(bills: int, repeat: int) -> dict[str, Any]:
+    feed_template = FEED_PATH.read_bytes()
+    document = build_feed(feed_template, 1)
+    feed = build_feed(feed_template, bills)
+
+    backends = ["etree", "lxml"] if lxml_available() else ["etree"]
+    results: dict[str, Any] = {"bills_per_feed": bills, "backends": {}}
+
+    with patch("src.scraper.xmlparse.settings.XML_BACKEND", "etree"):
+        results["backends"]["legacy"] = {
+            "document_us": best_of(
+                repeat, 2000, lambda: legacy_parse_document(document)
+            )
+            * 1e6,
+            "feed_ms": best_of(
+                repeat,
+                1,
+                lambda: asyncio.run(stream_feed(feed, legacy_bill_fields)),
+            )
+            * 1e3,
+        }
+
+    for backend in backends:
+        with patch("src.scraper.xmlparse.settings.XML_BACKEND", backend):
+            results["backends"][backend] = {
+                "document_us": best_of(
+                    repeat, 2000, lambda: bill_fields(read_bill_values(document))
+                )
+                * 1e6,
+                "feed_ms": best_of(
+                    repeat,
+                    1,
+                    lambda: asyncio.run(stream_feed(feed, extract_bill_fields)),
+                )
+                * 1e3,
+            }
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bills", type=int, default=1000, help="Bills per feed")
+    parser.add_argument("--repeat", type=int, default=5, help="Rounds, best is kept")
+    parser.add_argument("--json", action="store_true", help="Print JSON results")
+    args = parser.parse_args()
+
+    results = run(args.bills, args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(
+        f"{'backend':<10}{'per bill document':>20}{f'per {args.bills}-bill feed':>24}"
+    )
+    for backend, timings in results["backends"].items():
+        print(
+            f"{backend:<10}{timings['document_us']:>17.1f} us"
+            f"{timings['feed_ms']:>21.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -13,5 +13,16 @@ setup(
         "pydantic>=2.5.2",
         "python-dotenv>=1.0.0",
     ],
+    extras_require={
+        # Faster XML parsing, picked up automatically when installed
+        "lxml": ["lxml>=4.9"],
+        # Faster JSON for FAST_JSON responses
+        "orjson": ["orjson>=3.9"],
+        # Faster event loop and HTTP parser for the production server
+        "server": ["uvloop>=0.17; sys_platform != 'win32'", "httptools>=0.5"],
+    },
+    entry_points={
+        "console_scripts": ["parliament-scraper=src.server:main"],
+    },
     python_requires=">=3.7",
 )
@@ -0,0 +1,55 @@
+import asyncio
+import secrets
+import threading
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from src.config.settings import settings
+from src.scraper.profiler import ProfilerBusy, profile_thread
+from src.scraper.tracing import slow_traces
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Admin endpoints are hidden unless ADMIN_TOKEN is set, and need the token"""
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if x_admin_token is None or not secrets.compare_digest(
+        x_admin_token, settings.ADMIN_TOKEN
+    ):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+router = APIRouter(prefix="/admin", dependencies=[Depends(require_admin)])
+
+
+@router.get("/profile", tags=["Admin"])
+async def profile(
+    seconds: float = Query(5.0, gt=0, le=60, description="How long to sample"),
+    interval: float = Query(
+        0.005, ge=0.001, le=1, description="Seconds between samples"
+    ),
+    limit: int = Query(20, ge=1, le=200, description="Hot stacks to return"),
+):
+    """
+    Sample this worker's event loop for `seconds` while it keeps serving
+    requests, and return the hottest stacks and functions
+    """
+    loop_thread = threading.get_ident()
+    try:
+        return await asyncio.to_thread(
+            profile_thread, loop_thread, seconds, interval, limit
+        )
+    except ProfilerBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+@router.get("/traces", tags=["Admin"])
+async def traces():
+    """
+    Span timings of the most recent requests slower than TRACE_SLOW_THRESHOLD,
+    newest first (needs TRACING_ENABLED)
+    """
+    return {
+        "enabled": settings.TRACING_ENABLED,
+        "threshold": settings.TRACE_SLOW_THRESHOLD,
+        "traces": [trace.to_dict() for trace in reversed(slow_traces)],
+    }
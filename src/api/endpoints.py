@@ -1,43 +1,296 @@
-from fastapi import APIRouter, HTTPException, Query
-from src.scraper.parser import scrape_bill_info
-from src.models.bill import BillInfo
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from src.config.settings import settings
+from src.scraper.batch import iter_batch_items, scrape_bills
+from src.scraper.cache import bill_cache, sponsor_cache
+from src.scraper.client import get_http_client
+from src.scraper.deadline import request_deadline
+from src.scraper.fastjson import bill_json_cache, dump_bill, dump_json
+from src.scraper.limits import upstream_limits
+from src.scraper.ingest import IngestResult, ingest_session, is_valid_session
+from src.scraper.parser import revalidation_stats, scrape_bill_info_swr
+from src.scraper.records import bill_table
+from src.scraper.resilience import circuit_states
+from src.scraper.singleflight import bill_flight, sponsor_flight
+from src.scraper.shared_cache import get_shared_cache
+from src.scraper.tracing import request_trace, span, stage
+from src.scraper.utils import parse_bill_id
+from src.models.bill import BatchRequest, BatchResponse, BillInfo, BillPage
+from datetime import date, datetime
+from typing import Optional, Union
+import httpx
 import logging
+import xml.etree.ElementTree as ET
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+def upstream_client(request: Request) -> httpx.AsyncClient:
+    """Shared upstream client created by the app lifespan"""
+    client = getattr(request.app.state, "http_client", None)
+    if client is None or client.is_closed:
+        return get_http_client()
+    return client
+
+
+def parse_fields(fields: Optional[str]) -> Optional[set[str]]:
+    """Parse a comma-separated list of BillInfo field names; None means all"""
+    if fields is None:
+        return None
+    selected = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = selected - set(BillInfo.model_fields)
+    if not selected or unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown)) or fields!r}",
+        )
+    return selected
+
+
 @router.get("/bill", response_model=BillInfo, tags=["Bills"])
 async def get_bill_info(
     url: str = Query(..., description="URL of the parliament bill to scrape"),
-) -> BillInfo:
+    fields: Optional[str] = Query(
+        None, description="Comma-separated fields to return, e.g. 'status,sponsor_name'"
+    ),
+    client: httpx.AsyncClient = Depends(upstream_client),
+) -> Response:
     """
     Get information about a specific bill from the Parliament website.
 
     Args:
         url: The full URL of the bill (e.g., https://www.parl.ca/legisinfo/en/bill/44-1/s-2)
+        fields: Only return these fields. Leaving out sponsor_party skips the
+            MP profile request.
 
     Returns:
         BillInfo: Information about the bill including type, status, sponsor, etc.
+        A cached bill past its TTL may be returned while it is refreshed in the
+        background; such responses carry "X-Cache-Status: stale" and an Age header.
+        With FAST_JSON on, a cached bill is answered with the bytes serialized
+        on its first hit. The lookup is bounded by REQUEST_DEADLINE; when
+        little of it is left the sponsor party may be "Unknown".
 
     Raises:
         HTTPException: If the URL is invalid or scraping fails
     """
+    with request_trace(f"GET /api/bill {url}"):
+        try:
+            with span("validate"):
+                bill_id = parse_bill_id(url)
+                if bill_id is None:
+                    raise HTTPException(
+                        status_code=400,
+                        detail="Invalid URL format. URL must be from parl.ca/legisinfo",
+                    )
+                selected = parse_fields(fields)
+                with_sponsor = selected is None or "sponsor_party" in selected
+
+            with request_deadline(settings.REQUEST_DEADLINE):
+                bill_info, stale_age = await scrape_bill_info_swr(
+                    bill_id.url, client, with_sponsor
+                )
+            headers = {}
+            if stale_age is not None:
+                headers["X-Cache-Status"] = "stale"
+                headers["Age"] = str(int(stale_age))
+            with stage("serialize"):
+                if not settings.FAST_JSON:
+                    body = bill_info.model_dump_json(include=selected)
+                elif selected is None:
+                    body = bill_json_cache.get(bill_id.key, bill_info)
+                else:
+                    body = dump_bill(bill_info, selected)
+            return Response(body, media_type="application/json", headers=headers)
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to process URL {url}: {str(e)}")
+            raise HTTPException(
+                status_code=500, detail="Failed to process the bill URL"
+            )
+
+
+def parse_date(name: str, value: Optional[str]) -> Optional[str]:
+    """
+    Normalize an ISO 8601 date or local date-time query parameter to the
+    YYYY-MM-DD[THH:MM:SS] form bills are indexed by
+
+    Raises:
+        HTTPException: If the value is not such a date or has a time zone
+    """
+    if value is None:
+        return None
     try:
-        # Validate URL format (basic check)
-        if not url.startswith("https://www.parl.ca/legisinfo/en/bill/"):
+        parsed: Union[date, datetime] = date.fromisoformat(value)
+    except ValueError:
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
             raise HTTPException(
                 status_code=400,
-                detail="Invalid URL format. URL must be from parl.ca/legisinfo",
+                detail=f"{name} must be an ISO 8601 date, e.g. 2024-01-31",
             )
+        # Bills carry LegisInfo's local times without an offset
+        if parsed.tzinfo is not None:
+            raise HTTPException(
+                status_code=400, detail=f"{name} must not include a time zone"
+            )
+    return parsed.isoformat()
+
+
+@router.get("/bills", response_model=BillPage, tags=["Bills"])
+async def search_bills(
+    status: Optional[str] = Query(None, description="Exact status, any case"),
+    sponsor_party: Optional[str] = Query(None, description="e.g. 'NDP'"),
+    sponsor_name: Optional[str] = Query(None, description="Exact sponsor name"),
+    bill_type: Optional[str] = Query(None, description="e.g. 'Private Member's Bill'"),
+    updated_since: Optional[str] = Query(
+        None, description="Last updated on or after this date"
+    ),
+    updated_before: Optional[str] = Query(
+        None, description="Last updated before this date"
+    ),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(settings.BILLS_PAGE_SIZE, ge=1, le=settings.BILLS_PAGE_MAX),
+) -> Response:
+    """
+    Search the bills this worker has ingested or scraped, by any combination
+    of filters, most recently updated first.
 
-        return await scrape_bill_info(url)
+    Args:
+        status, sponsor_party, sponsor_name, bill_type: Match these values,
+            ignoring case
+        updated_since, updated_before: Bound last_updated (ISO 8601 dates)
+        offset, limit: Page through the matches
+
+    Returns:
+        BillPage: The number of matching bills and the requested page.
+        Answered from in-memory indexes; bills not yet ingested or scraped
+        by this worker are not found.
+
+    Raises:
+        HTTPException: If a date is not ISO 8601
+    """
+    filters = {
+        name: value
+        for name, value in (
+            ("status", status),
+            ("sponsor_party", sponsor_party),
+            ("sponsor_name", sponsor_name),
+            ("bill_type", bill_type),
+        )
+        if value is not None
+    }
+    total, page = bill_table.query(
+        filters,
+        parse_date("updated_since", updated_since),
+        parse_date("updated_before", updated_before),
+        offset,
+        limit,
+    )
+    body = dump_json(
+        {
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "bills": [{**record.as_dict(), "id": key} for key, record in page],
+        }
+    )
+    return Response(body, media_type="application/json")
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to process URL {url}: {str(e)}")
-        raise HTTPException(status_code=500, detail="Failed to process the bill URL")
+
+@router.post("/bills/batch", response_model=BatchResponse, tags=["Bills"])
+async def get_bills_batch(
+    batch: BatchRequest,
+    client: httpx.AsyncClient = Depends(upstream_client),
+) -> BatchResponse:
+    """
+    Get information about many bills in one call.
+
+    Args:
+        batch: Bill URLs or identifiers such as "44-1/c-422"
+
+    Returns:
+        BatchResponse: One result per requested bill, in request order. A failed
+        bill carries its own status code and error instead of failing the batch.
+
+    Raises:
+        HTTPException: If the batch is larger than BATCH_MAX_ITEMS
+    """
+    if len(batch.bills) > settings.BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch too large. At most {settings.BATCH_MAX_ITEMS} bills allowed",
+        )
+
+    return BatchResponse(results=await scrape_bills(batch.bills, client))
+
+
+@router.post("/bills/stream", tags=["Bills"])
+async def stream_bills(
+    batch: BatchRequest,
+    client: httpx.AsyncClient = Depends(upstream_client),
+) -> StreamingResponse:
+    """
+    Stream information about many bills as newline-delimited JSON.
+
+    Args:
+        batch: Bill URLs or identifiers such as "44-1/c-422"
+
+    Returns:
+        StreamingResponse: One JSON line per bill in the shape of a batch item,
+        written as soon as that bill is scraped (completion order, not request order)
+
+    Raises:
+        HTTPException: If the batch is larger than STREAM_MAX_ITEMS
+    """
+    if len(batch.bills) > settings.STREAM_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch too large. At most {settings.STREAM_MAX_ITEMS} bills allowed",
+        )
+
+    async def lines():
+        async for item in iter_batch_items(batch.bills, client):
+            yield item.model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.post("/sessions/{session}/ingest", response_model=IngestResult, tags=["Bills"])
+async def ingest_session_bills(
+    session: str,
+    resolve_sponsors: bool = Query(True, description="Also look up sponsor parties"),
+    client: httpx.AsyncClient = Depends(upstream_client),
+) -> IngestResult:
+    """
+    Load every bill of a session from the LegisInfo session feed in one pass.
+
+    Args:
+        session: Session code (e.g., 44-1)
+        resolve_sponsors: Whether to look up each sponsor's party; without
+            it, bills whose party is not already known are left out
+
+    Returns:
+        IngestResult: How many bills were ingested, skipped and left out
+
+    Raises:
+        HTTPException: If the session code is invalid or the feed cannot be loaded
+    """
+    if not is_valid_session(session):
+        raise HTTPException(status_code=400, detail="Invalid session code")
+
+    try:
+        return await ingest_session(session, client, resolve_sponsors)
+    except httpx.HTTPError as e:
+        logger.error(f"Session feed fetch error for {session}: {str(e)}")
+        raise HTTPException(status_code=502, detail=f"Failed to fetch feed: {str(e)}")
+    except ET.ParseError as e:
+        logger.error(f"Session feed parsing error for {session}: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to parse feed: {str(e)}")
 
 
 @router.get("/health", tags=["Health"])
@@ -46,3 +299,52 @@ async def health_check():
     Health check endpoint to verify the API is running
     """
     return {"status": "healthy", "message": "Parliament bill scraper is running"}
+
+
+@router.get("/cache/stats", tags=["Health"])
+async def cache_stats():
+    """
+    Hit/miss/eviction counters for the in-process caches and the shared cache
+    when enabled, the number of bills in the bill table, how many upstream
+    fetches were coalesced into an in-flight request, and how many refreshes
+    were answered with 304 Not Modified
+    """
+    shared = get_shared_cache()
+    return {
+        "bills": bill_cache.stats(),
+        "sponsors": sponsor_cache.stats(),
+        "records": len(bill_table),
+        "shared": shared.stats() if shared is not None else None,
+        "coalescing": {
+            "bills": bill_flight.stats(),
+            "sponsors": sponsor_flight.stats(),
+        },
+        "revalidation": revalidation_stats,
+    }
+
+
+@router.get("/refresh/status", tags=["Health"])
+async def refresh_status(request: Request):
+    """
+    Refresh lag and error state of each bill on the background watch list
+    """
+    scheduler = getattr(request.app.state, "scheduler", None)
+    if scheduler is None:
+        return {"enabled": False, "bills": []}
+    return {"enabled": True, "bills": scheduler.status()}
+
+
+@router.get("/upstream/limits", tags=["Health"])
+async def upstream_limit_stats():
+    """
+    Current rate limit, adaptive concurrency limit and queue depth per upstream host
+    """
+    return upstream_limits()
+
+
+@router.get("/upstream/circuits", tags=["Health"])
+async def upstream_circuits():
+    """
+    Circuit breaker state and hedging delay per upstream host
+    """
+    return circuit_states()
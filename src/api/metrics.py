@@ -0,0 +1,177 @@
+import time
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.config.settings import settings
+from src.scraper.cache import bill_cache, sponsor_cache, validator_cache
+from src.scraper.limits import upstream_limits
+from src.scraper.metrics import (
+    Collected,
+    http_in_flight,
+    http_request_seconds,
+    register,
+    render_metrics,
+)
+from src.scraper.parser import revalidation_stats
+from src.scraper.resilience import circuit_states
+from src.scraper.singleflight import bill_flight, sponsor_flight
+
+router = APIRouter()
+
+CACHES = {"bill": bill_cache, "sponsor": sponsor_cache, "validator": validator_cache}
+FLIGHTS = {"bill": bill_flight, "sponsor": sponsor_flight}
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording API latency by route template and the number of
+    requests in flight. Passes requests straight through when metrics are off.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_in_flight.dec()
+            # The route template, not the raw path, keeps label values bounded
+            route = getattr(scope.get("route"), "path", "unmatched")
+            http_request_seconds.observe(
+                time.perf_counter() - started, scope["method"], route, str(status)
+            )
+
+
+def _cache_lookups():
+    for name, cache in CACHES.items():
+        stats = cache.stats()
+        yield (name, "hit"), stats["hits"]
+        yield (name, "miss"), stats["misses"]
+        yield (name, "stale_hit"), stats["stale_hits"]
+
+
+def _upstream_gauge(field: str):
+    def collect():
+        for host, stats in upstream_limits().items():
+            yield (host,), stats[field]
+
+    return collect
+
+
+register(
+    Collected(
+        "cache_lookups",
+        "In-process cache lookups by result",
+        "counter",
+        ("cache", "result"),
+        _cache_lookups,
+    )
+)
+register(
+    Collected(
+        "cache_hit_ratio",
+        "Share of in-process cache lookups that were hits",
+        "gauge",
+        ("cache",),
+        lambda: (
+            ((name,), cache.stats()["hit_ratio"]) for name, cache in CACHES.items()
+        ),
+    )
+)
+register(
+    Collected(
+        "cache_entries",
+        "Entries held by each in-process cache",
+        "gauge",
+        ("cache",),
+        lambda: (((name,), len(cache)) for name, cache in CACHES.items()),
+    )
+)
+register(
+    Collected(
+        "upstream_requests_in_flight",
+        "Upstream requests holding a concurrency slot",
+        "gauge",
+        ("host",),
+        _upstream_gauge("in_flight"),
+    )
+)
+register(
+    Collected(
+        "upstream_requests_queued",
+        "Upstream requests waiting for a rate or concurrency slot",
+        "gauge",
+        ("host",),
+        _upstream_gauge("queued"),
+    )
+)
+register(
+    Collected(
+        "upstream_concurrency_limit",
+        "Current adaptive concurrency limit per upstream host",
+        "gauge",
+        ("host",),
+        _upstream_gauge("concurrency_limit"),
+    )
+)
+register(
+    Collected(
+        "upstream_circuit_open",
+        "1 while the host's circuit breaker is open or half open",
+        "gauge",
+        ("host",),
+        lambda: (
+            ((host,), float(state["state"] != "closed"))
+            for host, state in circuit_states().items()
+        ),
+    )
+)
+register(
+    Collected(
+        "singleflight_coalesced",
+        "Upstream fetches that joined an identical one in flight",
+        "counter",
+        ("flight",),
+        lambda: (((name,), flight.coalesced) for name, flight in FLIGHTS.items()),
+    )
+)
+register(
+    Collected(
+        "conditional_requests",
+        "Conditional upstream requests and how many were answered 304",
+        "counter",
+        ("result",),
+        lambda: (
+            (("sent",), revalidation_stats["conditional_requests"]),
+            (("not_modified",), revalidation_stats["not_modified"]),
+        ),
+    )
+)
+
+
+@router.get("/metrics", response_class=PlainTextResponse, tags=["Health"])
+async def metrics() -> PlainTextResponse:
+    """
+    Prometheus metrics: per-stage and per-route latency histograms, upstream
+    status codes and bytes, cache hit ratios and in-flight gauges
+    """
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return PlainTextResponse(
+        render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -4,9 +4,125 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+
+    # Production server (python -m src.server); 0 workers means one per CPU core
+    WORKERS: int = 0
+    # Only the worker holding this file lock refreshes the bill store; defaults
+    # to BILL_STORE_PATH + ".lock"
+    BACKGROUND_LOCK_PATH: str = ""
+    # Seconds to let in-flight requests and background refreshes finish on shutdown
+    SHUTDOWN_DRAIN_TIMEOUT: float = 20.0
+    # Bill URLs or "44-1/c-422" identifiers loaded before accepting traffic
+    BILL_PREWARM: list[str] = []
+    PREWARM_TIMEOUT: float = 30.0
+
     USER_AGENT: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-    REQUEST_TIMEOUT: int = 30
+    # Upstream timeouts per phase, in seconds
+    CONNECT_TIMEOUT: float = 5.0
+    READ_TIMEOUT: float = 10.0
+    WRITE_TIMEOUT: float = 5.0
+    POOL_TIMEOUT: float = 5.0
+    # End-to-end budget for one bill lookup; the sponsor lookup is skipped when
+    # less than SPONSOR_MIN_BUDGET of it is left
+    REQUEST_DEADLINE: float = 15.0
+    SPONSOR_MIN_BUDGET: float = 1.0
     ALLOWED_ORIGINS: list[str] = ["*"]
 
+    # Shared upstream HTTP client
+    HTTP2_ENABLED: bool = True
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+
+    # XML parser for bill documents and MP profiles: "auto" uses lxml when it
+    # is installed, "lxml" or "etree" (the standard library) force one
+    XML_BACKEND: str = "auto"
+    # Serialize /api/bill responses with orjson when installed and keep the
+    # bytes of cached bills, instead of pydantic's per-request serialization
+    FAST_JSON: bool = False
+
+    # Per-host upstream rate limit (requests/second, 0 disables) for the whole
+    # server, split evenly across WORKERS, and per-process adaptive AIMD
+    # concurrency limit
+    UPSTREAM_RATE_LIMIT: float = 10.0
+    UPSTREAM_BURST: int = 20
+    UPSTREAM_CONCURRENCY_INITIAL: int = 10
+    UPSTREAM_CONCURRENCY_MIN: int = 1
+    UPSTREAM_CONCURRENCY_MAX: int = 50
+    UPSTREAM_BACKOFF_RATIO: float = 0.5
+
+    # Retries, hedged requests and per-host circuit breaker for upstream GETs
+    UPSTREAM_RETRIES: int = 2
+    UPSTREAM_RETRY_BACKOFF: float = 0.2
+    UPSTREAM_RETRY_BACKOFF_MAX: float = 2.0
+    UPSTREAM_HEDGE_ENABLED: bool = True
+    UPSTREAM_HEDGE_MIN_DELAY: float = 0.05
+    UPSTREAM_HEDGE_MIN_SAMPLES: int = 20
+    CIRCUIT_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_RESET_TIMEOUT: float = 30.0
+
+    # Parsed bill cache
+    BILL_CACHE_TTL: float = 900.0
+    BILL_CACHE_MAXSIZE: int = 2048
+    # Stale-while-revalidate: how long past the TTL an entry may still be served
+    # while it is refreshed in the background; 0 disables it
+    BILL_CACHE_STALE_GRACE: float = 600.0
+
+    # Sponsor party cache, keyed by SponsorPersonId
+    SPONSOR_CACHE_TTL: float = 86400.0
+    SPONSOR_CACHE_MAXSIZE: int = 1024
+    SPONSOR_PREWARM_IDS: list[str] = []
+
+    # ETag/Last-Modified validators for conditional upstream requests
+    VALIDATOR_CACHE_TTL: float = 604800.0
+    VALIDATOR_CACHE_MAXSIZE: int = 4096
+
+    # Batch endpoint
+    BATCH_CONCURRENCY: int = 10
+    BATCH_MAX_ITEMS: int = 500
+
+    # Streaming NDJSON endpoint
+    STREAM_MAX_ITEMS: int = 5000
+    STREAM_BUFFER_SIZE: int = 32
+
+    # Page size of GET /api/bills searches
+    BILLS_PAGE_SIZE: int = 50
+    BILLS_PAGE_MAX: int = 500
+
+    # Session-wide bulk ingestion
+    SESSION_FEED_URL: str = "https://www.parl.ca/legisinfo/en/bills/xml"
+
+    # Persistent SQLite bill store, shared by all workers; empty path disables it
+    BILL_STORE_PATH: str = ""
+    BILL_STORE_MAX_AGE: float = 3600.0
+    BILL_STORE_REFRESH_INTERVAL: float = 300.0
+    BILL_STORE_REFRESH_BATCH: int = 50
+
+    # Shared L2 cache across workers and hosts: "memory://" or
+    # "redis://[:password@]host[:port][/db]"; empty disables it
+    SHARED_CACHE_URL: str = ""
+    SHARED_CACHE_PREFIX: str = "billscraper:"
+    SHARED_CACHE_TIMEOUT: float = 0.25
+
+    # Background refresh of a watch list of bill URLs or "44-1/c-422" identifiers
+    WATCH_LIST: list[str] = []
+    WATCH_REFRESH_INTERVAL: float = 300.0
+    WATCH_HOT_INTERVAL: float = 60.0
+    WATCH_HOT_WINDOW: float = 86400.0
+    WATCH_REFRESH_JITTER: float = 0.1
+    WATCH_MAX_BACKOFF: float = 3600.0
+    WATCH_CONCURRENCY: int = 5
+
+    # Prometheus metrics at /metrics; when off, instrumentation is skipped
+    METRICS_ENABLED: bool = False
+
+    # Per-request span timings; traces slower than TRACE_SLOW_THRESHOLD seconds
+    # are logged and kept for /api/admin/traces
+    TRACING_ENABLED: bool = False
+    TRACE_SLOW_THRESHOLD: float = 2.0
+
+    # Token for the /api/admin endpoints (X-Admin-Token header); empty disables them
+    ADMIN_TOKEN: str = ""
+
 
 settings = Settings()
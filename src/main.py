@@ -1,10 +1,25 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
+import httpx
 import uvicorn
 import logging
 from src.config.settings import settings
+from src.api.admin import router as admin_router
 from src.api.endpoints import router
+from src.api.metrics import MetricsMiddleware, router as metrics_router
+from src.scraper.client import start_http_client, close_http_client
+from src.scraper.parser import (
+    drain_revalidations,
+    prewarm_bill_cache,
+    prewarm_sponsor_cache,
+    refresh_stale_bills,
+)
+from src.scraper.scheduler import RefreshScheduler
+from src.scraper.shared_cache import close_shared_cache, open_shared_cache
+from src.scraper.store import close_bill_store, open_bill_store, run_store_refresher
+from src.server import acquire_background_lock, release_background_lock
 
 # Configure logging
 logging.basicConfig(
@@ -13,6 +28,14 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def prewarm(client: httpx.AsyncClient) -> None:
+    """Fill the sponsor and bill caches from SPONSOR_PREWARM_IDS and BILL_PREWARM"""
+    if settings.SPONSOR_PREWARM_IDS:
+        await prewarm_sponsor_cache(settings.SPONSOR_PREWARM_IDS, client)
+    if settings.BILL_PREWARM:
+        await prewarm_bill_cache(settings.BILL_PREWARM, client)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -20,9 +43,42 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     logger.info("Starting up Parliament Bill Scraper API")
+    app.state.http_client = await start_http_client()
+    open_shared_cache()
+    background = []
+    # Every worker reads the store, one refreshes it. Pre-warming and the
+    # watch list fill this worker's own cache, so every worker runs them
+    if open_bill_store() is not None and acquire_background_lock():
+        background.append(
+            asyncio.create_task(
+                run_store_refresher(
+                    lambda: refresh_stale_bills(app.state.http_client),
+                    settings.BILL_STORE_REFRESH_INTERVAL,
+                )
+            )
+        )
+    app.state.scheduler = None
+    if settings.WATCH_LIST:
+        app.state.scheduler = RefreshScheduler(
+            settings.WATCH_LIST, app.state.http_client
+        )
+        background.append(asyncio.create_task(app.state.scheduler.run()))
+    # The server accepts connections only once startup has finished
+    try:
+        await asyncio.wait_for(prewarm(app.state.http_client), settings.PREWARM_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("Cache pre-warming timed out, starting with a partial cache")
     yield
-    # Shutdown
+    # Shutdown, after the server has drained in-flight requests
     logger.info("Shutting down Parliament Bill Scraper API")
+    await drain_revalidations(settings.SHUTDOWN_DRAIN_TIMEOUT)
+    for task in background:
+        task.cancel()
+    await asyncio.gather(*background, return_exceptions=True)
+    await close_http_client()
+    close_bill_store()
+    await close_shared_cache()
+    release_background_lock()
 
 
 # Initialize FastAPI app with lifespan
@@ -44,8 +100,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(MetricsMiddleware)
+
 # Include API routes
 app.include_router(router, prefix="/api")
+app.include_router(admin_router, prefix="/api")
+app.include_router(metrics_router)
 
 
 # Root endpoint
@@ -59,6 +119,7 @@ async def root():
 
 
 if __name__ == "__main__":
+    # Single-process development server; use `python -m src.server` in production
     uvicorn.run(
         "src.main:app",
         host=settings.HOST,
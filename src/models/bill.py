@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field
+from typing import Optional
 
 
 class BillInfo(BaseModel):
@@ -11,3 +12,34 @@ class BillInfo(BaseModel):
 
     class Config:
         frozen = True
+
+
+class BillListItem(BillInfo):
+    id: str = Field(
+        description="'<session>/<bill number>' identifier, e.g. '44-1/c-422'"
+    )
+
+
+class BillPage(BaseModel):
+    total: int = Field(description="Number of bills matching the filters")
+    offset: int
+    limit: int
+    bills: list[BillListItem] = Field(description="Most recently updated first")
+
+
+class BatchRequest(BaseModel):
+    bills: list[str] = Field(
+        description="LegisInfo bill URLs or '<session>/<bill number>' identifiers",
+        min_length=1,
+    )
+
+
+class BatchItem(BaseModel):
+    bill: str = Field(description="Identifier as given in the request")
+    status_code: int = Field(default=200)
+    result: Optional[BillInfo] = Field(default=None)
+    error: Optional[str] = Field(default=None)
+
+
+class BatchResponse(BaseModel):
+    results: list[BatchItem]
@@ -0,0 +1,95 @@
+import asyncio
+import httpx
+import logging
+from fastapi import HTTPException
+from typing import AsyncIterator, Optional
+from src.config.settings import settings
+from src.models.bill import BatchItem
+from src.scraper.deadline import request_deadline
+from src.scraper.parser import scrape_bill_info
+from src.scraper.utils import resolve_bill_url
+
+logger = logging.getLogger(__name__)
+
+
+async def scrape_batch_item(
+    identifier: str,
+    semaphore: asyncio.Semaphore,
+    client: Optional[httpx.AsyncClient] = None,
+) -> BatchItem:
+    """
+    Scrape one bill of a batch, turning failures into a per-item error
+    """
+    url = resolve_bill_url(identifier)
+    if url is None:
+        return BatchItem(
+            bill=identifier, status_code=400, error="Unrecognized bill identifier"
+        )
+
+    try:
+        async with semaphore:
+            with request_deadline(settings.REQUEST_DEADLINE):
+                bill_info = await scrape_bill_info(url, client)
+        return BatchItem(bill=identifier, result=bill_info)
+    except HTTPException as e:
+        return BatchItem(bill=identifier, status_code=e.status_code, error=e.detail)
+    except Exception as e:
+        logger.error(f"Batch item {identifier} failed: {str(e)}")
+        return BatchItem(bill=identifier, status_code=500, error=str(e))
+
+
+async def scrape_bills(
+    identifiers: list[str],
+    client: Optional[httpx.AsyncClient] = None,
+    concurrency: Optional[int] = None,
+) -> list[BatchItem]:
+    """
+    Scrape many bills concurrently, at most `concurrency` at a time.
+    Results keep the order of `identifiers`. Duplicate bills and shared
+    sponsors are fetched once through the caches and in-flight coalescing.
+    """
+    semaphore = asyncio.Semaphore(concurrency or settings.BATCH_CONCURRENCY)
+    return await asyncio.gather(
+        *(
+            scrape_batch_item(identifier, semaphore, client)
+            for identifier in identifiers
+        )
+    )
+
+
+async def iter_batch_items(
+    identifiers: list[str],
+    client: Optional[httpx.AsyncClient] = None,
+    concurrency: Optional[int] = None,
+    buffer_size: Optional[int] = None,
+) -> AsyncIterator[BatchItem]:
+    """
+    Scrape many bills concurrently and yield each result as soon as it
+    completes, in completion order. A fixed pool of workers feeds a bounded
+    queue, so a slow consumer pauses the workers instead of letting finished
+    results pile up in memory.
+    """
+    concurrency = concurrency or settings.BATCH_CONCURRENCY
+    queue: asyncio.Queue = asyncio.Queue(
+        maxsize=buffer_size or settings.STREAM_BUFFER_SIZE
+    )
+    pending = iter(identifiers)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def worker() -> None:
+        for identifier in pending:
+            await queue.put(await scrape_batch_item(identifier, semaphore, client))
+
+    workers = [
+        asyncio.ensure_future(worker())
+        for _ in range(min(concurrency, len(identifiers)))
+    ]
+
+    try:
+        for _ in range(len(identifiers)):
+            yield await queue.get()
+    finally:
+        # Stop scraping if the consumer goes away early
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
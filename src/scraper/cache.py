@@ -0,0 +1,134 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Generic, Hashable, Optional, TypeVar
+from src.config.settings import settings
+
+V = TypeVar("V")
+
+
+@dataclass
+class CacheEntry(Generic[V]):
+    value: V
+    expires_at: float
+    stored_at: float
+
+
+class TTLCache(Generic[V]):
+    """
+    Bounded LRU cache with a per-entry time to live and hit/miss/eviction counters.
+
+    Expired entries are kept for a further `grace` seconds so they can still be
+    served stale through get_stale while a fresh value is fetched.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, grace: float = 0.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.grace = grace
+        self._entries: "OrderedDict[Hashable, CacheEntry[V]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.stale_hits = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry.expires_at > time.monotonic()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value, or None if it is missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        now = time.monotonic()
+        if entry.expires_at <= now:
+            if entry.expires_at + self.grace <= now:
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def get_stale(self, key: Hashable) -> Optional[tuple[V, float]]:
+        """
+        Return an expired value still within the grace period, with its age in
+        seconds. Returns None for fresh, missing or too old entries.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        now = time.monotonic()
+        if entry.expires_at > now or entry.expires_at + self.grace <= now:
+            return None
+
+        self._entries.move_to_end(key)
+        self.stale_hits += 1
+        return entry.value, now - entry.stored_at
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entries when full"""
+        if self.maxsize <= 0:
+            return
+
+        now = time.monotonic()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        self._entries[key] = CacheEntry(value, expires_at, now)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters"""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+        self.stale_hits = 0
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "grace": self.grace,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "stale_hits": self.stale_hits,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Parsed bills keyed by "<session>/<bill number>", e.g. "44-1/c-422"
+bill_cache: TTLCache = TTLCache(
+    maxsize=settings.BILL_CACHE_MAXSIZE,
+    ttl=settings.BILL_CACHE_TTL,
+    grace=settings.BILL_CACHE_STALE_GRACE,
+)
+
+# Sponsor parties keyed by SponsorPersonId
+sponsor_cache: TTLCache = TTLCache(
+    maxsize=settings.SPONSOR_CACHE_MAXSIZE, ttl=settings.SPONSOR_CACHE_TTL
+)
+
+# Upstream responses with their ETag/Last-Modified validators, keyed by URL.
+# Kept well past the bill and sponsor TTLs so expired entries can be revalidated.
+validator_cache: TTLCache = TTLCache(
+    maxsize=settings.VALIDATOR_CACHE_MAXSIZE, ttl=settings.VALIDATOR_CACHE_TTL
+)
@@ -0,0 +1,71 @@
+import httpx
+import logging
+from typing import Optional
+from src.config.settings import settings
+from src.scraper.deadline import default_timeout
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def http2_available() -> bool:
+    """Check whether the optional h2 package needed for HTTP/2 is installed"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Build the pooled client used for all upstream requests to parl.ca and ourcommons.ca
+    """
+    limits = httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+    )
+
+    http2 = settings.HTTP2_ENABLED
+    if http2 and not http2_available():
+        logger.warning("HTTP/2 requested but the h2 package is not installed")
+        http2 = False
+
+    return httpx.AsyncClient(
+        headers={"User-Agent": settings.USER_AGENT},
+        timeout=default_timeout(),
+        limits=limits,
+        http2=http2,
+        follow_redirects=True,
+    )
+
+
+async def start_http_client() -> httpx.AsyncClient:
+    """Create the shared client, called from the app lifespan on startup"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+        logger.info("Shared HTTP client started")
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client, called from the app lifespan on shutdown"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("Shared HTTP client closed")
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared client, creating it lazily when used outside the app lifespan
+    (scripts, tests)
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+    return _client
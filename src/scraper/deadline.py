@@ -0,0 +1,83 @@
+import httpx
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+from src.config.settings import settings
+
+# Shortest timeout handed to httpx; a timeout this close to the deadline
+# means the budget, not the upstream, ran out
+MIN_TIMEOUT = 0.001
+
+# Absolute time.monotonic() by which the current request must be answered.
+# Tasks started from the request inherit it.
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """Raised when the request's time budget runs out before an upstream call"""
+
+
+@contextmanager
+def request_deadline(seconds: float) -> Iterator[None]:
+    """Give everything run inside the block at most `seconds` in total"""
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def clear_deadline() -> None:
+    """Drop the inherited deadline, for background work outliving the request"""
+    _deadline.set(None)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left in the current budget, or None when there is no deadline"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def check_deadline() -> None:
+    """Raise DeadlineExceeded if the budget is used up"""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded("Request deadline exceeded")
+
+
+def budget_exhausted() -> bool:
+    """Whether the budget is used up, telling a timeout cut short by the deadline from a slow upstream"""
+    left = remaining()
+    return left is not None and left <= MIN_TIMEOUT
+
+
+def default_timeout() -> httpx.Timeout:
+    """Per-phase upstream timeouts from Settings"""
+    return httpx.Timeout(
+        connect=settings.CONNECT_TIMEOUT,
+        read=settings.READ_TIMEOUT,
+        write=settings.WRITE_TIMEOUT,
+        pool=settings.POOL_TIMEOUT,
+    )
+
+
+def request_timeout() -> httpx.Timeout:
+    """Per-phase timeouts capped by what is left of the request budget"""
+    left = remaining()
+    if left is None:
+        return default_timeout()
+
+    left = max(left, MIN_TIMEOUT)
+    return httpx.Timeout(
+        connect=min(settings.CONNECT_TIMEOUT, left),
+        read=min(settings.READ_TIMEOUT, left),
+        write=min(settings.WRITE_TIMEOUT, left),
+        pool=min(settings.POOL_TIMEOUT, left),
+    )
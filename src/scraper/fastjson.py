@@ -0,0 +1,75 @@
+import json
+from typing import Any, Hashable, Optional
+from src.config.settings import settings
+from src.models.bill import BillInfo
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+BILL_FIELDS = tuple(BillInfo.model_fields)
+
+
+def orjson_available() -> bool:
+    return orjson is not None
+
+
+def dump_bill(bill: BillInfo, fields: Optional[set[str]] = None) -> bytes:
+    """
+    Compact JSON of a bill, or of the selected fields in declaration order.
+    The bill was validated when built, so its values are dumped as they are;
+    the output matches model_dump_json byte for byte.
+    """
+    values = bill.__dict__
+    if fields is not None:
+        values = {name: values[name] for name in BILL_FIELDS if name in fields}
+    if orjson is None:
+        return bill.model_dump_json(include=fields).encode()
+    return orjson.dumps(values)
+
+
+def dump_json(value: Any) -> bytes:
+    """Compact JSON of plain data, in the same format as dump_bill"""
+    if orjson is None:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+    return orjson.dumps(value)
+
+
+class BillJsonCache:
+    """
+    Serialized bytes of the bills held by the bill cache. An entry is only
+    reused for the very BillInfo object it was made from, so a bill replaced
+    in the bill cache is serialized again on its next hit.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: dict[Hashable, tuple[BillInfo, bytes]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, bill: BillInfo) -> bytes:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is bill:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        data = dump_bill(bill)
+        self._entries.pop(key, None)
+        self._entries[key] = (bill, data)
+        while len(self._entries) > self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        return data
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+bill_json_cache = BillJsonCache(settings.BILL_CACHE_MAXSIZE)
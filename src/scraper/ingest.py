@@ -0,0 +1,248 @@
+import argparse
+import asyncio
+import httpx
+import logging
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import asdict, dataclass
+from typing import AsyncIterable, AsyncIterator, Optional, Union
+from src.config.settings import settings
+from src.models.bill import BillInfo
+from src.scraper.cache import bill_cache, sponsor_cache
+from src.scraper.client import close_http_client, get_http_client
+from src.scraper.limits import get_host_limiter
+from src.scraper.parser import (
+    SponsorRef,
+    extract_bill_fields,
+    extract_sponsor,
+    resolve_sponsor,
+    safe_xml_text,
+    stored_sponsor_party,
+)
+from src.scraper.records import bill_table
+from src.scraper.store import close_bill_store, get_bill_store, open_bill_store
+from src.scraper.stream import iter_bill_elements, iter_file_chunks
+
+logger = logging.getLogger(__name__)
+
+STORE_WRITE_BATCH = 500
+
+
+@dataclass
+class IngestResult:
+    session: str
+    bills: int = 0
+    skipped: int = 0
+    sponsors_resolved: int = 0
+    # Left out because their party is unknown and was not looked up
+    unresolved: int = 0
+
+
+def is_valid_session(session: str) -> bool:
+    """Check a "<parliament>-<session>" code such as "44-1" """
+    return re.fullmatch(r"\d+-\d+", session) is not None
+
+
+def session_feed_url(session: str) -> str:
+    """Build the LegisInfo XML feed URL listing every bill of a session"""
+    return f"{settings.SESSION_FEED_URL}?parlsession={session}"
+
+
+def bill_session(bill: ET.Element, default: str) -> str:
+    """
+    Read the "<parliament>-<session>" code of a <Bill>, falling back to the
+    session that was requested
+    """
+    code = safe_xml_text(bill.find("ParlSessionCode"), default="")
+    if code:
+        return code
+
+    parliament = safe_xml_text(bill.find("ParliamentNumber"), default="")
+    number = safe_xml_text(bill.find("SessionNumber"), default="")
+    if parliament and number:
+        return f"{parliament}-{number}"
+
+    return default
+
+
+async def iter_feed_records(
+    chunks: AsyncIterable[bytes], session: str
+) -> AsyncIterator[tuple[str, dict[str, str], Union[str, SponsorRef]]]:
+    """
+    Stream a session feed and yield (cache key, fields, sponsor) for each bill.
+    Bills without a bill number get an empty key. Everything yielded is
+    detached from the XML tree.
+    """
+    async for bill in iter_bill_elements(chunks):
+        fields = extract_bill_fields(bill)
+        if fields["bill_number"] == "Unknown":
+            yield "", fields, "Unknown"
+            continue
+
+        key = f"{bill_session(bill, session)}/{fields['bill_number']}"
+        yield key, fields, extract_sponsor(bill)
+
+
+async def known_sponsor_party(key: str, sponsor: SponsorRef) -> Optional[str]:
+    """
+    A sponsor's party without fetching the MP profile: from the sponsor cache,
+    the bill's existing record or the store, in that order
+    """
+    cached = sponsor_cache.get(sponsor.person_id)
+    if cached is not None:
+        return cached
+    existing = bill_table.get(key)
+    if existing is not None and existing.sponsor_party != "Unknown":
+        return existing.sponsor_party
+    return await stored_sponsor_party(sponsor.person_id)
+
+
+async def ingest_bill_stream(
+    chunks: AsyncIterable[bytes],
+    session: str,
+    client: Optional[httpx.AsyncClient] = None,
+    resolve_sponsors: bool = True,
+) -> IngestResult:
+    """
+    Build BillInfo records from a streamed session feed and load them into the
+    bill cache, the bill table and the persistent store, if enabled. Sponsor
+    parties go through the sponsor cache, so each MP profile is fetched at most
+    once per ingest, and at most BATCH_CONCURRENCY lookups are pending at a
+    time so memory stays bounded on large feeds. Without sponsor lookups, bills
+    whose party is not already known are left out rather than stored as
+    "Unknown".
+    """
+    result = IngestResult(session=session)
+    pending: set[asyncio.Task] = set()
+    bill_store = get_bill_store()
+    unsaved: list[tuple[str, BillInfo]] = []
+
+    def store(key: str, fields: dict[str, str], sponsor_party: str) -> None:
+        bill_info = BillInfo(sponsor_party=sponsor_party, **fields)
+        bill_cache.set(key, bill_info)
+        bill_table.put(key, bill_info)
+        if bill_store is not None:
+            unsaved.append((key, bill_info))
+        result.bills += 1
+
+    async def save() -> None:
+        if unsaved:
+            rows = unsaved.copy()
+            unsaved.clear()
+            await asyncio.to_thread(bill_store.put_bills, rows)
+
+    async def store_with_sponsor(
+        key: str, fields: dict[str, str], sponsor: SponsorRef
+    ) -> None:
+        sponsor_party = await resolve_sponsor(sponsor, client)
+        if sponsor_party != "Unknown":
+            result.sponsors_resolved += 1
+        store(key, fields, sponsor_party)
+
+    try:
+        async for key, fields, sponsor in iter_feed_records(chunks, session):
+            if not key:
+                result.skipped += 1
+            elif isinstance(sponsor, str):
+                store(key, fields, sponsor)
+            elif not resolve_sponsors:
+                sponsor_party = await known_sponsor_party(key, sponsor)
+                if sponsor_party is None:
+                    result.unresolved += 1
+                else:
+                    store(key, fields, sponsor_party)
+            else:
+                if len(pending) >= settings.BATCH_CONCURRENCY:
+                    _, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                pending.add(
+                    asyncio.ensure_future(store_with_sponsor(key, fields, sponsor))
+                )
+
+            if len(unsaved) >= STORE_WRITE_BATCH:
+                await save()
+
+        if pending:
+            await asyncio.gather(*pending)
+        await save()
+    finally:
+        for task in pending:
+            task.cancel()
+
+    return result
+
+
+async def ingest_session(
+    session: str,
+    client: Optional[httpx.AsyncClient] = None,
+    resolve_sponsors: bool = True,
+    source: Optional[str] = None,
+) -> IngestResult:
+    """
+    Stream the session feed once and ingest every bill in it.
+
+    Args:
+        session: Session code, e.g. "44-1"
+        client: Upstream client, defaults to the shared one
+        resolve_sponsors: Also look up each sponsor's party
+        source: Read the feed from this local file instead of parl.ca
+    """
+    if source is not None:
+        result = await ingest_bill_stream(
+            iter_file_chunks(source), session, client, resolve_sponsors
+        )
+    else:
+        client = client or get_http_client()
+        url = session_feed_url(session)
+        # Hold a parl.ca slot only until the headers arrive: streaming the feed
+        # and looking up its sponsors can take minutes
+        async with get_host_limiter(url).slot() as slot:
+            response = await client.send(client.build_request("GET", url), stream=True)
+            slot.record(response.status_code)
+        try:
+            response.raise_for_status()
+            result = await ingest_bill_stream(
+                response.aiter_bytes(), session, client, resolve_sponsors
+            )
+        finally:
+            await response.aclose()
+
+    logger.info(f"Ingested session {session}: {asdict(result)}")
+    return result
+
+
+async def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Ingest every bill of a parliamentary session from LegisInfo"
+    )
+    parser.add_argument("session", help='Session code, e.g. "44-1"')
+    parser.add_argument("--file", help="Read the session feed from a local XML file")
+    parser.add_argument(
+        "--no-sponsors",
+        action="store_true",
+        help="Skip the sponsor party lookups",
+    )
+    args = parser.parse_args(argv)
+
+    if not is_valid_session(args.session):
+        parser.error(f"Invalid session code: {args.session}")
+
+    # Without the store at BILL_STORE_PATH the bills would die with the process
+    open_bill_store()
+    try:
+        result = await ingest_session(
+            args.session, resolve_sponsors=not args.no_sponsors, source=args.file
+        )
+        print(asdict(result))
+    finally:
+        await close_http_client()
+        close_bill_store()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    asyncio.run(main())
@@ -0,0 +1,208 @@
+import asyncio
+import httpx
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+from src.config.settings import settings
+from src.scraper.deadline import DeadlineExceeded, budget_exhausted, remaining
+
+logger = logging.getLogger(__name__)
+
+# Upstream responses that mean "slow down"
+THROTTLE_STATUS_CODES = {429, 503}
+
+
+class TokenBucket:
+    """
+    Token bucket allowing `rate` requests per second with bursts of up to `burst`.
+    A rate of 0 disables the limit.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.waiting = 0
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+
+        self.waiting += 1
+        try:
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                delay = (1 - self.tokens) / self.rate
+                left = remaining()
+                if left is not None and delay >= left:
+                    raise DeadlineExceeded(
+                        "Request deadline exceeded waiting for a token"
+                    )
+                await asyncio.sleep(delay)
+        finally:
+            self.waiting -= 1
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency limit that adapts AIMD-style: each successful request raises the
+    limit by 1/limit (about +1 per round of requests), each throttled or timed
+    out request multiplies it by `backoff_ratio`
+    """
+
+    def __init__(self, initial: int, minimum: int, maximum: int, backoff_ratio: float):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff_ratio = backoff_ratio
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        while self.in_flight >= int(self.limit):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                left = remaining()
+                if left is None:
+                    await waiter
+                else:
+                    # wait() leaves the waiter alone on timeout, so a wake-up
+                    # racing the deadline is never lost
+                    await asyncio.wait({waiter}, timeout=max(left, 0))
+                    if not waiter.done():
+                        waiter.cancel()
+                        raise DeadlineExceeded(
+                            "Request deadline exceeded waiting for a concurrency slot"
+                        )
+            except asyncio.CancelledError:
+                # Pass on a wake-up this waiter can no longer use
+                if waiter.done() and not waiter.cancelled():
+                    self._wake()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+
+    def release(self, overloaded: bool = False, adjust: bool = True) -> None:
+        """Free a slot; with adjust=False the outcome leaves the limit as it is"""
+        self.in_flight -= 1
+        if adjust and overloaded:
+            self.limit = max(self.minimum, self.limit * self.backoff_ratio)
+            logger.debug(f"Upstream overloaded, concurrency limit now {self.limit:.1f}")
+        elif adjust:
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+        self._wake()
+
+    def _wake(self) -> None:
+        free = int(self.limit) - self.in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+
+class RequestSlot:
+    """Outcome of one upstream request, reported back to the host limiter"""
+
+    overloaded = False
+    # Ended by the request deadline: says nothing about the upstream's load
+    cut_short = False
+
+    def record(self, status_code: int) -> None:
+        if status_code in THROTTLE_STATUS_CODES:
+            self.overloaded = True
+
+
+class HostLimiter:
+    """Rate limit plus adaptive concurrency limit for one upstream host"""
+
+    def __init__(self, host: str):
+        self.host = host
+        # Each worker process gets its share of the server-wide rate
+        workers = max(settings.WORKERS, 1)
+        self.bucket = TokenBucket(
+            settings.UPSTREAM_RATE_LIMIT / workers,
+            max(settings.UPSTREAM_BURST // workers, 1),
+        )
+        self.concurrency = AdaptiveLimiter(
+            settings.UPSTREAM_CONCURRENCY_INITIAL,
+            settings.UPSTREAM_CONCURRENCY_MIN,
+            settings.UPSTREAM_CONCURRENCY_MAX,
+            settings.UPSTREAM_BACKOFF_RATIO,
+        )
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[RequestSlot]:
+        """
+        Wait for a token and a concurrency slot, for no longer than the request
+        deadline allows. Record the response status on the yielded slot;
+        timeouts are counted as overload automatically, unless the deadline
+        cut them short.
+
+        Raises:
+            DeadlineExceeded: If the deadline passes while waiting
+        """
+        await self.bucket.acquire()
+        await self.concurrency.acquire()
+        slot = RequestSlot()
+        try:
+            yield slot
+        except httpx.TimeoutException:
+            if budget_exhausted():
+                slot.cut_short = True
+            else:
+                slot.overloaded = True
+            raise
+        except DeadlineExceeded:
+            slot.cut_short = True
+            raise
+        finally:
+            self.concurrency.release(slot.overloaded, adjust=not slot.cut_short)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "rate_limit": self.bucket.rate,
+            "tokens": self.bucket.tokens,
+            "concurrency_limit": int(self.concurrency.limit),
+            "in_flight": self.concurrency.in_flight,
+            "queued": self.bucket.waiting + self.concurrency.waiting,
+        }
+
+
+_limiters: dict[str, HostLimiter] = {}
+
+
+def get_host_limiter(url: str) -> HostLimiter:
+    """Return the shared limiter for the host of `url`"""
+    host = httpx.URL(url).host
+    limiter = _limiters.get(host)
+    if limiter is None:
+        limiter = _limiters[host] = HostLimiter(host)
+    return limiter
+
+
+def upstream_limits() -> dict[str, dict[str, Any]]:
+    """Current limits and queue depth per upstream host"""
+    return {host: limiter.stats() for host, limiter in _limiters.items()}
+
+
+def reset_host_limiters() -> None:
+    _limiters.clear()
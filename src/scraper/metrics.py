@@ -0,0 +1,224 @@
+import bisect
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
+from typing import Callable, ContextManager, Iterable, Iterator, Optional
+from src.config.settings import settings
+
+# Latency buckets in seconds, from a cache hit to a slow upstream
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_NOOP = nullcontext()
+
+
+def metrics_enabled() -> bool:
+    return settings.METRICS_ENABLED
+
+
+def _label_text(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Metric(ABC):
+    """Base of the metric types, rendered in the Prometheus text format"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+
+    @abstractmethod
+    def samples(self) -> Iterator[tuple[str, tuple[str, ...], tuple[str, ...], float]]:
+        """(name suffix, label names, label values, value) for each sample"""
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, names, values, value in self.samples():
+            lines.append(f"{self.name}{suffix}{_label_text(names, values)} {value}")
+        return lines
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()):
+        super().__init__(name, help, labels)
+        self.values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        if settings.METRICS_ENABLED:
+            self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def samples(self):
+        for values, value in self.values.items():
+            yield "_total", self.labels, values, value
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()):
+        super().__init__(name, help, labels)
+        self.values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        if settings.METRICS_ENABLED:
+            self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def samples(self):
+        for values, value in self.values.items():
+            yield "", self.labels, values, value
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help, labels)
+        self.buckets = buckets
+        # Per label set: one count per bucket plus +Inf, then the sum
+        self.values: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        if not settings.METRICS_ENABLED:
+            return
+        counts = self.values.get(labels)
+        if counts is None:
+            counts = self.values[labels] = [0.0] * (len(self.buckets) + 2)
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    @contextmanager
+    def _time(self, labels: tuple[str, ...]) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *labels)
+
+    def time(self, *labels: str) -> ContextManager[None]:
+        """Observe how long the block takes; a shared no-op when disabled"""
+        if not settings.METRICS_ENABLED:
+            return _NOOP
+        return self._time(labels)
+
+    def samples(self):
+        names = self.labels + ("le",)
+        for values, counts in self.values.items():
+            cumulative = 0.0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                yield "_bucket", names, values + (le,), cumulative
+            yield "_sum", self.labels, values, counts[-1]
+            yield "_count", self.labels, values, cumulative
+
+
+class Collected(Metric):
+    """Metric read from existing stats when /metrics is scraped, at no cost in between"""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        kind: str,
+        labels: tuple[str, ...],
+        collect: Callable[[], Iterable[tuple[tuple[str, ...], float]]],
+    ):
+        super().__init__(name, help, labels)
+        self.kind = kind
+        self.collect = collect
+
+    def samples(self):
+        suffix = "_total" if self.kind == "counter" else ""
+        for values, value in self.collect():
+            yield suffix, self.labels, values, value
+
+
+_registry: list[Metric] = []
+
+
+def register(metric: Metric) -> Metric:
+    _registry.append(metric)
+    return metric
+
+
+def render_metrics() -> str:
+    """All registered metrics in the Prometheus text exposition format"""
+    lines: list[str] = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def reset_metrics() -> None:
+    for metric in _registry:
+        values: Optional[dict] = getattr(metric, "values", None)
+        if values is not None:
+            values.clear()
+
+
+stage_seconds = register(
+    Histogram(
+        "scraper_stage_duration_seconds",
+        "Time spent per stage of a bill lookup",
+        ("stage",),
+    )
+)
+http_request_seconds = register(
+    Histogram(
+        "http_request_duration_seconds",
+        "API request latency by route",
+        ("method", "route", "status"),
+    )
+)
+http_in_flight = register(
+    Gauge("http_requests_in_flight", "API requests being handled")
+)
+upstream_responses = register(
+    Counter(
+        "upstream_responses",
+        "Upstream responses by host and status code ('error' for transport errors)",
+        ("host", "status"),
+    )
+)
+upstream_bytes = register(
+    Counter(
+        "upstream_response_bytes",
+        "Response body bytes downloaded from upstream hosts",
+        ("host",),
+    )
+)
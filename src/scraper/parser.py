@@ -1,13 +1,46 @@
+import asyncio
 import httpx
 import xml.etree.ElementTree as ET
 from fastapi import HTTPException
 import logging
-from typing import Optional
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, NamedTuple, Optional, TypeVar, Union
 from src.config.settings import settings
 from src.models.bill import BillInfo
+from src.scraper.cache import bill_cache, sponsor_cache, validator_cache
+from src.scraper.client import get_http_client
+from src.scraper.deadline import DeadlineExceeded, clear_deadline, remaining
+from src.scraper.tracing import clear_trace, span, stage
+from src.scraper.resilience import CircuitOpenError, resilient_get
+from src.scraper.singleflight import bill_flight, sponsor_flight
+from src.scraper.records import bill_table
+from src.scraper.shared_cache import get_shared_cache
+from src.scraper.store import get_bill_store
+from src.scraper.utils import (
+    BILL_URL_PREFIX,
+    extract_bill_key,
+    parse_bill_id,
+    resolve_bill_url,
+)
+from src.scraper.xmlparse import element_values, read_bill_values, read_sponsor_party
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Conditional requests sent, how many the upstream answered with 304, and the
+# response bytes those 304s avoided downloading
+revalidation_stats = {"conditional_requests": 0, "not_modified": 0, "bytes_saved": 0}
+
+
+@dataclass
+class ValidatedResponse:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    parsed: Any
+    size: int
+
 
 def safe_xml_text(element: Optional[ET.Element], default: str = "Unknown") -> str:
     """Safely extract text from XML element"""
@@ -16,6 +49,120 @@ def safe_xml_text(element: Optional[ET.Element], default: str = "Unknown") -> st
     return default
 
 
+def value_text(
+    values: dict[str, Optional[str]], tag: str, default: str = "Unknown"
+) -> str:
+    """safe_xml_text for a value read by element_values or read_bill_values"""
+    text = values.get(tag)
+    return text.strip() if text else default
+
+
+def bill_fields(values: dict[str, Optional[str]]) -> dict[str, str]:
+    """
+    Build every BillInfo field except sponsor_party from a <Bill>'s values.
+    bill_number is "Unknown" when the element has no NumberCode.
+    """
+    bill_number_text = value_text(values, "NumberCode")
+    if bill_number_text != "Unknown":
+        bill_number_text = bill_number_text.lower()
+
+    status_text = value_text(values, "StatusName")
+
+    # Handle dropped bills
+    is_dropped = values.get("IsDroppedFromSenateOrderPaper")
+    if is_dropped is not None and is_dropped.lower() == "true":
+        status_text = "Dropped from Senate Order Paper"
+
+    return {
+        "bill_number": bill_number_text,
+        "bill_type": value_text(values, "BillDocumentTypeName"),
+        "status": status_text,
+        "sponsor_name": value_text(values, "SponsorPersonName"),
+        "last_updated": value_text(values, "LatestBillEventDateTime"),
+    }
+
+
+def extract_bill_fields(bill: ET.Element) -> dict[str, str]:
+    """
+    Extract every BillInfo field except sponsor_party from a <Bill> element.
+    bill_number is "Unknown" when the element has no NumberCode.
+    """
+    return bill_fields(element_values(bill))
+
+
+def parse_bill_document(
+    xml: Union[str, bytes],
+) -> tuple[dict[str, str], Union[str, "SponsorRef"]]:
+    """
+    Parse a single-bill XML document into its BillInfo fields and the sponsor
+    to look up, with lxml when available
+    """
+    try:
+        values = read_bill_values(xml)
+    except ET.ParseError as e:
+        logger.error(f"Failed to parse XML: {e}")
+        raise HTTPException(status_code=500, detail="Invalid XML response")
+
+    if values is None:
+        raise HTTPException(status_code=404, detail="Bill information not found")
+
+    fields = bill_fields(values)
+
+    # Validate bill number
+    if fields["bill_number"] == "Unknown":
+        raise HTTPException(
+            status_code=400, detail="Could not extract bill number from XML"
+        )
+
+    return fields, sponsor_from_values(values)
+
+
+async def fetch_parsed(
+    client: httpx.AsyncClient,
+    url: str,
+    parse: Callable[[bytes], T],
+    document: str = "document",
+) -> T:
+    """
+    GET an upstream XML document through the resilience layer (rate limits,
+    retries, hedging, circuit breaker) and parse it. When an earlier response carried
+    an ETag or Last-Modified validator the request is made conditional, and a
+    304 Not Modified reuses the earlier parse result without re-parsing.
+    The fetch and parse times are recorded as the "<document>_fetch" and
+    "<document>_parse" stages.
+    """
+    entry = validator_cache.get(url)
+    headers = {}
+    if entry is not None:
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        revalidation_stats["conditional_requests"] += 1
+
+    with stage(f"{document}_fetch"):
+        response = await resilient_get(client, url, headers)
+    if response.status_code == 304 and entry is not None:
+        logger.debug(f"Not modified: {url}")
+        revalidation_stats["not_modified"] += 1
+        revalidation_stats["bytes_saved"] += entry.size
+        validator_cache.set(url, entry)
+        return entry.parsed
+
+    response.raise_for_status()
+    content = response.content
+    with stage(f"{document}_parse"):
+        parsed = parse(content)
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        validator_cache.set(
+            url, ValidatedResponse(etag, last_modified, parsed, len(content))
+        )
+    return parsed
+
+
 def build_sponsor_url(first_name: str, last_name: str, id_number: str) -> str:
     """Build sponsor XML URL from components"""
     base_url = "https://www.ourcommons.ca/members/en"
@@ -25,140 +172,476 @@ def build_sponsor_url(first_name: str, last_name: str, id_number: str) -> str:
     return f"{base_url}/{first_name}-{last_name}({id_number})/xml"
 
 
-async def get_sponsor_party(bill_element: Optional[ET.Element]) -> str:
+def build_sponsor_url_from_id(id_number: str) -> str:
+    """Build sponsor XML URL from the person ID alone (ourcommons.ca redirects)"""
+    return f"https://www.ourcommons.ca/members/en/{id_number}/xml"
+
+
+def parse_sponsor_party(xml: Union[str, bytes]) -> Optional[str]:
     """
-    Extract sponsor party information from the bill element
+    Extract the caucus short name from an MP XML profile
+    """
+    party = read_sponsor_party(xml)
+    if party is None:
+        logger.debug("No party information found in MP profile")
+    return party
+
+
+async def fetch_sponsor_party(
+    person_id: str, sponsor_url: str, client: Optional[httpx.AsyncClient] = None
+) -> str:
+    """
+    Fetch an MP's party from their XML profile, using the sponsor cache
+    """
+    party, _ = await lookup_sponsor_party(person_id, sponsor_url, client)
+    return party
+
+
+async def stored_sponsor_party(person_id: str) -> Optional[str]:
+    """The party last stored for a sponsor, however old, or None"""
+    store = get_bill_store()
+    if store is None:
+        return None
+    stored = await asyncio.to_thread(store.get_sponsor, person_id)
+    return stored[0] if stored is not None else None
+
+
+async def lookup_sponsor_party(
+    person_id: str, sponsor_url: str, client: Optional[httpx.AsyncClient] = None
+) -> tuple[str, bool]:
+    """
+    fetch_sponsor_party that also tells whether the lookup was skipped for
+    lack of time, leaving the party "Unknown"
+    """
+    cached = sponsor_cache.get(person_id)
+    if cached is not None:
+        logger.debug(f"Sponsor cache hit for {person_id}")
+        return cached, False
+
+    left = remaining()
+    if left is not None and left < settings.SPONSOR_MIN_BUDGET:
+        # Not worth starting a fetch that would push the request past its
+        # deadline; answer from the store or give up on the party
+        logger.debug(f"Skipping sponsor lookup for {person_id}, {left:.2f}s left")
+        stored = await stored_sponsor_party(person_id)
+        if stored is not None:
+            return stored, False
+        return "Unknown", True
+
+    async def fetch() -> str:
+        shared = get_shared_cache()
+        if shared is not None:
+            party = await shared.get_sponsor(person_id)
+            if party is not None:
+                sponsor_cache.set(person_id, party)
+                return party
+
+        store = get_bill_store()
+        stored = None
+        if store is not None:
+            stored = await asyncio.to_thread(store.get_sponsor, person_id)
+            if stored is not None and time.time() - stored[1] < sponsor_cache.ttl:
+                sponsor_cache.set(person_id, stored[0])
+                return stored[0]
+
+        try:
+            logger.debug(f"Fetching sponsor profile from: {sponsor_url}")
+            party = await fetch_parsed(
+                client or get_http_client(),
+                sponsor_url,
+                lambda text: parse_sponsor_party(text) or "Unknown",
+                "sponsor",
+            )
+            sponsor_cache.set(person_id, party)
+            if shared is not None:
+                await shared.set_sponsor(person_id, party)
+            if store is not None:
+                await asyncio.to_thread(store.put_sponsor, person_id, party)
+            return party
+
+        except Exception as e:
+            logger.warning(f"Failed to fetch sponsor party information: {str(e)}")
+            logger.debug("Exception details:", exc_info=True)
+
+        # Fall back to the last known party, however old
+        if stored is not None:
+            return stored[0]
+        return "Unknown"
+
+    return await sponsor_flight.do(person_id, fetch), False
+
+
+async def prewarm_sponsor_cache(
+    person_ids: list[str], client: Optional[httpx.AsyncClient] = None
+) -> int:
+    """
+    Load sponsor parties for the given person IDs into the sponsor cache.
+    Returns the number of sponsors whose party was resolved.
+    """
+    parties = await asyncio.gather(
+        *(
+            fetch_sponsor_party(person_id, build_sponsor_url_from_id(person_id), client)
+            for person_id in person_ids
+        )
+    )
+    resolved = sum(1 for party in parties if party != "Unknown")
+    logger.info(f"Pre-warmed sponsor cache: {resolved}/{len(person_ids)} resolved")
+    return resolved
+
+
+async def prewarm_bill_cache(
+    identifiers: list[str], client: Optional[httpx.AsyncClient] = None
+) -> int:
+    """
+    Load bills given as URLs or "44-1/c-422" identifiers into the bill cache.
+    Returns the number of bills loaded.
+    """
+    urls = [url for url in map(resolve_bill_url, identifiers) if url is not None]
+    results = await asyncio.gather(
+        *(scrape_bill_info(url, client) for url in urls), return_exceptions=True
+    )
+    loaded = sum(1 for result in results if isinstance(result, BillInfo))
+    logger.info(f"Pre-warmed bill cache: {loaded}/{len(identifiers)} loaded")
+    return loaded
+
+
+class SponsorRef(NamedTuple):
+    person_id: str
+    url: str
+
+
+def extract_sponsor(bill_element: Optional[ET.Element]) -> Union[str, SponsorRef]:
+    """
+    Work out how to get the sponsor party of a bill element: either the party
+    itself when no lookup is needed ("Senate" or "Unknown"), or the MP profile
+    to fetch
     """
     if bill_element is None:
         logger.debug("Bill element is None")
         return "Unknown"
+    return sponsor_from_values(element_values(bill_element))
 
+
+def sponsor_from_values(values: dict[str, Optional[str]]) -> Union[str, SponsorRef]:
+    """extract_sponsor for the values of a <Bill>"""
     # Get sponsor details from the bill XML
-    person_id = safe_xml_text(bill_element.find("SponsorPersonId"))
-    first_name = safe_xml_text(bill_element.find("SponsorPersonOfficialFirstName"))
-    last_name = safe_xml_text(bill_element.find("SponsorPersonOfficialLastName"))
+    person_id = value_text(values, "SponsorPersonId")
+    first_name = value_text(values, "SponsorPersonOfficialFirstName")
+    last_name = value_text(values, "SponsorPersonOfficialLastName")
 
     logger.debug(f"Sponsor details - ID: {person_id}, Name: {first_name} {last_name}")
 
     # Check if it's a Senate bill
-    is_senate_bill = safe_xml_text(bill_element.find("IsSenateBill"))
+    is_senate_bill = value_text(values, "IsSenateBill")
     if is_senate_bill.lower() == "true":
         return "Senate"
 
     if person_id != "Unknown" and first_name != "Unknown" and last_name != "Unknown":
-        try:
-            # Fetch sponsor's XML profile
-            sponsor_url = build_sponsor_url(first_name, last_name, person_id)
-            logger.debug(f"Fetching sponsor profile from: {sponsor_url}")
+        return SponsorRef(
+            person_id, build_sponsor_url(first_name, last_name, person_id)
+        )
+
+    return "Unknown"
+
+
+async def resolve_sponsor(
+    sponsor: Union[str, SponsorRef], client: Optional[httpx.AsyncClient] = None
+) -> str:
+    """Turn the result of extract_sponsor into a party name"""
+    party, _ = await lookup_sponsor(sponsor, client)
+    return party
 
-            async with httpx.AsyncClient(timeout=settings.REQUEST_TIMEOUT) as client:
-                response = await client.get(sponsor_url)
-                response.raise_for_status()
 
-                sponsor_root = ET.fromstring(response.text)
+async def lookup_sponsor(
+    sponsor: Union[str, SponsorRef], client: Optional[httpx.AsyncClient] = None
+) -> tuple[str, bool]:
+    """resolve_sponsor that also tells whether the lookup was skipped"""
+    if isinstance(sponsor, SponsorRef):
+        with stage("sponsor_lookup"):
+            return await lookup_sponsor_party(sponsor.person_id, sponsor.url, client)
+    return sponsor, False
+
+
+async def get_sponsor_party(
+    bill_element: Optional[ET.Element], client: Optional[httpx.AsyncClient] = None
+) -> str:
+    """
+    Extract sponsor party information from the bill element
+    """
+    return await resolve_sponsor(extract_sponsor(bill_element), client)
+
+
+async def cache_bill(cache_key: str, bill_info: BillInfo) -> None:
+    """Put a freshly scraped bill in the in-process and shared caches"""
+    bill_cache.set(cache_key, bill_info)
+    bill_table.put(cache_key, bill_info)
+    shared = get_shared_cache()
+    if shared is not None:
+        await shared.set_bill(cache_key, bill_info)
+
+
+async def load_bill(
+    cache_key: str,
+    url: str,
+    client: Optional[httpx.AsyncClient] = None,
+    with_sponsor: bool = True,
+) -> BillInfo:
+    """
+    Load a bill from the shared cache, else the persistent store when fresh
+    enough, else upstream, and fill the caches. When upstream fails, a stale
+    cached or stored copy is returned if there is one. An upstream result
+    that may lack the sponsor party, without `with_sponsor` or because the
+    lookup was skipped near the deadline, is not cached.
+    """
+    shared = get_shared_cache()
+    if shared is not None:
+        hit = await shared.get_bill(cache_key)
+        if hit is not None:
+            logger.debug(f"Shared cache hit for {cache_key}")
+            bill_info, age = hit
+            # Expire locally when the shared entry does, not a full TTL later
+            bill_cache.set(cache_key, bill_info, ttl=max(bill_cache.ttl - age, 0.0))
+            bill_table.put(cache_key, bill_info)
+            return bill_info
+
+    store = get_bill_store()
+    stored = None
+    if store is not None:
+        stored = await asyncio.to_thread(store.get_bill, cache_key)
+        if stored is not None and time.time() - stored[1] < settings.BILL_STORE_MAX_AGE:
+            logger.debug(f"Bill store hit for {cache_key}")
+            bill_cache.set(cache_key, stored[0])
+            bill_table.put(cache_key, stored[0])
+            return stored[0]
+
+    try:
+        bill_info, complete = await fetch_bill(url, client, with_sponsor)
+    except HTTPException as e:
+        # While parl.ca is failing, an outdated copy beats an error
+        if e.status_code < 500:
+            raise
+        fallback = bill_cache.get_stale(cache_key)
+        if fallback is not None:
+            logger.warning(f"Serving stale {cache_key} after upstream error")
+            return fallback[0]
+        if stored is not None:
+            logger.warning(f"Serving stored {cache_key} after upstream error")
+            return stored[0]
+        raise
 
-                # Try to get party from MemberOfParliamentRole first
-                caucus = sponsor_root.find(".//MemberOfParliamentRole/CaucusShortName")
-                if caucus is not None and caucus.text:
-                    party = caucus.text.strip()
-                    logger.debug(f"Found party in MemberOfParliamentRole: {party}")
-                    return party
+    if not complete:
+        return bill_info
 
-                # Fallback to CaucusMemberRoles if not found
-                caucus = sponsor_root.find(
-                    ".//CaucusMemberRoles/CaucusMemberRole[last()]/CaucusShortName"
-                )
-                if caucus is not None and caucus.text:
-                    party = caucus.text.strip()
-                    logger.debug(f"Found party in CaucusMemberRoles: {party}")
-                    return party
+    await cache_bill(cache_key, bill_info)
+    if store is not None:
+        await asyncio.to_thread(store.put_bill, cache_key, bill_info)
+    return bill_info
 
-                logger.debug("No party information found in MP profile")
 
+async def scrape_bill_info(
+    url: str, client: Optional[httpx.AsyncClient] = None, with_sponsor: bool = True
+) -> BillInfo:
+    """
+    Scrape information from a Parliament bill using the XML endpoint.
+    Pass with_sponsor=False when sponsor_party is not needed to save the MP
+    profile request; the party is then only filled in from the caches.
+    """
+    with stage("bill_lookup"):
+        bill_id = parse_bill_id(url)
+        if bill_id is None:
+            return await fetch_bill_info(url, client, with_sponsor)
+
+        cache_key = bill_id.key
+        cached = bill_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Bill cache hit for {cache_key}")
+            return cached
+
+        # Callers needing the sponsor must not share a sponsorless result
+        flight_key = cache_key if with_sponsor else f"{cache_key}#nosponsor"
+        return await bill_flight.do(
+            flight_key,
+            lambda: load_bill(cache_key, bill_id.url, client, with_sponsor),
+        )
+
+
+_revalidations: dict[str, asyncio.Task] = {}
+
+
+def revalidate_bill(
+    cache_key: str, url: str, client: Optional[httpx.AsyncClient] = None
+) -> None:
+    """Refresh a cached bill in the background, at most once at a time per bill"""
+    if cache_key in _revalidations:
+        return
+
+    async def revalidate() -> None:
+        # Not bound by the deadline or trace of the request that triggered it
+        clear_deadline()
+        clear_trace()
+        try:
+            await bill_flight.do(cache_key, lambda: load_bill(cache_key, url, client))
         except Exception as e:
-            logger.warning(f"Failed to fetch sponsor party information: {str(e)}")
-            logger.debug("Exception details:", exc_info=True)
+            logger.warning(f"Background refresh of {cache_key} failed: {str(e)}")
+        finally:
+            _revalidations.pop(cache_key, None)
 
-    return "Unknown"
+    _revalidations[cache_key] = asyncio.ensure_future(revalidate())
 
 
-async def scrape_bill_info(url: str) -> BillInfo:
+async def drain_revalidations(timeout: float) -> int:
     """
-    Scrape information from a Parliament bill using the XML endpoint
+    Wait up to `timeout` seconds for background refreshes to finish, then
+    cancel the rest. Returns the number cancelled.
+    """
+    pending = list(_revalidations.values())
+    if not pending:
+        return 0
+    _, unfinished = await asyncio.wait(pending, timeout=timeout)
+    for task in unfinished:
+        task.cancel()
+    if unfinished:
+        logger.warning(f"Cancelled {len(unfinished)} unfinished background refreshes")
+    return len(unfinished)
+
+
+async def scrape_bill_info_swr(
+    url: str, client: Optional[httpx.AsyncClient] = None, with_sponsor: bool = True
+) -> tuple[BillInfo, Optional[float]]:
+    """
+    Stale-while-revalidate variant of scrape_bill_info. An expired bill still
+    within BILL_CACHE_STALE_GRACE is returned at once while a single background
+    task refreshes it.
+
+    Returns:
+        The bill, and its age in seconds when it was served stale (None when fresh)
+    """
+    cache_key = extract_bill_key(url)
+    if cache_key is not None:
+        stale = bill_cache.get_stale(cache_key)
+        if stale is not None:
+            bill_info, age = stale
+            logger.debug(f"Serving stale {cache_key} ({age:.0f}s old)")
+            revalidate_bill(cache_key, url, client)
+            return bill_info, age
+
+    return await scrape_bill_info(url, client, with_sponsor), None
+
+
+async def refresh_bill(
+    cache_key: str, url: str, client: Optional[httpx.AsyncClient] = None
+) -> BillInfo:
+    """
+    Re-scrape a bill from upstream regardless of cache state, and update the
+    bill cache and the persistent store
+    """
+
+    async def refresh() -> BillInfo:
+        bill_info = await fetch_bill_info(url, client)
+        await cache_bill(cache_key, bill_info)
+        store = get_bill_store()
+        if store is not None:
+            await asyncio.to_thread(store.put_bill, cache_key, bill_info)
+        return bill_info
+
+    return await bill_flight.do(cache_key, refresh)
+
+
+async def refresh_stale_bills(
+    client: Optional[httpx.AsyncClient] = None,
+    max_age: Optional[float] = None,
+    limit: Optional[int] = None,
+) -> int:
+    """
+    Re-scrape the stored bills older than max_age, oldest first.
+    Returns the number of bills refreshed.
+    """
+    store = get_bill_store()
+    if store is None:
+        return 0
+
+    keys = await asyncio.to_thread(
+        store.stale_bill_keys,
+        settings.BILL_STORE_MAX_AGE if max_age is None else max_age,
+        limit or settings.BILL_STORE_REFRESH_BATCH,
+    )
+
+    refreshed = []
+    for key in keys:
+        try:
+            bill_info = await fetch_bill_info(f"{BILL_URL_PREFIX}{key}", client)
+        except HTTPException as e:
+            logger.warning(f"Failed to refresh stored bill {key}: {e.detail}")
+            continue
+        await cache_bill(key, bill_info)
+        refreshed.append((key, bill_info))
+
+    if refreshed:
+        await asyncio.to_thread(store.put_bills, refreshed)
+        logger.info(f"Refreshed {len(refreshed)}/{len(keys)} stale stored bills")
+    return len(refreshed)
+
+
+async def fetch_bill_info(
+    url: str, client: Optional[httpx.AsyncClient] = None, with_sponsor: bool = True
+) -> BillInfo:
+    """
+    Fetch and parse a bill from the upstream XML endpoint, bypassing the cache.
+    Without `with_sponsor` the MP profile is not fetched and sponsor_party comes
+    from the sponsor cache, or is "Unknown".
+    """
+    bill_info, _ = await fetch_bill(url, client, with_sponsor)
+    return bill_info
+
+
+async def fetch_bill(
+    url: str, client: Optional[httpx.AsyncClient] = None, with_sponsor: bool = True
+) -> tuple[BillInfo, bool]:
+    """
+    fetch_bill_info that also tells whether the sponsor party was resolved,
+    rather than left out or skipped for lack of time, so the bill may be cached
     """
     try:
         # Convert HTML URL to XML URL
-        xml_url = f"{url}/xml"
-
-        headers = {"User-Agent": settings.USER_AGENT}
-        timeout = httpx.Timeout(settings.REQUEST_TIMEOUT)
-
-        async with httpx.AsyncClient(headers=headers, timeout=timeout) as client:
-            response = await client.get(xml_url)
-            response.raise_for_status()
-
-            # Parse XML
-            try:
-                root = ET.fromstring(response.text)
-                bill = root.find("Bill")
-            except ET.ParseError as e:
-                logger.error(f"Failed to parse XML: {e}")
-                raise HTTPException(status_code=500, detail="Invalid XML response")
-
-            if bill is None:
-                raise HTTPException(
-                    status_code=404, detail="Bill information not found"
-                )
-
-            # Extract all fields with safe handling
-            bill_type_text = safe_xml_text(bill.find("BillDocumentTypeName"))
-            status_text = safe_xml_text(bill.find("StatusName"))
-            sponsor_name_text = safe_xml_text(bill.find("SponsorPersonName"))
-            last_updated_text = safe_xml_text(bill.find("LatestBillEventDateTime"))
-            bill_number_text = safe_xml_text(bill.find("NumberCode"))
-
-            if bill_number_text != "Unknown":
-                bill_number_text = bill_number_text.lower()
-
-            # Validate bill number
-            if not bill_number_text or bill_number_text == "unknown":
-                raise HTTPException(
-                    status_code=400, detail="Could not extract bill number from XML"
-                )
-
-            # Handle dropped bills
-            is_dropped_elem = bill.find("IsDroppedFromSenateOrderPaper")
-            if (
-                is_dropped_elem is not None
-                and is_dropped_elem.text is not None
-                and is_dropped_elem.text.lower() == "true"
-            ):
-                status_text = "Dropped from Senate Order Paper"
-
-            # Get sponsor party information
-            sponsor_party = await get_sponsor_party(bill)
-
-            # Log the extracted data
-            logger.info(f"""
-            Extracted from XML:
-            Bill Number: {bill_number_text}
-            Bill Type: {bill_type_text}
-            Status: {status_text}
-            Sponsor Name: {sponsor_name_text}
-            Sponsor Party: {sponsor_party}
-            Last Updated: {last_updated_text}
-            """)
-
-            # Create BillInfo with extracted party information
-            return BillInfo(
-                bill_number=bill_number_text,
-                bill_type=bill_type_text,
-                status=status_text,
-                sponsor_name=sponsor_name_text,
-                sponsor_party=sponsor_party,
-                last_updated=last_updated_text,
-            )
-
+        bill_id = parse_bill_id(url)
+        xml_url = bill_id.xml_url if bill_id else f"{url.rstrip('/')}/xml"
+
+        client = client or get_http_client()
+        fields, sponsor = await fetch_parsed(
+            client, xml_url, parse_bill_document, "bill"
+        )
+
+        # Get sponsor party information
+        complete = with_sponsor
+        if with_sponsor:
+            sponsor_party, skipped = await lookup_sponsor(sponsor, client)
+            complete = not skipped
+        elif isinstance(sponsor, SponsorRef):
+            sponsor_party = sponsor_cache.get(sponsor.person_id) or "Unknown"
+        else:
+            sponsor_party = sponsor
+
+        # Log the extracted data
+        logger.info(f"""
+        Extracted from XML:
+        Bill Number: {fields["bill_number"]}
+        Bill Type: {fields["bill_type"]}
+        Status: {fields["status"]}
+        Sponsor Name: {fields["sponsor_name"]}
+        Sponsor Party: {sponsor_party}
+        Last Updated: {fields["last_updated"]}
+        """)
+
+        # Create BillInfo with extracted party information
+        with span("build_model"):
+            return BillInfo(sponsor_party=sponsor_party, **fields), complete
+
+    except CircuitOpenError as e:
+        logger.warning(f"Skipping XML fetch for {url}: {str(e)}")
+        raise HTTPException(status_code=503, detail=f"Upstream unavailable: {str(e)}")
+    except DeadlineExceeded as e:
+        logger.warning(f"Gave up on {url}: {str(e)}")
+        raise HTTPException(status_code=504, detail=f"Upstream too slow: {str(e)}")
     except httpx.RequestError as e:
         logger.error(f"XML fetch error for {url}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch XML: {str(e)}")
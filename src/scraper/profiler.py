@@ -0,0 +1,118 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Any, Optional
+
+# Top-of-stack functions meaning the event loop is waiting for I/O. asyncio's
+# own loop waits in a selector; a loop written in C, such as uvloop, has no
+# frames of its own, so it waits with the frame that started it on top
+SELECTOR_FUNCTIONS = {"select", "poll", "epoll", "kqueue"}
+LOOP_ENTRY_FUNCTIONS = {"run", "run_until_complete", "run_forever"}
+LOOP_PACKAGES = {"asyncio", "uvloop"}
+
+
+class ProfilerBusy(Exception):
+    """Raised when a profile is requested while another one is running"""
+
+
+_lock = threading.Lock()
+
+
+def _frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}"
+
+
+def _stack(frame: Optional[FrameType]) -> tuple[str, ...]:
+    """Frames from the outermost call to `frame`"""
+    names = []
+    while frame is not None:
+        names.append(_frame_name(frame))
+        frame = frame.f_back
+    return tuple(reversed(names))
+
+
+def _is_idle(frame: FrameType) -> bool:
+    code = frame.f_code
+    if "selectors" in code.co_filename:
+        return code.co_name in SELECTOR_FUNCTIONS
+    package = os.path.basename(os.path.dirname(code.co_filename))
+    return code.co_name in LOOP_ENTRY_FUNCTIONS and package in LOOP_PACKAGES
+
+
+def sample_thread(
+    thread_id: int, seconds: float, interval: float
+) -> tuple[Counter[tuple[str, ...]], int, int]:
+    """
+    Sample the stack of another thread every `interval` seconds for `seconds`.
+    Returns the stack counts, the total number of samples and how many found
+    the thread's event loop idle, waiting for I/O.
+    """
+    stacks: Counter[tuple[str, ...]] = Counter()
+    samples = idle = 0
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        frame = sys._current_frames().get(thread_id)
+        if frame is None:
+            break
+        samples += 1
+        if _is_idle(frame):
+            idle += 1
+        else:
+            stacks[_stack(frame)] += 1
+        del frame
+        time.sleep(interval)
+    return stacks, samples, idle
+
+
+def profile_thread(
+    thread_id: int, seconds: float, interval: float = 0.005, limit: int = 20
+) -> dict[str, Any]:
+    """
+    Run a time-boxed sampling profile of a thread, normally the event loop of
+    this worker, and return its hottest stacks and functions. Only one profile
+    runs at a time.
+
+    Raises:
+        ProfilerBusy: If another profile is running
+    """
+    if not _lock.acquire(blocking=False):
+        raise ProfilerBusy("A profile is already running")
+    try:
+        stacks, samples, idle = sample_thread(thread_id, seconds, interval)
+    finally:
+        _lock.release()
+
+    busy = samples - idle
+    # Time spent in each function anywhere on the stack, counted once per sample
+    functions: Counter[str] = Counter()
+    for stack, count in stacks.items():
+        for name in set(name.rpartition(":")[0] for name in stack):
+            functions[name] += count
+
+    def share(count: int) -> float:
+        return round(count / samples, 4) if samples else 0.0
+
+    return {
+        "pid": os.getpid(),
+        "seconds": seconds,
+        "interval": interval,
+        "samples": samples,
+        "idle_share": share(idle),
+        "busy_share": share(busy),
+        "hot_stacks": [
+            {"samples": count, "share": share(count), "stack": list(stack)}
+            for stack, count in stacks.most_common(limit)
+        ],
+        "hot_functions": [
+            {"samples": count, "share": share(count), "function": name}
+            for name, count in functions.most_common(limit)
+        ],
+        # Brendan Gregg's collapsed format, for flame graph tools
+        "collapsed": [
+            f"{';'.join(stack)} {count}" for stack, count in stacks.most_common()
+        ],
+    }
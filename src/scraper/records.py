@@ -0,0 +1,235 @@
+import sys
+from bisect import bisect_left, insort
+from itertools import islice
+from operator import itemgetter
+from typing import Iterator, Optional
+from src.models.bill import BillInfo
+
+BILL_FIELDS = tuple(BillInfo.model_fields)
+
+# Fields drawn from a small set of values, shared across records
+CATEGORICAL_FIELDS = ("bill_type", "status", "sponsor_name", "sponsor_party")
+
+# Fields with a secondary index, matched case-insensitively
+INDEXED_FIELDS = CATEGORICAL_FIELDS
+
+# An index entry: the sortable last_updated of a bill, then its key
+Entry = tuple[str, str]
+
+
+class BillRecord:
+    """
+    Compact internal form of a BillInfo for holding many bills in memory:
+    slotted, with the categorical strings interned so that every record
+    points at one copy of each value. Converted back to BillInfo at the API
+    boundary.
+    """
+
+    __slots__ = BILL_FIELDS
+
+    def __init__(
+        self,
+        bill_number: str,
+        bill_type: str,
+        status: str,
+        sponsor_name: str,
+        sponsor_party: str,
+        last_updated: str,
+    ):
+        intern = sys.intern
+        self.bill_number = bill_number
+        self.bill_type = intern(bill_type)
+        self.status = intern(status)
+        self.sponsor_name = intern(sponsor_name)
+        self.sponsor_party = intern(sponsor_party)
+        self.last_updated = last_updated
+
+    @classmethod
+    def from_bill(cls, bill: BillInfo) -> "BillRecord":
+        return cls(*(getattr(bill, name) for name in BILL_FIELDS))
+
+    def as_dict(self) -> dict[str, str]:
+        return {name: getattr(self, name) for name in BILL_FIELDS}
+
+    def to_bill(self) -> BillInfo:
+        # Validating six strings in pydantic-core is cheaper than model_construct
+        return BillInfo(**self.as_dict())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BillRecord):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in BILL_FIELDS)
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in BILL_FIELDS)
+        return f"BillRecord({values})"
+
+
+# Sorts after the "" of undated entries and before every date
+FIRST_DATE = "0"
+
+
+def date_key(last_updated: str) -> str:
+    """Sort key of a last_updated value; unknown dates sort before all others"""
+    return last_updated if last_updated[:1].isdigit() else ""
+
+
+def _remove(entries: list[Entry], entry: Entry) -> None:
+    index = bisect_left(entries, entry)
+    if index < len(entries) and entries[index] == entry:
+        del entries[index]
+
+
+class Posting:
+    """The bills sharing one value of an indexed field, in date order and as a set"""
+
+    __slots__ = ("entries", "keys")
+
+    def __init__(self):
+        self.entries: list[Entry] = []
+        self.keys: set[str] = set()
+
+    def add(self, entry: Entry) -> None:
+        insort(self.entries, entry)
+        self.keys.add(entry[1])
+
+    def remove(self, entry: Entry) -> None:
+        _remove(self.entries, entry)
+        self.keys.discard(entry[1])
+
+
+_NO_BILLS = Posting()
+
+
+class BillTable:
+    """
+    Every bill ingested or scraped by this worker, by cache key, with
+    secondary indexes kept up to date on every put: for each INDEXED_FIELDS
+    value a Posting, and a list of all (last_updated, key) entries in date order
+    """
+
+    def __init__(self):
+        self._records: dict[str, BillRecord] = {}
+        self._by_updated: list[Entry] = []
+        self._indexes: dict[str, dict[str, Posting]] = {
+            name: {} for name in INDEXED_FIELDS
+        }
+
+    def put(self, key: str, bill: BillInfo) -> BillRecord:
+        record = BillRecord.from_bill(bill)
+        old = self._records.get(key)
+        if old is not None:
+            self._unindex(key, old)
+        self._records[key] = record
+        self._index(key, record)
+        return record
+
+    def _index(self, key: str, record: BillRecord) -> None:
+        entry = (date_key(record.last_updated), key)
+        insort(self._by_updated, entry)
+        for name, index in self._indexes.items():
+            value = getattr(record, name).casefold()
+            posting = index.get(value)
+            if posting is None:
+                posting = index[value] = Posting()
+            posting.add(entry)
+
+    def _unindex(self, key: str, record: BillRecord) -> None:
+        entry = (date_key(record.last_updated), key)
+        _remove(self._by_updated, entry)
+        for name, index in self._indexes.items():
+            value = getattr(record, name).casefold()
+            posting = index.get(value)
+            if posting is not None:
+                posting.remove(entry)
+                if not posting.keys:
+                    del index[value]
+
+    def query(
+        self,
+        filters: Optional[dict[str, str]] = None,
+        updated_since: Optional[str] = None,
+        updated_before: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 50,
+    ) -> tuple[int, list[tuple[str, BillRecord]]]:
+        """
+        Find bills matching every filter (INDEXED_FIELDS name to value, case
+        insensitive) and last updated in [updated_since, updated_before), most
+        recently updated first.
+
+        Returns:
+            The number of matching bills, and the (key, record) pairs of the
+            requested page
+        """
+        postings = sorted(
+            (
+                self._indexes[name].get(value.casefold(), _NO_BILLS)
+                for name, value in (filters or {}).items()
+            ),
+            key=lambda posting: len(posting.keys),
+        )
+        # Walk the date range of the smallest posting, checking the others by key
+        base = postings[0].entries if postings else self._by_updated
+        # Undated bills match no date bound, so any bound starts after them
+        bounded = bool(updated_since or updated_before)
+        since = updated_since or FIRST_DATE
+        low = bisect_left(base, (since,)) if bounded else 0
+        high = bisect_left(base, (updated_before,)) if updated_before else len(base)
+        if low >= high:
+            return 0, []
+
+        records = self._records
+        if len(postings) < 2:
+            start = max(high - offset - limit, low)
+            stop = max(high - offset, low)
+            page = [(key, records[key]) for _, key in reversed(base[start:stop])]
+            return high - low, page
+
+        # Intersect the key sets first so each bill is checked against one set
+        keys = postings[0].keys.intersection(*(p.keys for p in postings[1:]))
+        if len(keys) * 8 < high - low:
+            # Few matches: sorting them by date beats walking the date range
+            entries = sorted((date_key(records[key].last_updated), key) for key in keys)
+            start = bisect_left(entries, (since,)) if bounded else 0
+            stop = bisect_left(entries, (updated_before,)) if updated_before else None
+            matched = [key for _, key in entries[start:stop]]
+        elif low == 0 and high == len(base):
+            # Without date bounds every match counts, so walk back from the
+            # newest only as far as the requested page
+            newest = filter(keys.__contains__, map(itemgetter(1), reversed(base)))
+            matched = list(islice(newest, offset + limit))
+            return len(keys), [(key, records[key]) for key in matched[offset:]]
+        else:
+            # filter() and map() keep the per-bill work out of the interpreter loop
+            matched = list(
+                filter(keys.__contains__, map(itemgetter(1), base[low:high]))
+            )
+        matched.reverse()
+        page = [(key, records[key]) for key in matched[offset : offset + limit]]
+        return len(matched), page
+
+    def get(self, key: str) -> Optional[BillInfo]:
+        record = self._records.get(key)
+        return record.to_bill() if record is not None else None
+
+    def record(self, key: str) -> Optional[BillRecord]:
+        return self._records.get(key)
+
+    def items(self) -> Iterator[tuple[str, BillRecord]]:
+        return iter(self._records.items())
+
+    def clear(self) -> None:
+        self._records.clear()
+        self._by_updated.clear()
+        for index in self._indexes.values():
+            index.clear()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._records
+
+
+bill_table = BillTable()
@@ -0,0 +1,300 @@
+import asyncio
+import httpx
+import logging
+import random
+import time
+from collections import deque
+from typing import Any, Optional
+from src.config.settings import settings
+from src.scraper.deadline import (
+    DeadlineExceeded,
+    budget_exhausted,
+    check_deadline,
+    remaining,
+    request_timeout,
+)
+from src.scraper.limits import get_host_limiter
+from src.scraper.metrics import metrics_enabled, upstream_bytes, upstream_responses
+
+logger = logging.getLogger(__name__)
+
+# Upstream responses worth retrying
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream host whose circuit is open"""
+
+    def __init__(self, host: str, retry_in: float):
+        self.host = host
+        self.retry_in = retry_in
+        super().__init__(f"{host} is unavailable, retrying in {retry_in:.0f}s")
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker. After CIRCUIT_FAILURE_THRESHOLD failed requests in
+    a row the circuit opens and calls fail fast for CIRCUIT_RESET_TIMEOUT
+    seconds; then a single probe request is let through (half open) and its
+    outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, host: str):
+        self.host = host
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at < settings.CIRCUIT_RESET_TIMEOUT:
+            return "open"
+        return "half_open"
+
+    def check(self) -> bool:
+        """
+        Raise CircuitOpenError unless a request may be made. Returns True when
+        the request is the half-open probe, which must end with
+        record_success, record_failure or release_probe.
+        """
+        state = self.state
+        if state == "closed":
+            return False
+        if state == "half_open" and not self.probing:
+            self.probing = True
+            return True
+
+        retry_in = (
+            settings.CIRCUIT_RESET_TIMEOUT - (time.monotonic() - self.opened_at)
+            if state == "open"
+            else 0.0
+        )
+        raise CircuitOpenError(self.host, max(retry_in, 0.0))
+
+    def record_success(self) -> None:
+        if self.opened_at is not None:
+            logger.info(f"Circuit for {self.host} closed")
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.probing or self.failures >= settings.CIRCUIT_FAILURE_THRESHOLD:
+            if self.state == "closed":
+                logger.warning(
+                    f"Circuit for {self.host} opened after {self.failures} failures"
+                )
+            self.opened_at = time.monotonic()
+        self.probing = False
+
+    def release_probe(self) -> None:
+        """Let another probe through after one that ended without an outcome"""
+        self.probing = False
+
+    def stats(self) -> dict[str, Any]:
+        return {"state": self.state, "consecutive_failures": self.failures}
+
+
+class LatencyTracker:
+    """Recent successful response times of one host, for the hedging delay"""
+
+    def __init__(self, size: int = 200):
+        self.samples: deque[float] = deque(maxlen=size)
+
+    def record(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        if len(self.samples) < settings.UPSTREAM_HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_latencies: dict[str, LatencyTracker] = {}
+
+
+def get_circuit_breaker(url: str) -> CircuitBreaker:
+    host = httpx.URL(url).host
+    breaker = _breakers.get(host)
+    if breaker is None:
+        breaker = _breakers[host] = CircuitBreaker(host)
+    return breaker
+
+
+def get_latency_tracker(url: str) -> LatencyTracker:
+    host = httpx.URL(url).host
+    tracker = _latencies.get(host)
+    if tracker is None:
+        tracker = _latencies[host] = LatencyTracker()
+    return tracker
+
+
+def circuit_states() -> dict[str, dict[str, Any]]:
+    """Circuit state and the current hedging delay per upstream host"""
+    return {
+        host: {
+            **breaker.stats(),
+            "hedge_delay": hedge_delay(_latencies.get(host)),
+        }
+        for host, breaker in _breakers.items()
+    }
+
+
+def reset_resilience() -> None:
+    _breakers.clear()
+    _latencies.clear()
+
+
+def hedge_delay(tracker: Optional[LatencyTracker]) -> Optional[float]:
+    """
+    How long to wait for a response before sending a duplicate request: the
+    host's p95 latency, or None (no hedging) until enough samples exist
+    """
+    if not settings.UPSTREAM_HEDGE_ENABLED or tracker is None:
+        return None
+    p95 = tracker.percentile(0.95)
+    if p95 is None:
+        return None
+    return max(p95, settings.UPSTREAM_HEDGE_MIN_DELAY)
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff before retry number `attempt` (from 1)"""
+    ceiling = min(
+        settings.UPSTREAM_RETRY_BACKOFF * 2 ** (attempt - 1),
+        settings.UPSTREAM_RETRY_BACKOFF_MAX,
+    )
+    return random.uniform(0, ceiling)
+
+
+async def limited_get(
+    client: httpx.AsyncClient, url: str, headers: dict[str, str]
+) -> httpx.Response:
+    """One GET within the host's rate and concurrency limits"""
+    async with get_host_limiter(url).slot() as slot:
+        # The wait for the slot may have used up the budget
+        check_deadline()
+        started = time.monotonic()
+        try:
+            response = await client.get(url, headers=headers, timeout=request_timeout())
+        except httpx.TransportError as e:
+            if metrics_enabled():
+                upstream_responses.inc(httpx.URL(url).host, "error")
+            if isinstance(e, httpx.TimeoutException) and budget_exhausted():
+                raise DeadlineExceeded(
+                    f"Request deadline exceeded fetching {url}"
+                ) from e
+            raise
+        slot.record(response.status_code)
+    if response.status_code < 500:
+        get_latency_tracker(url).record(time.monotonic() - started)
+    if metrics_enabled():
+        host = httpx.URL(url).host
+        upstream_responses.inc(host, str(response.status_code))
+        upstream_bytes.inc(host, amount=len(response.content))
+    return response
+
+
+async def hedged_get(
+    client: httpx.AsyncClient, url: str, headers: dict[str, str]
+) -> httpx.Response:
+    """
+    GET that sends a second, identical request when the first has not answered
+    within the host's hedging delay, and returns whichever finishes first
+    """
+    delay = hedge_delay(_latencies.get(httpx.URL(url).host))
+    primary = asyncio.ensure_future(limited_get(client, url, headers))
+    if delay is None:
+        return await primary
+
+    done, _ = await asyncio.wait({primary}, timeout=delay)
+    if done:
+        return primary.result()
+
+    logger.debug(f"Hedging slow request to {url} after {delay:.3f}s")
+    hedge = asyncio.ensure_future(limited_get(client, url, headers))
+    pending = {primary, hedge}
+    try:
+        while True:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            succeeded = [task for task in done if task.exception() is None]
+            if succeeded:
+                return succeeded[0].result()
+            if not pending:
+                # Both failed: raise the error of the one that finished last
+                return done.pop().result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def resilient_get(
+    client: httpx.AsyncClient, url: str, headers: Optional[dict[str, str]] = None
+) -> httpx.Response:
+    """
+    GET an upstream URL with a circuit breaker, hedging, and retries with
+    jittered exponential backoff on connection errors and 429/5xx responses.
+
+    Raises:
+        CircuitOpenError: If the host's circuit is open
+        DeadlineExceeded: If the request budget runs out before an attempt
+        httpx.TransportError: If every attempt failed to connect or timed out
+    """
+    check_deadline()
+    breaker = get_circuit_breaker(url)
+    probe = breaker.check()
+    try:
+        return await retrying_get(client, url, headers or {}, breaker)
+    finally:
+        # A probe ended by the deadline or cancellation must not keep the
+        # circuit half open for good
+        if probe:
+            breaker.release_probe()
+
+
+async def retrying_get(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: dict[str, str],
+    breaker: CircuitBreaker,
+) -> httpx.Response:
+    """The attempts of resilient_get, reporting their outcome to the breaker"""
+    attempt = 0
+    while True:
+        check_deadline()
+        can_retry = attempt < settings.UPSTREAM_RETRIES
+        try:
+            response = await hedged_get(client, url, headers)
+        except httpx.TransportError as e:
+            if not can_retry:
+                breaker.record_failure()
+                raise
+            logger.debug(f"Retrying {url} after error: {str(e)}")
+        except DeadlineExceeded:
+            # Our budget ran out, which says nothing about the host
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+        else:
+            if response.status_code not in RETRY_STATUS_CODES or not can_retry:
+                if response.status_code in RETRY_STATUS_CODES:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                return response
+            logger.debug(f"Retrying {url} after status {response.status_code}")
+
+        attempt += 1
+        delay = backoff_delay(attempt)
+        left = remaining()
+        if left is not None and delay >= left:
+            raise DeadlineExceeded(f"No time left to retry {url}")
+        await asyncio.sleep(delay)
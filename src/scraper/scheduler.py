@@ -0,0 +1,154 @@
+import asyncio
+import httpx
+import logging
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone, tzinfo
+from typing import Any, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from src.config.settings import settings
+from src.scraper.parser import refresh_bill
+from src.scraper.utils import extract_bill_key, resolve_bill_url
+
+logger = logging.getLogger(__name__)
+
+
+def legisinfo_timezone() -> tzinfo:
+    """LegisInfo times are Ottawa local time without an offset"""
+    try:
+        return ZoneInfo("America/Toronto")
+    except ZoneInfoNotFoundError:
+        logger.warning("No time zone database, reading LegisInfo times as UTC")
+        return timezone.utc
+
+
+LEGISINFO_TZ = legisinfo_timezone()
+
+
+def updated_at(last_updated: Optional[str]) -> Optional[float]:
+    """Epoch seconds of a bill's last_updated, or None when it is unknown"""
+    try:
+        parsed = datetime.fromisoformat(last_updated or "")
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=LEGISINFO_TZ)
+    return parsed.timestamp()
+
+
+@dataclass
+class WatchedBill:
+    key: str
+    url: str
+    next_due: float = 0.0
+    last_refreshed: Optional[float] = None
+    last_updated: Optional[str] = None
+    failures: int = 0
+    last_error: Optional[str] = None
+
+    def is_hot(self, now: float) -> bool:
+        """Whether LegisInfo's latest event for the bill is within WATCH_HOT_WINDOW"""
+        changed = updated_at(self.last_updated)
+        return changed is not None and now - changed < settings.WATCH_HOT_WINDOW
+
+
+def jittered(interval: float) -> float:
+    """Spread refreshes out by +/- WATCH_REFRESH_JITTER of the interval"""
+    spread = interval * settings.WATCH_REFRESH_JITTER
+    return interval + random.uniform(-spread, spread)
+
+
+class RefreshScheduler:
+    """
+    Periodically re-scrapes a watch list of bills so /api/bill is served from
+    the cache. Bills last updated on LegisInfo recently are refreshed more
+    often and go first; failing bills back off exponentially.
+    """
+
+    def __init__(
+        self,
+        identifiers: list[str],
+        client: Optional[httpx.AsyncClient] = None,
+        concurrency: Optional[int] = None,
+    ):
+        self.client = client
+        self.semaphore = asyncio.Semaphore(concurrency or settings.WATCH_CONCURRENCY)
+        self.bills: dict[str, WatchedBill] = {}
+        for identifier in identifiers:
+            url = resolve_bill_url(identifier)
+            key = extract_bill_key(url) if url else None
+            if key is None:
+                logger.warning(f"Ignoring invalid watch list entry: {identifier}")
+                continue
+            self.bills[key] = WatchedBill(key=key, url=url)
+
+    def due_bills(self, now: Optional[float] = None) -> list[WatchedBill]:
+        """Bills due for a refresh, recently updated ones first, then most overdue"""
+        now = time.time() if now is None else now
+        due = [bill for bill in self.bills.values() if bill.next_due <= now]
+        return sorted(due, key=lambda bill: (not bill.is_hot(now), bill.next_due))
+
+    async def refresh(self, bill: WatchedBill) -> None:
+        async with self.semaphore:
+            try:
+                bill_info = await refresh_bill(bill.key, bill.url, self.client)
+            except Exception as e:
+                bill.failures += 1
+                bill.last_error = str(getattr(e, "detail", e))
+                backoff = min(
+                    settings.WATCH_REFRESH_INTERVAL * 2**bill.failures,
+                    settings.WATCH_MAX_BACKOFF,
+                )
+                bill.next_due = time.time() + jittered(backoff)
+                logger.warning(
+                    f"Refresh of {bill.key} failed ({bill.failures} in a row): "
+                    f"{bill.last_error}"
+                )
+                return
+
+        now = time.time()
+        bill.last_updated = bill_info.last_updated
+        bill.failures = 0
+        bill.last_error = None
+        bill.last_refreshed = now
+        interval = (
+            settings.WATCH_HOT_INTERVAL
+            if bill.is_hot(now)
+            else settings.WATCH_REFRESH_INTERVAL
+        )
+        bill.next_due = now + jittered(interval)
+
+    async def refresh_due(self) -> int:
+        """Refresh every bill that is due. Returns how many were attempted."""
+        due = self.due_bills()
+        await asyncio.gather(*(self.refresh(bill) for bill in due))
+        return len(due)
+
+    async def run(self) -> None:
+        """Refresh due bills until cancelled"""
+        logger.info(f"Refresh scheduler watching {len(self.bills)} bills")
+        while True:
+            await self.refresh_due()
+            next_due = min((bill.next_due for bill in self.bills.values()), default=0)
+            await asyncio.sleep(
+                min(max(next_due - time.time(), 1.0), settings.WATCH_REFRESH_INTERVAL)
+            )
+
+    def status(self) -> list[dict[str, Any]]:
+        """Per-bill refresh state, with lag = seconds since the last successful refresh"""
+        now = time.time()
+        return [
+            {
+                "bill": bill.key,
+                "lag": (
+                    None if bill.last_refreshed is None else now - bill.last_refreshed
+                ),
+                "next_refresh_in": max(bill.next_due - now, 0.0),
+                "hot": bill.is_hot(now),
+                "last_updated": bill.last_updated,
+                "failures": bill.failures,
+                "last_error": bill.last_error,
+            }
+            for bill in self.bills.values()
+        ]
@@ -0,0 +1,314 @@
+import asyncio
+import json
+from abc import ABC, abstractmethod
+import logging
+import time
+from typing import Any, Optional, Union
+from urllib.parse import unquote, urlsplit
+from pydantic import ValidationError
+from src.config.settings import settings
+from src.models.bill import BillInfo
+
+logger = logging.getLogger(__name__)
+
+# Bump when the encoded layout changes so old entries read as misses
+ENCODING_VERSION = 1
+BILL_FIELDS = tuple(BillInfo.model_fields)
+
+
+class CacheBackend(ABC):
+    """Byte store shared by every worker: the L2 tier behind the in-process caches"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """The value stored at `key`, or None when missing or expired"""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store `value` at `key` for `ttl` seconds"""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove `key` if present"""
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryBackend(CacheBackend):
+    """
+    In-process backend with per-key expiry. Only shared within one process;
+    stands in for Redis in tests and single-worker deployments.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        self.maxsize = maxsize
+        self._entries: dict[str, tuple[bytes, float]] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            del self._entries[key]
+            return None
+        return entry[0]
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries.pop(key, None)
+        self._entries[key] = (value, time.monotonic() + ttl)
+        while len(self._entries) > self.maxsize:
+            # Oldest write first
+            del self._entries[next(iter(self._entries))]
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+
+class RedisError(Exception):
+    """Error reply from a Redis-protocol server"""
+
+
+def encode_command(*args: Union[str, bytes, int, float]) -> bytes:
+    """Encode a command as a RESP array of bulk strings"""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        parts.append(b"$%d\r\n%b\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    """Read one RESP2 reply"""
+    line = await reader.readline()
+    if not line.endswith(b"\r\n"):
+        raise ConnectionError("Connection closed by the cache server")
+    kind, payload = line[:1], line[1:-2]
+    if kind == b"+":
+        return payload.decode()
+    if kind == b"-":
+        raise RedisError(payload.decode())
+    if kind == b":":
+        return int(payload)
+    if kind == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if kind == b"*":
+        length = int(payload)
+        if length < 0:
+            return None
+        return [await read_reply(reader) for _ in range(length)]
+    raise RedisError(f"Unexpected reply: {line!r}")
+
+
+class RedisBackend(CacheBackend):
+    """
+    Minimal client for Redis and Redis-protocol servers (Valkey, KeyDB,
+    Dragonfly) from a redis://[:password@]host[:port][/db] URL, keeping up to
+    `pool_size` idle connections
+    """
+
+    def __init__(self, url: str, pool_size: int = 10):
+        parts = urlsplit(url)
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or 6379
+        self.password = unquote(parts.password) if parts.password else None
+        self.db = int(parts.path.strip("/") or 0)
+        self.pool_size = pool_size
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+    async def _connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            if self.password:
+                await self._call(reader, writer, "AUTH", self.password)
+            if self.db:
+                await self._call(reader, writer, "SELECT", self.db)
+        except BaseException:
+            writer.close()
+            raise
+        return reader, writer
+
+    @staticmethod
+    async def _call(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter, *args: Any
+    ) -> Any:
+        writer.write(encode_command(*args))
+        await writer.drain()
+        return await read_reply(reader)
+
+    async def execute(self, *args: Any) -> Any:
+        """Run one command on a pooled connection"""
+        connection = self._idle.pop() if self._idle else await self._connect()
+        try:
+            reply = await self._call(*connection, *args)
+        except RedisError:
+            self._release(connection)
+            raise
+        except BaseException:
+            # Timed out, cancelled or broken mid-reply: the stream is unusable
+            connection[1].close()
+            raise
+        self._release(connection)
+        return reply
+
+    def _release(
+        self, connection: tuple[asyncio.StreamReader, asyncio.StreamWriter]
+    ) -> None:
+        if len(self._idle) < self.pool_size:
+            self._idle.append(connection)
+        else:
+            connection[1].close()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.execute("GET", key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self.execute("SET", key, value, "PX", max(int(ttl * 1000), 1))
+
+    async def delete(self, key: str) -> None:
+        await self.execute("DEL", key)
+
+    async def close(self) -> None:
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+
+def create_backend(url: str) -> CacheBackend:
+    """Backend for a SHARED_CACHE_URL: memory:// or redis://"""
+    scheme = urlsplit(url).scheme
+    if scheme == "memory":
+        return MemoryBackend()
+    if scheme in ("redis", "valkey"):
+        return RedisBackend(url)
+    raise ValueError(f"Unsupported shared cache URL: {url}")
+
+
+def encode_bill(bill: BillInfo, stored_at: float) -> bytes:
+    """A bill as a compact JSON array: version, stored_at, then the field values"""
+    values = [ENCODING_VERSION, stored_at, *(getattr(bill, f) for f in BILL_FIELDS)]
+    return json.dumps(values, separators=(",", ":")).encode()
+
+
+def decode_bill(data: bytes) -> Optional[tuple[BillInfo, float]]:
+    """Decode encode_bill output; None for entries from another layout"""
+    try:
+        values = json.loads(data)
+        if values[0] != ENCODING_VERSION or len(values) != len(BILL_FIELDS) + 2:
+            return None
+        return BillInfo(**dict(zip(BILL_FIELDS, values[2:]))), values[1]
+    except (ValueError, TypeError, IndexError, ValidationError):
+        return None
+
+
+class SharedCache:
+    """
+    Bill and sponsor entries in a backend shared by all workers. Backend errors
+    and timeouts are logged and treated as misses so the tier never fails a
+    request.
+    """
+
+    def __init__(self, backend: CacheBackend, prefix: str = "", timeout: float = 0.25):
+        self.backend = backend
+        self.prefix = prefix
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    async def _get(self, key: str) -> Optional[bytes]:
+        try:
+            data = await asyncio.wait_for(
+                self.backend.get(self.prefix + key), self.timeout
+            )
+        except Exception as e:
+            # Anything from a broken connection to a garbled reply is a miss
+            self.errors += 1
+            logger.warning(f"Shared cache read of {key} failed: {str(e)}")
+            return None
+        if data is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return data
+
+    async def _set(self, key: str, value: bytes, ttl: float) -> None:
+        try:
+            await asyncio.wait_for(
+                self.backend.set(self.prefix + key, value, ttl), self.timeout
+            )
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Shared cache write of {key} failed: {str(e)}")
+
+    async def get_bill(self, key: str) -> Optional[tuple[BillInfo, float]]:
+        """Return a shared bill and its age in seconds"""
+        data = await self._get(f"bill:{key}")
+        decoded = decode_bill(data) if data is not None else None
+        if decoded is None:
+            return None
+        bill, stored_at = decoded
+        return bill, max(time.time() - stored_at, 0.0)
+
+    async def set_bill(self, key: str, bill: BillInfo) -> None:
+        await self._set(
+            f"bill:{key}", encode_bill(bill, time.time()), settings.BILL_CACHE_TTL
+        )
+
+    async def get_sponsor(self, person_id: str) -> Optional[str]:
+        data = await self._get(f"sponsor:{person_id}")
+        if data is None:
+            return None
+        try:
+            return data.decode()
+        except UnicodeDecodeError:
+            self.errors += 1
+            logger.warning(f"Shared cache entry for sponsor {person_id} is not text")
+            return None
+
+    async def set_sponsor(self, person_id: str, party: str) -> None:
+        await self._set(
+            f"sponsor:{person_id}", party.encode(), settings.SPONSOR_CACHE_TTL
+        )
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+_shared: Optional[SharedCache] = None
+
+
+def open_shared_cache(url: Optional[str] = None) -> Optional[SharedCache]:
+    """Open the tier at SHARED_CACHE_URL; it is disabled when the URL is empty"""
+    global _shared
+    url = settings.SHARED_CACHE_URL if url is None else url
+    if _shared is None and url:
+        _shared = SharedCache(
+            create_backend(url),
+            prefix=settings.SHARED_CACHE_PREFIX,
+            timeout=settings.SHARED_CACHE_TIMEOUT,
+        )
+        logger.info(f"Opened shared cache at {urlsplit(url).hostname or url}")
+    return _shared
+
+
+async def close_shared_cache() -> None:
+    global _shared
+    if _shared is not None:
+        await _shared.backend.close()
+        _shared = None
+
+
+def get_shared_cache() -> Optional[SharedCache]:
+    """Return the open shared cache, or None when the tier is disabled"""
+    return _shared
@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Awaitable, Callable, Iterable, Optional
+from src.config.settings import settings
+from src.models.bill import BillInfo
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS bills (
+    session TEXT NOT NULL,
+    bill_number TEXT NOT NULL,
+    bill_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    sponsor_name TEXT NOT NULL,
+    sponsor_party TEXT NOT NULL,
+    last_updated TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (session, bill_number)
+);
+CREATE INDEX IF NOT EXISTS bills_sponsor_name ON bills (sponsor_name);
+CREATE INDEX IF NOT EXISTS bills_status ON bills (status);
+CREATE INDEX IF NOT EXISTS bills_fetched_at ON bills (fetched_at);
+CREATE TABLE IF NOT EXISTS sponsors (
+    person_id TEXT PRIMARY KEY,
+    party TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+def split_bill_key(key: str) -> tuple[str, str]:
+    """Split a "44-1/c-422" bill key into session and bill number"""
+    session, _, bill_number = key.partition("/")
+    return session, bill_number
+
+
+class BillStore:
+    """
+    SQLite store for scraped bills and sponsor parties. WAL mode lets every
+    uvicorn worker on the host read and write the same file concurrently.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def get_bill(self, key: str) -> Optional[tuple[BillInfo, float]]:
+        """Return the stored bill and when it was fetched (epoch seconds)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT bill_number, bill_type, status, sponsor_name, sponsor_party,"
+                " last_updated, fetched_at FROM bills"
+                " WHERE session = ? AND bill_number = ?",
+                split_bill_key(key),
+            ).fetchone()
+        if row is None:
+            return None
+
+        bill_info = BillInfo(
+            bill_number=row[0],
+            bill_type=row[1],
+            status=row[2],
+            sponsor_name=row[3],
+            sponsor_party=row[4],
+            last_updated=row[5],
+        )
+        return bill_info, row[6]
+
+    def put_bills(self, items: Iterable[tuple[str, BillInfo]]) -> None:
+        fetched_at = time.time()
+        rows = [
+            (
+                *split_bill_key(key),
+                bill.bill_type,
+                bill.status,
+                bill.sponsor_name,
+                bill.sponsor_party,
+                bill.last_updated,
+                fetched_at,
+            )
+            for key, bill in items
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO bills VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._conn.commit()
+
+    def put_bill(self, key: str, bill: BillInfo) -> None:
+        self.put_bills([(key, bill)])
+
+    def get_sponsor(self, person_id: str) -> Optional[tuple[str, float]]:
+        """Return the stored party and when it was fetched (epoch seconds)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT party, fetched_at FROM sponsors WHERE person_id = ?",
+                (person_id,),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def put_sponsor(self, person_id: str, party: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sponsors VALUES (?, ?, ?)",
+                (person_id, party, time.time()),
+            )
+            self._conn.commit()
+
+    def stale_bill_keys(self, max_age: float, limit: int) -> list[str]:
+        """Keys of the bills fetched longest ago, older than max_age seconds"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT session, bill_number FROM bills WHERE fetched_at < ?"
+                " ORDER BY fetched_at LIMIT ?",
+                (time.time() - max_age, limit),
+            ).fetchall()
+        return [f"{session}/{bill_number}" for session, bill_number in rows]
+
+    def count_bills(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM bills").fetchone()[0]
+
+
+_store: Optional[BillStore] = None
+
+
+def open_bill_store(path: Optional[str] = None) -> Optional[BillStore]:
+    """Open the store at BILL_STORE_PATH; the store is disabled when the path is empty"""
+    global _store
+    path = settings.BILL_STORE_PATH if path is None else path
+    if _store is None and path:
+        _store = BillStore(path)
+        logger.info(f"Opened bill store at {path}")
+    return _store
+
+
+def close_bill_store() -> None:
+    global _store
+    if _store is not None:
+        _store.close()
+        _store = None
+
+
+def get_bill_store() -> Optional[BillStore]:
+    """Return the open store, or None when persistence is disabled"""
+    return _store
+
+
+async def run_store_refresher(
+    refresh: Callable[[], Awaitable[Any]], interval: float
+) -> None:
+    """
+    Call the async `refresh` callable every `interval` seconds until cancelled,
+    logging failures instead of stopping
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await refresh()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Bill store refresh failed: {str(e)}")
@@ -0,0 +1,86 @@
+import xml.etree.ElementTree as ET
+from typing import Any, AsyncIterable, AsyncIterator, Iterable
+from src.scraper.xmlparse import PARSE_ERRORS, lxml_pull_parser, use_lxml
+
+
+async def read_events(
+    parser: Any, chunks: AsyncIterable[bytes]
+) -> AsyncIterator[tuple[str, Any]]:
+    """Feed a byte stream to a pull parser and yield its events"""
+    try:
+        async for chunk in chunks:
+            parser.feed(chunk)
+            for event in parser.read_events():
+                yield event
+        parser.close()
+    except PARSE_ERRORS as e:
+        # Report lxml errors as ET.ParseError too
+        raise ET.ParseError(str(e)) from e
+    for event in parser.read_events():
+        yield event
+
+
+async def iter_bill_elements(
+    chunks: AsyncIterable[bytes], tag: str = "Bill"
+) -> AsyncIterator[ET.Element]:
+    """
+    Incrementally parse an XML byte stream and yield each top-level <Bill>
+    element as soon as it is complete.
+
+    A yielded element is only valid until the next one is requested: it is then
+    cleared and detached from the root, so memory use stays flat no matter how
+    many bills the feed holds. Copy out anything needed later.
+    Elements come from lxml when it is the selected XML backend.
+    """
+    if use_lxml():
+        async for elem in iter_lxml_elements(chunks, tag):
+            yield elem
+        return
+
+    parser = ET.XMLPullParser(events=("start", "end"))
+    root = None
+    depth = 0
+
+    async for event, elem in read_events(parser, chunks):
+        if event == "start":
+            if root is None:
+                root = elem
+            depth += 1
+            continue
+
+        depth -= 1
+        if depth == 1 and elem.tag == tag:
+            yield elem
+            elem.clear()
+            root.remove(elem)
+
+
+async def iter_lxml_elements(
+    chunks: AsyncIterable[bytes], tag: str
+) -> AsyncIterator[Any]:
+    """
+    iter_bill_elements for lxml, which can filter events by tag in C and find
+    an element's parent, so only the end of each `tag` element is reported
+    """
+    async for _, elem in read_events(lxml_pull_parser(tag), chunks):
+        parent = elem.getparent()
+        if parent is None or parent.getparent() is not None:
+            continue
+        yield elem
+        elem.clear()
+        parent.remove(elem)
+
+
+async def iter_file_chunks(
+    path: str, chunk_size: int = 64 * 1024
+) -> AsyncIterator[bytes]:
+    """Read a local file as an async byte stream"""
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+async def iter_bytes(data: Iterable[bytes]) -> AsyncIterator[bytes]:
+    """Wrap in-memory chunks as an async byte stream"""
+    for chunk in data:
+        yield chunk
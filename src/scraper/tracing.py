@@ -0,0 +1,126 @@
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, ContextManager, Iterator, Optional
+from src.config.settings import settings
+from src.scraper.metrics import stage_seconds
+
+logger = logging.getLogger(__name__)
+
+_NOOP = nullcontext()
+
+
+@dataclass
+class Span:
+    name: str
+    start: float
+    depth: int
+    duration: Optional[float] = None
+
+
+@dataclass
+class Trace:
+    """Span timings of one API request, recorded when TRACING_ENABLED is on"""
+
+    name: str
+    started: float = field(default_factory=time.perf_counter)
+    spans: list[Span] = field(default_factory=list)
+    duration: Optional[float] = None
+    depth: int = 0
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        span = Span(name, time.perf_counter() - self.started, self.depth)
+        self.spans.append(span)
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            span.duration = time.perf_counter() - self.started - span.start
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "duration_ms": _ms(self.duration),
+            "spans": [
+                {
+                    "name": span.name,
+                    "start_ms": _ms(span.start),
+                    "duration_ms": _ms(span.duration),
+                    "depth": span.depth,
+                }
+                for span in self.spans
+            ],
+        }
+
+    def format(self) -> str:
+        lines = [f"{self.name} {_ms(self.duration)}ms"]
+        for span in self.spans:
+            lines.append(
+                f"  {'  ' * span.depth}{span.name}: {_ms(span.duration)}ms"
+                f" (at +{_ms(span.start)}ms)"
+            )
+        return "\n".join(lines)
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds * 1000, 3)
+
+
+_trace: ContextVar[Optional[Trace]] = ContextVar("trace", default=None)
+
+# Most recent requests slower than TRACE_SLOW_THRESHOLD
+slow_traces: deque[Trace] = deque(maxlen=50)
+
+
+@contextmanager
+def request_trace(name: str) -> Iterator[Optional[Trace]]:
+    """
+    Trace the request run inside the block when TRACING_ENABLED is on, and dump
+    the trace to the log if it took longer than TRACE_SLOW_THRESHOLD seconds
+    """
+    if not settings.TRACING_ENABLED:
+        yield None
+        return
+
+    trace = Trace(name)
+    token = _trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _trace.reset(token)
+        trace.duration = time.perf_counter() - trace.started
+        if trace.duration >= settings.TRACE_SLOW_THRESHOLD:
+            slow_traces.append(trace)
+            logger.warning(f"Slow request: {trace.format()}")
+
+
+def clear_trace() -> None:
+    """Detach background work from the trace of the request that started it"""
+    _trace.set(None)
+
+
+def span(name: str) -> ContextManager[None]:
+    """Time a block in the current trace; a shared no-op outside of one"""
+    trace = _trace.get()
+    if trace is None:
+        return _NOOP
+    return trace.span(name)
+
+
+@contextmanager
+def _traced_stage(trace: Trace, name: str) -> Iterator[None]:
+    with trace.span(name), stage_seconds.time(name):
+        yield
+
+
+def stage(name: str) -> ContextManager[None]:
+    """Time a stage of a bill lookup in the stage histogram and the current trace"""
+    trace = _trace.get()
+    if trace is None:
+        return stage_seconds.time(name)
+    return _traced_stage(trace, name)
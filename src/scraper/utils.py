@@ -1,5 +1,89 @@
-from typing import Optional
-import re
+from typing import NamedTuple, Optional
+
+BILL_URL_PREFIX = "https://www.parl.ca/legisinfo/en/bill/"
+
+# Hosts and path segments LegisInfo bill pages are published under
+BILL_HOSTS = {"parl.ca", "www.parl.ca"}
+BILL_SEGMENTS = {"bill", "projet-de-loi"}
+
+
+class BillId(NamedTuple):
+    """Canonical identity of a bill, e.g. BillId(44, 1, "c-422")"""
+
+    parliament: int
+    session: int
+    number: str
+
+    @property
+    def key(self) -> str:
+        """Cache and store key, e.g. "44-1/c-422" """
+        return f"{self.parliament}-{self.session}/{self.number}"
+
+    @property
+    def url(self) -> str:
+        return f"{BILL_URL_PREFIX}{self.key}"
+
+    @property
+    def xml_url(self) -> str:
+        return f"{self.url}/xml"
+
+
+def _is_number(value: str) -> bool:
+    return value.isascii() and value.isdigit()
+
+
+def _parse_session(value: str) -> Optional[tuple[int, int]]:
+    parliament, dash, session = value.partition("-")
+    if dash and _is_number(parliament) and _is_number(session):
+        return int(parliament), int(session)
+    return None
+
+
+def _parse_number(value: str) -> Optional[str]:
+    chamber, dash, number = value.partition("-")
+    if dash and chamber in ("c", "s") and _is_number(number):
+        return f"{chamber}-{int(number)}"
+    return None
+
+
+def _parse_parts(session: str, number: str) -> Optional[BillId]:
+    parsed_session = _parse_session(session)
+    parsed_number = _parse_number(number)
+    if parsed_session is None or parsed_number is None:
+        return None
+    return BillId(*parsed_session, parsed_number)
+
+
+def parse_bill_id(value: str) -> Optional[BillId]:
+    """
+    Normalize a LegisInfo bill URL or a "<session>/<bill number>" identifier to
+    a BillId. Case, scheme, the "www." prefix, English or French paths, a
+    trailing slash or "/xml", query strings and fragments are all accepted, so
+    every variant of a bill maps to the same key.
+    Returns None if the value is not recognized.
+    """
+    value = value.strip().lower()
+    for separator in ("#", "?"):
+        value = value.partition(separator)[0]
+
+    scheme, found, rest = value.partition("://")
+    if not found:
+        parts = value.strip("/").split("/")
+        return _parse_parts(*parts) if len(parts) == 2 else None
+    if scheme not in ("http", "https"):
+        return None
+
+    host, _, path = rest.partition("/")
+    if host not in BILL_HOSTS:
+        return None
+
+    # /legisinfo/<language>/bill/<session>/<number>[/xml]
+    parts = [part for part in path.split("/") if part]
+    if parts and parts[-1] == "xml":
+        parts.pop()
+    if len(parts) != 5 or parts[0] != "legisinfo" or parts[2] not in BILL_SEGMENTS:
+        return None
+    return _parse_parts(parts[3], parts[4])
 
 
 def extract_bill_number(url: str) -> Optional[str]:
@@ -7,5 +91,24 @@ def extract_bill_number(url: str) -> Optional[str]:
     Extract bill number from URL.
     Returns None if no match is found.
     """
-    match = re.search(r"/bill/\d+-\d+/([a-z]-\d+)", url)
-    return match.group(1) if match else None
+    bill_id = parse_bill_id(url)
+    return bill_id.number if bill_id else None
+
+
+def extract_bill_key(url: str) -> Optional[str]:
+    """
+    Extract a normalized "<session>/<bill number>" cache key from URL,
+    e.g. "44-1/c-422". Returns None if no match is found.
+    """
+    bill_id = parse_bill_id(url)
+    return bill_id.key if bill_id else None
+
+
+def resolve_bill_url(identifier: str) -> Optional[str]:
+    """
+    Turn a LegisInfo bill URL or a "<session>/<bill number>" identifier
+    (e.g. "44-1/c-422") into the canonical bill URL.
+    Returns None if the identifier is not recognized.
+    """
+    bill_id = parse_bill_id(identifier)
+    return bill_id.url if bill_id else None
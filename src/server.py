@@ -0,0 +1,129 @@
+import argparse
+import importlib.util
+import logging
+import os
+from typing import IO, Any, Optional
+import uvicorn
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def default_workers() -> int:
+    """WORKERS, or one worker per CPU core available to this process"""
+    if settings.WORKERS > 0:
+        return settings.WORKERS
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def background_lock_path() -> str:
+    """BACKGROUND_LOCK_PATH, or a lock next to the bill store; empty for none"""
+    if settings.BACKGROUND_LOCK_PATH:
+        return settings.BACKGROUND_LOCK_PATH
+    if settings.BILL_STORE_PATH:
+        return f"{settings.BILL_STORE_PATH}.lock"
+    return ""
+
+
+_background_lock: Optional[IO] = None
+
+
+def acquire_background_lock(path: Optional[str] = None) -> bool:
+    """
+    Whether this process should run work shared by all workers, such as the
+    store refresher. The first worker to take the lock keeps it until it
+    exits; without a lock path every process does.
+    """
+    global _background_lock
+    path = background_lock_path() if path is None else path
+    if _background_lock is not None or not path:
+        return True
+    try:
+        import fcntl
+    except ImportError:
+        logger.warning("File locks are unavailable, every worker refreshes the store")
+        return True
+
+    lock = open(path, "a")
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock.close()
+        return False
+    _background_lock = lock
+    return True
+
+
+def release_background_lock() -> None:
+    global _background_lock
+    if _background_lock is not None:
+        _background_lock.close()
+        _background_lock = None
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run the Parliament Bill Scraper API with multiple workers"
+    )
+    parser.add_argument("--host", default=settings.HOST)
+    parser.add_argument("--port", type=int, default=settings.PORT)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: WORKERS, or one per CPU core)",
+    )
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument(
+        "--access-log", action="store_true", help="Log every request (slower)"
+    )
+    return parser.parse_args(argv)
+
+
+def server_options(args: argparse.Namespace) -> dict[str, Any]:
+    """
+    uvicorn options for a production run: no reloader, uvloop and httptools
+    when installed, and a bounded graceful shutdown
+    """
+    return {
+        "host": args.host,
+        "port": args.port,
+        "workers": args.workers or default_workers(),
+        "loop": "uvloop" if installed("uvloop") else "asyncio",
+        "http": "httptools" if installed("httptools") else "h11",
+        "lifespan": "on",
+        "timeout_graceful_shutdown": max(int(settings.SHUTDOWN_DRAIN_TIMEOUT), 1),
+        "log_level": args.log_level,
+        "access_log": args.access_log,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """
+    Production entry point. Each worker is a separate process with its own
+    in-process caches, pre-warmed and kept fresh by its own watch list; set
+    SHARED_CACHE_URL so workers share results. One worker refreshes the bill
+    store, and each gets an equal share of UPSTREAM_RATE_LIMIT. On SIGTERM a worker stops accepting
+    connections, lets in-flight requests and background refreshes finish
+    within SHUTDOWN_DRAIN_TIMEOUT, then exits.
+    """
+    options = server_options(parse_args(argv))
+    # Workers read their settings from the environment they inherit
+    os.environ["WORKERS"] = str(options["workers"])
+    logger.info(
+        f"Starting {options['workers']} workers on {options['host']}:{options['port']}"
+        f" (loop={options['loop']}, http={options['http']})"
+    )
+    uvicorn.run("src.main:app", **options)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
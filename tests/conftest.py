@@ -1,9 +1,62 @@
+import httpx
 import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
 from src.main import app
+from src.scraper.cache import bill_cache, sponsor_cache, validator_cache
+from src.scraper.fastjson import bill_json_cache
+from src.scraper.limits import reset_host_limiters
+from src.scraper.metrics import reset_metrics
+from src.scraper.parser import revalidation_stats
+from src.scraper.records import bill_table
+from src.scraper.resilience import reset_resilience
+from src.scraper.shared_cache import close_shared_cache, open_shared_cache
+from src.scraper.singleflight import bill_flight, sponsor_flight
+from src.scraper.store import close_bill_store, open_bill_store
 import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Optional
+
+MOCKS = Path(__file__).parent / "mocks"
+
+# Upstream documents, also served by the benchmark stand-in upstream
+MOCK_BILL_XML = (MOCKS / "bill.xml").read_text(encoding="utf-8")
+MOCK_MP_XML = (MOCKS / "mp_profile.xml").read_text(encoding="utf-8")
+
+MOCK_SENATE_BILL_XML = """<?xml version="1.0" encoding="utf-8"?>
+    <Bills>
+        <Bill>
+            <NumberCode>S-2</NumberCode>
+            <BillDocumentTypeName>Senate Public Bill</BillDocumentTypeName>
+            <StatusName>Royal Assent</StatusName>
+            <SponsorPersonId>senate-1234</SponsorPersonId>
+            <SponsorPersonName>Hon. Senator Smith</SponsorPersonName>
+            <LatestBillEventDateTime>2024-01-01T00:00:00</LatestBillEventDateTime>
+            <IsSenateBill>true</IsSenateBill>
+        </Bill>
+    </Bills>"""
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """Start every test with empty in-process caches"""
+    bill_cache.clear()
+    sponsor_cache.clear()
+    validator_cache.clear()
+    bill_json_cache.clear()
+    bill_table.clear()
+    bill_flight.reset()
+    sponsor_flight.reset()
+    for counter in revalidation_stats:
+        revalidation_stats[counter] = 0
+    reset_host_limiters()
+    reset_resilience()
+    reset_metrics()
+    yield
+    bill_cache.clear()
+    sponsor_cache.clear()
+    validator_cache.clear()
 
 
 @pytest.fixture
@@ -28,51 +81,19 @@ def sample_bill_url():
 @pytest.fixture
 def mock_bill_xml():
     """Mock bill XML response"""
-    return """<?xml version="1.0" encoding="utf-8"?>
-    <Bills>
-        <Bill>
-            <NumberCode>C-422</NumberCode>
-            <BillDocumentTypeName>Private Member's Bill</BillDocumentTypeName>
-            <StatusName>Outside the Order of Precedence</StatusName>
-            <SponsorPersonId>105837</SponsorPersonId>
-            <SponsorPersonOfficialFirstName>Bonita</SponsorPersonOfficialFirstName>
-            <SponsorPersonOfficialLastName>Zarrillo</SponsorPersonOfficialLastName>
-            <SponsorPersonName>Bonita Zarrillo</SponsorPersonName>
-            <LatestBillEventDateTime>2024-12-02T11:00:00</LatestBillEventDateTime>
-            <IsSenateBill>false</IsSenateBill>
-        </Bill>
-    </Bills>"""
+    return MOCK_BILL_XML
 
 
 @pytest.fixture
 def mock_mp_xml():
     """Mock MP XML profile response"""
-    return """<?xml version="1.0" encoding="utf-8"?>
-    <Profile>
-        <MemberOfParliamentRole>
-            <CaucusShortName>NDP</CaucusShortName>
-            <PersonOfficialFirstName>Bonita</PersonOfficialFirstName>
-            <PersonOfficialLastName>Zarrillo</PersonOfficialLastName>
-            <ConstituencyName>Port Moody—Coquitlam</ConstituencyName>
-        </MemberOfParliamentRole>
-    </Profile>"""
+    return MOCK_MP_XML
 
 
 @pytest.fixture
 def mock_senate_bill_xml():
     """Mock Senate bill XML response"""
-    return """<?xml version="1.0" encoding="utf-8"?>
-    <Bills>
-        <Bill>
-            <NumberCode>S-2</NumberCode>
-            <BillDocumentTypeName>Senate Public Bill</BillDocumentTypeName>
-            <StatusName>Royal Assent</StatusName>
-            <SponsorPersonId>senate-1234</SponsorPersonId>
-            <SponsorPersonName>Hon. Senator Smith</SponsorPersonName>
-            <LatestBillEventDateTime>2024-01-01T00:00:00</LatestBillEventDateTime>
-            <IsSenateBill>true</IsSenateBill>
-        </Bill>
-    </Bills>"""
+    return MOCK_SENATE_BILL_XML
 
 
 @pytest.fixture
@@ -80,3 +101,69 @@ def mock_bill_element(mock_bill_xml):
     """Parsed bill element for testing"""
     root = ET.fromstring(mock_bill_xml)
     return root.find("Bill")
+
+
+class MockResponse:
+    """Stand-in for the httpx.Response returned by a patched AsyncClient.get"""
+
+    status_code = 200
+    headers: dict = {}
+
+    def __init__(self, text: str):
+        self.text = text
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode()
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+@pytest.fixture
+def mock_upstream_response(mock_bill_xml, mock_mp_xml):
+    """Response for an upstream URL: the bill fixture from parl.ca, the MP profile otherwise"""
+
+    def respond(url: str, text: Optional[str] = None) -> MockResponse:
+        if text is None:
+            text = mock_bill_xml if "parl.ca" in url else mock_mp_xml
+        return MockResponse(text)
+
+    return respond
+
+
+@pytest.fixture
+def mock_upstream_client(mock_bill_xml, mock_mp_xml):
+    """Client factory serving the bill and MP profile fixtures, logging URLs to `calls`"""
+
+    def make_client(calls: list) -> httpx.AsyncClient:
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(str(request.url))
+            if "parl.ca" in request.url.host:
+                return httpx.Response(200, text=mock_bill_xml)
+            return httpx.Response(200, text=mock_mp_xml)
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    return make_client
+
+
+@pytest.fixture
+def session_feed_path():
+    """Path to a local LegisInfo session feed fixture"""
+    return str(MOCKS / "session_bills.xml")
+
+
+@pytest.fixture
+def bill_store(tmp_path):
+    """Persistent bill store in a temporary directory"""
+    store = open_bill_store(str(tmp_path / "bills.db"))
+    yield store
+    close_bill_store()
+
+
+@pytest_asyncio.fixture
+async def shared_cache():
+    """Shared cache tier on the in-memory backend"""
+    yield open_shared_cache("memory://")
+    await close_shared_cache()
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import pytest
+from unittest.mock import patch
+from typing import Any
+from src.scraper.batch import iter_batch_items, scrape_bills
+
+
+def make_mock_get(mock_upstream_response, calls: list):
+    """Serve the bill fixture for every bill except c-999, which is invalid XML"""
+
+    async def mock_get(*args: Any, **kwargs: Any):
+        url = args[0]
+        calls.append(url)
+        if "c-999" in url:
+            return mock_upstream_response(url, "Invalid XML")
+        return mock_upstream_response(url)
+
+    return mock_get
+
+
+def test_batch_endpoint(app_client, mock_upstream_response):
+    """Test per-item results and errors in request order"""
+    calls = []
+    bills = [
+        "https://www.parl.ca/legisinfo/en/bill/44-1/c-422",
+        "44-1/c-422",
+        "44-1/c-999",
+        "not-a-bill",
+    ]
+
+    with patch(
+        "httpx.AsyncClient.get",
+        side_effect=make_mock_get(mock_upstream_response, calls),
+    ):
+        response = app_client.post("/api/bills/batch", json={"bills": bills})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [item["bill"] for item in results] == bills
+    assert results[0]["result"]["sponsor_party"] == "NDP"
+    assert results[1]["result"] == results[0]["result"]
+    assert results[2]["status_code"] == 500
+    assert results[3]["status_code"] == 400
+    # c-422 and its sponsor once, c-999 once
+    assert len(calls) == 3
+
+
+def test_batch_endpoint_too_large(app_client):
+    """Test oversized batches are rejected"""
+    with patch("src.api.endpoints.settings.BATCH_MAX_ITEMS", 1):
+        response = app_client.post(
+            "/api/bills/batch", json={"bills": ["44-1/c-1", "44-1/c-2"]}
+        )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_scrape_bills_bounded_concurrency(mock_upstream_response):
+    """Test no more than `concurrency` bill fetches run at once"""
+    active = 0
+    peak = 0
+
+    async def mock_get(*args: Any, **kwargs: Any):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return mock_upstream_response(args[0])
+
+    bills = [f"44-1/c-{number}" for number in range(1, 21)]
+    with patch("httpx.AsyncClient.get", side_effect=mock_get):
+        results = await scrape_bills(bills, concurrency=3)
+
+    assert all(item.status_code == 200 for item in results)
+    assert peak <= 3
+
+
+def test_stream_endpoint(app_client, mock_upstream_response):
+    """Test the streaming endpoint writes one JSON line per bill"""
+    calls = []
+    bills = ["44-1/c-422", "44-1/c-999", "not-a-bill"]
+
+    with patch(
+        "httpx.AsyncClient.get",
+        side_effect=make_mock_get(mock_upstream_response, calls),
+    ):
+        response = app_client.post("/api/bills/stream", json={"bills": bills})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    items = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(item["bill"] for item in items) == sorted(bills)
+    by_bill = {item["bill"]: item for item in items}
+    assert by_bill["44-1/c-422"]["result"]["bill_number"] == "c-422"
+    assert by_bill["not-a-bill"]["status_code"] == 400
+
+
+@pytest.mark.asyncio
+async def test_iter_batch_items_completion_order(mock_upstream_response):
+    """Test results are yielded as they complete, not in request order"""
+
+    async def mock_get(*args: Any, **kwargs: Any):
+        if "/c-1/" in args[0]:
+            await asyncio.sleep(0.05)
+        return mock_upstream_response(args[0])
+
+    with patch("httpx.AsyncClient.get", side_effect=mock_get):
+        items = [item async for item in iter_batch_items(["44-1/c-1", "44-1/c-2"])]
+
+    assert [item.bill for item in items] == ["44-1/c-2", "44-1/c-1"]
+
+
+@pytest.mark.asyncio
+async def test_iter_batch_items_backpressure(mock_upstream_response):
+    """Test workers stop scraping while the consumer is not reading"""
+    calls = []
+
+    with patch(
+        "httpx.AsyncClient.get",
+        side_effect=make_mock_get(mock_upstream_response, calls),
+    ):
+        stream = iter_batch_items(
+            [f"44-1/c-{number}" for number in range(1, 51)],
+            concurrency=2,
+            buffer_size=2,
+        )
+        await stream.__anext__()
+        await asyncio.sleep(0.05)
+        await stream.aclose()
+
+    bill_calls = [url for url in calls if "parl.ca" in url]
+    # one consumed, two buffered and at most one blocked per worker
+    assert len(bill_calls) <= 5
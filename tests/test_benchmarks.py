@@ -0,0 +1,59 @@
+import argparse
+import pytest
+from unittest.mock import patch
+from benchmarks.memory import run as run_memory
+from benchmarks.pipeline import run
+from benchmarks.search import run as run_search
+from benchmarks.serialization import run as run_serialization
+
+
+@pytest.mark.asyncio
+async def test_pipeline_benchmark_smoke():
+    """Test a tiny benchmark run reports every scenario without errors"""
+    args = argparse.Namespace(
+        concurrency=[2],
+        requests=6,
+        batch_size=3,
+        latency=0.0,
+        jitter=0.0,
+        sponsors=2,
+        rate_limit=0.0,
+        trace_memory=True,
+    )
+    with patch("benchmarks.pipeline.settings.UPSTREAM_RATE_LIMIT", 10.0):
+        report = await run(args)
+
+    results = {result["scenario"]: result for result in report["results"]}
+    assert set(results) == {"bill_cold", "bill_warm", "batch_cold"}
+    assert all(result["errors"] == 0 for result in results.values())
+    # 6 bills plus 2 shared sponsors upstream, nothing once warm
+    assert results["bill_cold"]["upstream_calls_per_request"] == pytest.approx(8 / 6)
+    assert results["bill_warm"]["upstream_calls"] == {}
+    assert results["batch_cold"]["requests"] == 2
+    assert all(result["peak_memory_mb"] > 0 for result in results.values())
+
+
+@pytest.mark.asyncio
+async def test_serialization_benchmark_smoke():
+    """Test the serialization benchmark times every approach and both modes"""
+    results = await run_serialization(count=5, repeat=1)
+
+    assert set(results["serialize_us"]) >= {"response_model", "cached_bytes"}
+    assert set(results["request_cpu_us"]) == {"default", "fast_json"}
+
+
+def test_memory_benchmark_smoke():
+    """Test the memory benchmark finds records smaller than BillInfo models"""
+    results = run_memory(bills=500)
+
+    assert results["bills"] == 500
+    assert results["records"]["mb"] < results["billinfo"]["mb"]
+
+
+@pytest.mark.asyncio
+async def test_search_benchmark_smoke():
+    """Test the search benchmark runs every query through the table and the app"""
+    results = await run_search(bills=300, repeat=1)
+
+    assert results["queries"]["all"]["matches"] == 300
+    assert all(timings["request_us"] > 0 for timings in results["queries"].values())
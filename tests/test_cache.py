@@ -0,0 +1,176 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+import xml.etree.ElementTree as ET
+from typing import Any
+from src.models.bill import BillInfo
+from src.scraper.cache import TTLCache, bill_cache, sponsor_cache
+from src.scraper.parser import (
+    _revalidations,
+    get_sponsor_party,
+    prewarm_sponsor_cache,
+    scrape_bill_info,
+    scrape_bill_info_swr,
+)
+
+
+def test_ttl_cache_hit_and_miss():
+    """Test basic hit/miss accounting"""
+    cache = TTLCache(maxsize=2, ttl=60)
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_ttl_cache_lru_eviction():
+    """Test least recently used entries are evicted first"""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.evictions == 1
+
+
+def test_ttl_cache_expiry():
+    """Test entries expire after their own TTL"""
+    cache = TTLCache(maxsize=2, ttl=60)
+    with patch("src.scraper.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1, ttl=5)
+    with patch("src.scraper.cache.time.monotonic", return_value=106.0):
+        assert cache.get("a") is None
+    assert cache.expirations == 1
+
+
+@pytest.mark.asyncio
+async def test_scrape_bill_info_uses_cache(mock_upstream_response):
+    """Test repeated lookups of the same bill do not touch the network"""
+    calls = []
+
+    async def mock_get(*args: Any, **kwargs: Any):
+        calls.append(args[0])
+        return mock_upstream_response(args[0])
+
+    with patch("httpx.AsyncClient.get", side_effect=mock_get):
+        first = await scrape_bill_info(
+            "https://www.parl.ca/legisinfo/en/bill/44-1/c-422"
+        )
+        second = await scrape_bill_info(
+            "https://www.parl.ca/legisinfo/en/bill/44-1/C-422"
+        )
+
+    assert first == second
+    assert len(calls) == 2  # bill XML + sponsor profile, once
+    assert bill_cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sponsor_cache_shared_across_bills(
+    mock_bill_element: ET.Element, mock_upstream_response
+):
+    """Test the sponsor profile is fetched once per SponsorPersonId"""
+    calls = []
+
+    async def mock_get(*args: Any, **kwargs: Any):
+        calls.append(args[0])
+        return mock_upstream_response(args[0])
+
+    with patch("httpx.AsyncClient.get", side_effect=mock_get):
+        assert await get_sponsor_party(mock_bill_element) == "NDP"
+        assert await get_sponsor_party(mock_bill_element) == "NDP"
+
+    assert len(calls) == 1
+    assert sponsor_cache.get("105837") == "NDP"
+
+
+@pytest.mark.asyncio
+async def test_prewarm_sponsor_cache(mock_upstream_response):
+    """Test pre-warming resolves parties by person ID"""
+
+    async def mock_get(*args: Any, **kwargs: Any):
+        return mock_upstream_response(args[0])
+
+    with patch("httpx.AsyncClient.get", side_effect=mock_get):
+        resolved = await prewarm_sponsor_cache(["105837", "12345"])
+
+    assert resolved == 2
+    assert "105837" in sponsor_cache
+    assert "12345" in sponsor_cache
+
+
+def test_ttl_cache_get_stale():
+    """Test expired entries are served stale only within the grace period"""
+    cache = TTLCache(maxsize=2, ttl=10, grace=20)
+    with patch("src.scraper.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+        assert cache.get_stale("a") is None  # still fresh
+    with patch("src.scraper.cache.time.monotonic", return_value=115.0):
+        assert cache.get("a") is None
+        assert cache.get_stale("a") == (1, 15.0)
+    with patch("src.scraper.cache.time.monotonic", return_value=131.0):
+        assert cache.get_stale("a") is None
+        assert cache.get("a") is None
+    assert cache.stale_hits == 1
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate(mock_upstream_response):
+    """Test stale bills are served at once and refreshed by one background task"""
+    calls = []
+
+    async def mock_get(*args: Any, **kwargs: Any):
+        calls.append(args[0])
+        return mock_upstream_response(args[0])
+
+    url = "https://www.parl.ca/legisinfo/en/bill/44-1/c-422"
+    old = BillInfo(bill_number="c-422", status="Old status")
+    bill_cache.set("44-1/c-422", old, ttl=-1)
+
+    with patch("httpx.AsyncClient.get", side_effect=mock_get):
+        results = await asyncio.gather(*(scrape_bill_info_swr(url) for _ in range(5)))
+        assert all(bill == old and age is not None for bill, age in results)
+        await asyncio.gather(*_revalidations.values())
+
+        bill, age = await scrape_bill_info_swr(url)
+
+    assert age is None
+    assert bill.status == "Outside the Order of Precedence"
+    assert len([call for call in calls if "parl.ca" in call]) == 1
+
+
+def test_stale_response_headers(app_client):
+    """Test stale responses are flagged with headers"""
+    bill_cache.set("44-1/c-422", BillInfo(bill_number="c-422"), ttl=-1)
+
+    with patch("src.scraper.parser.revalidate_bill") as revalidate:
+        response = app_client.get(
+            "/api/bill?url=https://www.parl.ca/legisinfo/en/bill/44-1/c-422"
+        )
+
+    revalidate.assert_called_once()
+    assert response.status_code == 200
+    assert response.headers["X-Cache-Status"] == "stale"
+    assert "Age" in response.headers
+
+
+@pytest.mark.parametrize("fast_json", [False, True])
+def test_stale_response_headers_with_fields(app_client, fast_json):
+    """Test a field selection keeps the stale headers"""
+    bill_cache.set("44-1/c-422", BillInfo(bill_number="c-422"), ttl=-1)
+
+    with patch("src.scraper.parser.revalidate_bill"), patch(
+        "src.api.endpoints.settings.FAST_JSON", fast_json
+    ):
+        response = app_client.get(
+            "/api/bill?url=https://www.parl.ca/legisinfo/en/bill/44-1/c-422"
+            "&fields=bill_number"
+        )
+
+    assert response.json() == {"bill_number": "c-422"}
+    assert response.headers["X-Cache-Status"] == "stale"
+    assert "Age" in response.headers
@@ -0,0 +1,38 @@
+from fastapi.testclient import TestClient
+from src.config.settings import settings
+from src.main import app
+from src.scraper.client import (
+    close_http_client,
+    create_http_client,
+    get_http_client,
+)
+
+
+def test_create_http_client_uses_settings():
+    """Test pool limits and headers come from Settings"""
+    client = create_http_client()
+    pool = client._transport._pool
+    assert pool._max_connections == settings.HTTP_MAX_CONNECTIONS
+    assert pool._max_keepalive_connections == settings.HTTP_MAX_KEEPALIVE_CONNECTIONS
+    assert client.headers["User-Agent"] == settings.USER_AGENT
+
+
+def test_get_http_client_is_shared():
+    """Test the lazily created client is reused between calls"""
+    assert get_http_client() is get_http_client()
+
+
+async def test_close_http_client():
+    """Test closing the shared client creates a fresh one on next use"""
+    client = get_http_client()
+    await close_http_client()
+    assert client.is_closed
+    assert get_http_client() is not client
+
+
+def test_lifespan_manages_client():
+    """Test the app lifespan opens and closes the shared client"""
+    with TestClient(app):
+        client = app.state.http_client
+        assert not client.is_closed
+    assert client.is_closed
@@ -0,0 +1,115 @@
+import asyncio
+import httpx
+import pytest
+import xml.etree.ElementTree as ET
+from fastapi import HTTPException
+from unittest.mock import patch
+from src.scraper.cache import bill_cache, sponsor_cache
+from src.scraper.deadline import (
+    DeadlineExceeded,
+    remaining,
+    request_deadline,
+    request_timeout,
+)
+from src.scraper.parser import fetch_bill_info, get_sponsor_party, scrape_bill_info
+from src.scraper.resilience import resilient_get
+
+URL = "https://www.parl.ca/legisinfo/en/bill/44-1/c-422"
+
+
+def test_nested_deadlines_keep_the_earliest():
+    """Test an inner deadline cannot extend the outer one"""
+    assert remaining() is None
+    with request_deadline(1):
+        with request_deadline(60):
+            assert remaining() <= 1
+        with request_deadline(0.5):
+            assert remaining() <= 0.5
+    assert remaining() is None
+
+
+def test_timeouts_capped_by_budget():
+    """Test per-phase timeouts shrink to what is left of the budget"""
+    timeout = request_timeout()
+    assert timeout.connect == 5.0
+    assert timeout.read == 10.0
+
+    with request_deadline(2):
+        timeout = request_timeout()
+    assert timeout.connect <= 2
+    assert timeout.read <= 2
+
+
+@pytest.mark.asyncio
+async def test_skips_sponsor_lookup_when_budget_is_low(
+    mock_bill_element: ET.Element,
+):
+    """Test the sponsor fetch is skipped, falling back to the sponsor cache"""
+    requests = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal requests
+        requests += 1
+        return httpx.Response(500)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with request_deadline(0.5):
+        assert await get_sponsor_party(mock_bill_element, client) == "Unknown"
+        sponsor_cache.set("105837", "NDP")
+        assert await get_sponsor_party(mock_bill_element, client) == "NDP"
+    assert requests == 0
+
+
+@pytest.mark.asyncio
+async def test_bill_without_sponsor_lookup_not_cached(mock_bill_xml, mock_mp_xml):
+    """Test a bill degraded by a skipped sponsor lookup is served but not cached"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "ourcommons.ca" in str(request.url):
+            return httpx.Response(200, text=mock_mp_xml)
+        return httpx.Response(200, text=mock_bill_xml)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with request_deadline(0.5):
+        bill = await scrape_bill_info(URL, client)
+    assert bill.sponsor_party == "Unknown"
+    assert bill_cache.get("44-1/c-422") is None
+
+    bill = await scrape_bill_info(URL, client)
+    assert bill.sponsor_party == "NDP"
+    assert bill_cache.get("44-1/c-422") is not None
+
+
+@pytest.mark.asyncio
+async def test_no_retry_past_deadline():
+    """Test a retry that would outlast the budget is not attempted"""
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        return httpx.Response(503)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch("src.scraper.resilience.settings.UPSTREAM_RETRY_BACKOFF", 10):
+        with patch("src.scraper.resilience.random.uniform", lambda a, b: b):
+            with request_deadline(1):
+                with pytest.raises(DeadlineExceeded):
+                    await resilient_get(client, f"{URL}/xml")
+    assert attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_upstream_hits_deadline():
+    """Test a bill fetch slower than the budget fails with 504"""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.2)
+        return httpx.Response(503)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch("src.scraper.resilience.settings.UPSTREAM_RETRY_BACKOFF", 0.001):
+        with request_deadline(0.3):
+            with pytest.raises(HTTPException) as exc_info:
+                await fetch_bill_info(URL, client)
+    assert exc_info.value.status_code == 504
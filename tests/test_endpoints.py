@@ -1,6 +1,8 @@
 import pytest
 from unittest.mock import patch
 import httpx
+from src.models.bill import BillInfo
+from src.scraper.records import bill_table
 
 
 @pytest.mark.asyncio
@@ -24,6 +26,11 @@ async def test_get_bill_info_valid(
     async def mock_get(*args, **kwargs):
         class MockResponse:
             status_code = 200
+            headers: dict = {}
+
+            @property
+            def content(self) -> bytes:
+                return self.text.encode()
 
             def __init__(self, url):
                 self.url = url
@@ -62,6 +69,12 @@ async def test_get_senate_bill(
     async def mock_get(*args, **kwargs):
         class MockResponse:
             status_code = 200
+            headers: dict = {}
+
+            @property
+            def content(self) -> bytes:
+                return self.text.encode()
+
             text = mock_senate_bill_xml
 
             def raise_for_status(self):
@@ -155,6 +168,12 @@ async def test_xml_parsing_error(app_client):  # Changed from client to app_clie
     async def mock_invalid_xml(*args, **kwargs):
         class MockResponse:
             status_code = 200
+            headers: dict = {}
+
+            @property
+            def content(self) -> bytes:
+                return self.text.encode()
+
             text = "Invalid XML"
 
             def raise_for_status(self):
@@ -166,3 +185,74 @@ async def test_xml_parsing_error(app_client):  # Changed from client to app_clie
         response = app_client.get(f"/api/bill?url={url}")
         assert response.status_code == 500
         assert "Invalid XML" in response.json()["detail"]
+
+
+def test_fields_skip_sponsor_lookup(app_client, mock_bill_xml):
+    """Test leaving sponsor_party out of fields saves the MP profile request"""
+    from src.api.endpoints import upstream_client
+    from src.main import app
+
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(200, text=mock_bill_xml)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    app.dependency_overrides[upstream_client] = lambda: client
+    try:
+        response = app_client.get(
+            "/api/bill?url=https://parl.ca/legisinfo/en/bill/44-1/C-422/"
+            "&fields=bill_number,status"
+        )
+        assert response.status_code == 200
+        assert response.json() == {
+            "bill_number": "c-422",
+            "status": "Outside the Order of Precedence",
+        }
+
+        response = app_client.get(
+            "/api/bill?url=https://www.parl.ca/legisinfo/en/bill/44-1/c-422"
+            "&fields=sponsor_color"
+        )
+        assert response.status_code == 400
+    finally:
+        app.dependency_overrides.clear()
+
+    assert calls == ["https://www.parl.ca/legisinfo/en/bill/44-1/c-422/xml"]
+
+
+def test_search_bills(app_client):
+    """Test filtering and paging the indexed bills"""
+    for number, party in ((1, "NDP"), (2, "Liberal"), (3, "NDP")):
+        bill_table.put(
+            f"44-1/c-{number}",
+            BillInfo(
+                bill_number=f"c-{number}",
+                sponsor_party=party,
+                last_updated=f"2024-0{number}-01T00:00:00",
+            ),
+        )
+
+    response = app_client.get("/api/bills?sponsor_party=ndp&limit=1")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 2
+    assert body["limit"] == 1
+    assert body["bills"][0]["id"] == "44-1/c-3"
+    assert body["bills"][0]["sponsor_party"] == "NDP"
+
+    response = app_client.get(
+        "/api/bills?updated_since=2024-02-01&updated_before=2024-03-01"
+    )
+    assert [bill["id"] for bill in response.json()["bills"]] == ["44-1/c-2"]
+
+    # Basic and week dates are normalized before comparing
+    for since in ("20240201", "2024-W05-4", "2024-02-01T00:00"):
+        response = app_client.get(f"/api/bills?updated_since={since}")
+        assert response.json()["total"] == 2
+
+    assert app_client.get("/api/bills?updated_since=last-week").status_code == 400
+    response = app_client.get("/api/bills?updated_since=2024-02-01T00:00:00%2B05:00")
+    assert response.status_code == 400
+    assert app_client.get("/api/bills?limit=100000").status_code == 422
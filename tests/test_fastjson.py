@@ -0,0 +1,74 @@
+import httpx
+import pytest
+from unittest.mock import patch
+from src.models.bill import BillInfo
+from src.scraper import fastjson
+from src.scraper.fastjson import BillJsonCache, bill_json_cache, dump_bill
+
+BILL = BillInfo(
+    bill_number="c-422",
+    bill_type="Private Member's Bill",
+    status='Outside the "Order" of Precedence',
+    sponsor_name="Bonita Zarrillo — Port Moody",
+    sponsor_party="NDP",
+)
+
+
+@pytest.fixture(params=["orjson", "pydantic"])
+def serializer(request):
+    """Run a test with orjson and with the pydantic fallback"""
+    if request.param == "orjson" and not fastjson.orjson_available():
+        pytest.skip("orjson is not installed")
+    orjson = fastjson.orjson if request.param == "orjson" else None
+    with patch("src.scraper.fastjson.orjson", orjson):
+        yield request.param
+
+
+def test_dump_bill_matches_pydantic(serializer):
+    """Test the fast path is byte-identical to model_dump_json"""
+    assert dump_bill(BILL) == BILL.model_dump_json().encode()
+    fields = {"status", "bill_number"}
+    assert dump_bill(BILL, fields) == BILL.model_dump_json(include=fields).encode()
+
+
+def test_bill_json_cache_reuses_bytes():
+    """Test bytes are reused for the same bill object only"""
+    cache = BillJsonCache(maxsize=2)
+    first = cache.get("44-1/c-422", BILL)
+    assert cache.get("44-1/c-422", BILL) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # A refreshed bill, even an equal one, is serialized again
+    refreshed = BillInfo(**BILL.model_dump())
+    assert cache.get("44-1/c-422", refreshed) is not first
+
+    cache.get("44-1/c-1", BILL)
+    cache.get("44-1/c-2", BILL)
+    assert len(cache) == 2
+
+
+def test_fast_json_endpoint(app_client, mock_bill_xml, mock_mp_xml):
+    """Test FAST_JSON answers cache hits with the same body from stored bytes"""
+    from src.api.endpoints import upstream_client
+    from src.main import app
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "parl.ca" in request.url.host:
+            return httpx.Response(200, text=mock_bill_xml)
+        return httpx.Response(200, text=mock_mp_xml)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    app.dependency_overrides[upstream_client] = lambda: client
+    url = "/api/bill?url=https://www.parl.ca/legisinfo/en/bill/44-1/c-422"
+    try:
+        slow = app_client.get(url)
+        with patch("src.api.endpoints.settings.FAST_JSON", True):
+            fast = [app_client.get(url) for _ in range(3)]
+            fields = app_client.get(url + "&fields=status")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert all(response.content == slow.content for response in fast)
+    assert fast[0].headers["content-type"] == "application/json"
+    assert (bill_json_cache.hits, bill_json_cache.misses) == (2, 1)
+    assert fields.json() == {"status": "Outside the Order of Precedence"}
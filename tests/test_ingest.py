@@ -0,0 +1,166 @@
+import httpx
+import pytest
+import xml.etree.ElementTree as ET
+from unittest.mock import patch
+from src.api.endpoints import upstream_client
+from src.main import app
+from src.models.bill import BillInfo
+from src.scraper.cache import bill_cache, sponsor_cache
+from src.scraper.ingest import ingest_session, main, session_feed_url
+from src.scraper.limits import get_host_limiter
+from src.scraper.records import bill_table
+from src.scraper.store import BillStore, get_bill_store
+from src.scraper.stream import iter_bill_elements, iter_bytes
+
+
+def make_client(feed_path: str, mock_mp_xml: str, calls: list) -> httpx.AsyncClient:
+    """Client serving the session feed fixture and the MP profile fixture"""
+    with open(feed_path, "rb") as f:
+        feed = f.read()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        if "parl.ca" in request.url.host:
+            return httpx.Response(200, content=feed)
+        return httpx.Response(200, text=mock_mp_xml)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_ingest_session_from_file(session_feed_path, mock_mp_xml):
+    """Test every bill in the feed lands in the bill cache"""
+    calls = []
+    client = make_client(session_feed_path, mock_mp_xml, calls)
+    result = await ingest_session("44-1", client, source=session_feed_path)
+
+    assert result.bills == 3
+    assert result.skipped == 1
+    # Both Commons bills share one sponsor, fetched once
+    assert len(calls) == 1
+    assert bill_cache.get("44-1/c-422").sponsor_party == "NDP"
+    assert bill_cache.get("44-1/c-423").sponsor_party == "NDP"
+    senate_bill = bill_cache.get("44-1/s-2")
+    assert senate_bill.sponsor_party == "Senate"
+    assert senate_bill.status == "Dropped from Senate Order Paper"
+
+
+def test_ingest_endpoint(app_client, session_feed_path, mock_mp_xml):
+    """Test the ingest endpoint downloads the feed once"""
+    calls = []
+    client = make_client(session_feed_path, mock_mp_xml, calls)
+    sponsor_cache.set("105837", "NDP")
+    app.dependency_overrides[upstream_client] = lambda: client
+    try:
+        response = app_client.post("/api/sessions/44-1/ingest?resolve_sponsors=false")
+        assert response.status_code == 200
+        assert response.json()["bills"] == 3
+
+        # Ingested bills are served without another upstream request
+        response = app_client.get(
+            "/api/bill?url=https://www.parl.ca/legisinfo/en/bill/44-1/c-423"
+        )
+        assert response.json()["status"] == "At second reading in the House of Commons"
+    finally:
+        app.dependency_overrides.clear()
+
+    assert calls == ["https://www.parl.ca/legisinfo/en/bills/xml?parlsession=44-1"]
+
+
+@pytest.mark.asyncio
+async def test_ingest_without_sponsors_keeps_known_parties(session_feed_path):
+    """Test bills get parties already known, and are left out otherwise"""
+    bill_table.put("44-1/c-422", BillInfo(bill_number="c-422", sponsor_party="NDP"))
+    result = await ingest_session(
+        "44-1", resolve_sponsors=False, source=session_feed_path
+    )
+
+    assert result.bills == 2
+    assert result.unresolved == 1
+    assert bill_cache.get("44-1/c-422").sponsor_party == "NDP"
+    assert bill_cache.get("44-1/s-2").sponsor_party == "Senate"
+    assert "44-1/c-423" not in bill_cache
+    assert bill_table.get("44-1/c-423") is None
+
+
+@pytest.mark.asyncio
+async def test_ingest_releases_slot_while_streaming(session_feed_path):
+    """Test the parl.ca concurrency slot is free while the feed is consumed"""
+    limiter = get_host_limiter(session_feed_url("44-1"))
+    in_flight = []
+
+    async def feed():
+        with open(session_feed_path, "rb") as f:
+            for line in f:
+                in_flight.append(limiter.concurrency.in_flight)
+                yield line
+
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=feed())
+        )
+    )
+    result = await ingest_session("44-1", client, resolve_sponsors=False)
+
+    assert result.bills + result.unresolved == 3
+    assert in_flight and max(in_flight) == 0
+    assert limiter.concurrency.in_flight == 0
+
+
+def test_ingest_endpoint_invalid_session(app_client):
+    """Test malformed session codes are rejected"""
+    response = app_client.post("/api/sessions/latest/ingest")
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_ingest_cli(session_feed_path, capsys):
+    """Test the CLI ingests a local feed file"""
+    sponsor_cache.set("105837", "NDP")
+    await main(["44-1", "--file", session_feed_path, "--no-sponsors"])
+    assert "'bills': 3" in capsys.readouterr().out
+    assert "44-1/c-422" in bill_cache
+
+
+@pytest.mark.asyncio
+async def test_ingest_cli_writes_store(session_feed_path, tmp_path):
+    """Test the CLI persists the ingested bills to BILL_STORE_PATH"""
+    path = str(tmp_path / "bills.db")
+    sponsor_cache.set("105837", "NDP")
+    with patch("src.scraper.store.settings.BILL_STORE_PATH", path):
+        await main(["44-1", "--file", session_feed_path, "--no-sponsors"])
+    assert get_bill_store() is None
+
+    store = BillStore(path)
+    try:
+        assert store.count_bills() == 3
+        assert store.get_bill("44-1/c-422")[0].sponsor_party == "NDP"
+    finally:
+        store.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_bill_elements_clears_processed_bills():
+    """Test each bill is yielded once and released before the next one"""
+    bills = "".join(f"<Bill><NumberCode>C-{n}</NumberCode></Bill>" for n in range(500))
+    feed = f"<Bills>{bills}</Bills>".encode()
+    # Split into small chunks so elements straddle chunk boundaries
+    chunks = [feed[i : i + 37] for i in range(0, len(feed), 37)]
+
+    numbers = []
+    previous = None
+    async for bill in iter_bill_elements(iter_bytes(chunks)):
+        if previous is not None:
+            assert len(previous) == 0
+        numbers.append(bill.findtext("NumberCode"))
+        previous = bill
+
+    assert numbers == [f"C-{n}" for n in range(500)]
+
+
+@pytest.mark.asyncio
+async def test_iter_bill_elements_invalid_xml():
+    """Test malformed feeds raise a parse error"""
+    with pytest.raises(ET.ParseError):
+        async for _ in iter_bill_elements(iter_bytes([b"<Bills><Bill>"])):
+            pass
@@ -0,0 +1,115 @@
+import asyncio
+import httpx
+import pytest
+from unittest.mock import patch
+from src.scraper.deadline import DeadlineExceeded, request_deadline
+from src.scraper.limits import AdaptiveLimiter, TokenBucket, get_host_limiter
+from src.scraper.parser import fetch_parsed
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_limits_rate():
+    """Test requests beyond the burst wait for new tokens"""
+    bucket = TokenBucket(rate=100, burst=2)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for _ in range(4):
+        await bucket.acquire()
+    # Two requests had to wait about 10ms each for a token
+    assert loop.time() - start >= 0.015
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_caps_concurrency():
+    """Test no more than `limit` holders at once"""
+    limiter = AdaptiveLimiter(initial=2, minimum=1, maximum=2, backoff_ratio=0.5)
+    active = 0
+    peak = 0
+
+    async def work():
+        nonlocal active, peak
+        await limiter.acquire()
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        limiter.release()
+
+    await asyncio.gather(*(work() for _ in range(6)))
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+def test_adaptive_limiter_aimd():
+    """Test additive increase on success and multiplicative decrease on overload"""
+    limiter = AdaptiveLimiter(initial=10, minimum=1, maximum=50, backoff_ratio=0.5)
+    limiter.in_flight = 2
+    limiter.release()
+    assert limiter.limit == pytest.approx(10.1)
+    limiter.release(overloaded=True)
+    assert limiter.limit == pytest.approx(5.05)
+
+
+@pytest.mark.asyncio
+async def test_limiter_waits_bounded_by_deadline():
+    """Test waits for a token or a slot end with the request deadline"""
+    bucket = TokenBucket(rate=1, burst=1)
+    await bucket.acquire()
+    with request_deadline(0.1):
+        with pytest.raises(DeadlineExceeded):
+            await bucket.acquire()
+    assert bucket.waiting == 0
+
+    limiter = AdaptiveLimiter(initial=1, minimum=1, maximum=2, backoff_ratio=0.5)
+    await limiter.acquire()
+    with request_deadline(0.05):
+        with pytest.raises(DeadlineExceeded):
+            await limiter.acquire()
+    assert limiter.waiting == 0
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_deadline_timeouts_not_counted_as_overload():
+    """Test a timeout cut short by the deadline leaves the limit alone"""
+    limiter = get_host_limiter("https://www.parl.ca/legisinfo/en/bill/44-1/c-422/xml")
+    before = limiter.concurrency.limit
+
+    with request_deadline(0.01):
+        with pytest.raises(httpx.ReadTimeout):
+            async with limiter.slot():
+                await asyncio.sleep(0.02)
+                raise httpx.ReadTimeout("Read timed out")
+
+    assert limiter.concurrency.limit == before
+    assert limiter.concurrency.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_throttled_responses_shrink_limit(mock_mp_xml):
+    """Test 429 responses lower the host's concurrency limit"""
+    url = "https://www.ourcommons.ca/members/en/105837/xml"
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(429))
+    )
+    limiter = get_host_limiter(url)
+    before = limiter.concurrency.limit
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await fetch_parsed(client, url, str)
+
+    assert limiter.concurrency.limit < before
+    assert limiter.concurrency.in_flight == 0
+
+
+def test_upstream_limits_endpoint(app_client):
+    """Test per-host limits are reported"""
+    get_host_limiter("https://www.parl.ca/legisinfo/en/bill/44-1/c-422/xml")
+    with patch("src.scraper.limits.settings.UPSTREAM_RATE_LIMIT", 5):
+        get_host_limiter("https://www.ourcommons.ca/members/en/105837/xml")
+
+    response = app_client.get("/api/upstream/limits")
+    data = response.json()
+    assert data["www.parl.ca"]["concurrency_limit"] == 10
+    assert data["www.ourcommons.ca"]["rate_limit"] == 5
+    assert data["www.parl.ca"]["queued"] == 0
@@ -0,0 +1,71 @@
+import httpx
+import pytest
+from unittest.mock import patch
+from src.api.endpoints import upstream_client
+from src.main import app
+from src.scraper.metrics import Histogram, render_metrics, stage_seconds
+
+URL = "https://www.parl.ca/legisinfo/en/bill/44-1/c-422"
+
+
+@pytest.fixture
+def metrics_enabled():
+    with patch("src.scraper.metrics.settings.METRICS_ENABLED", True):
+        yield
+
+
+@pytest.fixture
+def upstream(mock_bill_xml, mock_mp_xml):
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = mock_bill_xml if "parl.ca" in request.url.host else mock_mp_xml
+        return httpx.Response(200, text=body)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    app.dependency_overrides[upstream_client] = lambda: client
+    yield client
+    app.dependency_overrides.clear()
+
+
+def test_histogram_buckets(metrics_enabled):
+    """Test observations land in cumulative le buckets"""
+    histogram = Histogram("test_seconds", "Test", ("stage",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "a")
+    histogram.observe(0.5, "a")
+    histogram.observe(5.0, "a")
+
+    lines = histogram.render()
+    assert 'test_seconds_bucket{stage="a",le="0.1"} 1.0' in lines
+    assert 'test_seconds_bucket{stage="a",le="1.0"} 2.0' in lines
+    assert 'test_seconds_bucket{stage="a",le="+Inf"} 3.0' in lines
+    assert 'test_seconds_count{stage="a"} 3.0' in lines
+
+
+def test_metrics_endpoint(app_client, metrics_enabled, upstream):
+    """Test a bill lookup shows up per stage, per route and per upstream host"""
+    assert app_client.get(f"/api/bill?url={URL}").status_code == 200
+    assert app_client.get(f"/api/bill?url={URL}").status_code == 200
+
+    response = app_client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    text = response.text
+
+    for stage in ("bill_fetch", "bill_parse", "sponsor_fetch", "serialize"):
+        assert f'scraper_stage_duration_seconds_count{{stage="{stage}"}}' in text
+    assert 'scraper_stage_duration_seconds_count{stage="bill_lookup"} 2.0' in text
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/api/bill",'
+        'status="200"} 2.0'
+    ) in text
+    assert 'upstream_responses_total{host="www.parl.ca",status="200"} 1.0' in text
+    assert 'upstream_response_bytes_total{host="www.parl.ca"}' in text
+    assert 'cache_lookups_total{cache="bill",result="hit"} 1' in text
+    assert "http_requests_in_flight 1.0" in text
+
+
+def test_metrics_disabled(app_client, upstream):
+    """Test nothing is recorded or exposed when metrics are off"""
+    assert app_client.get(f"/api/bill?url={URL}").status_code == 200
+    assert stage_seconds.values == {}
+    assert app_client.get("/metrics").status_code == 404
+    assert "scraper_stage_duration_seconds" in render_metrics()
@@ -3,7 +3,14 @@ from unittest.mock import patch
 import xml.etree.ElementTree as ET
 from typing import Any
 import httpx
-from src.scraper.parser import scrape_bill_info, get_sponsor_party, build_sponsor_url
+from src.scraper.cache import bill_cache, sponsor_cache
+from src.scraper.parser import (
+    build_sponsor_url,
+    fetch_bill_info,
+    get_sponsor_party,
+    revalidation_stats,
+    scrape_bill_info,
+)
 from src.models.bill import BillInfo
 
 
@@ -15,6 +22,11 @@ async def test_scrape_bill_info_success(mock_bill_xml: str, mock_mp_xml: str):
     async def mock_get(*args: Any, **kwargs: Any):
         class MockResponse:
             status_code = 200
+            headers: dict = {}
+
+            @property
+            def content(self) -> bytes:
+                return self.text.encode()
 
             def __init__(self, url: str):
                 self.url = url
@@ -55,6 +67,12 @@ async def test_scrape_bill_info_missing_fields(mock_bill_xml: str):
     async def mock_get(*args: Any, **kwargs: Any):
         class MockResponse:
             status_code = 200
+            headers: dict = {}
+
+            @property
+            def content(self) -> bytes:
+                return self.text.encode()
+
             text = modified_xml
 
             def raise_for_status(self) -> None:
@@ -75,6 +93,12 @@ async def test_get_sponsor_party(mock_bill_element: ET.Element, mock_mp_xml: str
     async def mock_get(*args: Any, **kwargs: Any):
         class MockResponse:
             status_code = 200
+            headers: dict = {}
+
+            @property
+            def content(self) -> bytes:
+                return self.text.encode()
+
             text = mock_mp_xml
 
             def raise_for_status(self) -> None:
@@ -151,3 +175,60 @@ async def test_specific_http_errors(app_client):
             response = app_client.get(f"/api/bill?url={url}")
             assert response.status_code == 500
             assert expected_message in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_conditional_refresh(mock_bill_xml: str, mock_mp_xml: str):
+    """Test refreshes send validators and reuse the parse on 304"""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if "parl.ca" in request.url.host:
+            etag, body = '"bill-v1"', mock_bill_xml
+        else:
+            etag, body = '"mp-v1"', mock_mp_xml
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(200, text=body, headers={"ETag": etag})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    url = "https://www.parl.ca/legisinfo/en/bill/44-1/c-422"
+    first = await fetch_bill_info(url, client)
+
+    # Expire the parsed caches so both documents are revalidated upstream
+    bill_cache.clear()
+    sponsor_cache.clear()
+    with patch("src.scraper.parser.ET.fromstring") as fromstring:
+        second = await fetch_bill_info(url, client)
+        fromstring.assert_not_called()
+
+    assert second == first
+    assert [r.headers.get("If-None-Match") for r in requests[2:]] == [
+        '"bill-v1"',
+        '"mp-v1"',
+    ]
+    assert revalidation_stats["conditional_requests"] == 2
+    assert revalidation_stats["not_modified"] == 2
+    assert revalidation_stats["bytes_saved"] == len(mock_bill_xml.encode()) + len(
+        mock_mp_xml.encode()
+    )
+
+
+@pytest.mark.asyncio
+async def test_unconditional_without_validators(mock_bill_xml: str):
+    """Test responses without validators are not revalidated"""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, text=mock_bill_xml)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    url = "https://www.parl.ca/legisinfo/en/bill/44-1/c-422"
+    with patch("src.scraper.parser.resolve_sponsor", return_value="NDP"):
+        await fetch_bill_info(url, client)
+        await fetch_bill_info(url, client)
+
+    assert all("If-None-Match" not in r.headers for r in requests)
+    assert revalidation_stats["conditional_requests"] == 0
@@ -0,0 +1,216 @@
+import httpx
+import pytest
+from src.models.bill import BillInfo
+from src.scraper.ingest import ingest_session
+from src.scraper.parser import scrape_bill_info
+from src.scraper.records import BillRecord, BillTable, bill_table, date_key
+
+BILL = BillInfo(
+    bill_number="c-422",
+    bill_type="Private Member's Bill",
+    status="Outside the Order of Precedence",
+    sponsor_name="Bonita Zarrillo",
+    sponsor_party="NDP",
+    last_updated="2024-12-02T11:00:00",
+)
+
+
+def test_record_round_trip():
+    """Test a record converts back to an equal BillInfo"""
+    record = BillRecord.from_bill(BILL)
+
+    assert record.to_bill() == BILL
+    assert record == BillRecord.from_bill(BILL)
+    assert not hasattr(record, "__dict__")
+
+
+def test_record_interns_categorical_fields():
+    """Test equal categorical values share one string object across records"""
+    first = BillRecord.from_bill(BILL)
+    other = BillInfo(
+        bill_number="c-423", status="Outside the Order of Precedence".encode().decode()
+    )
+    second = BillRecord.from_bill(other)
+
+    assert second.status is first.status
+    assert (
+        second.sponsor_party
+        is BillRecord.from_bill(BillInfo(bill_number="x")).sponsor_party
+    )
+
+
+def test_bill_table():
+    """Test bills are stored as records and returned as BillInfo"""
+    table = BillTable()
+    table.put("44-1/c-422", BILL)
+
+    assert "44-1/c-422" in table
+    assert table.get("44-1/c-422") == BILL
+    assert isinstance(table.record("44-1/c-422"), BillRecord)
+    assert table.get("44-1/c-1") is None
+    assert len(table) == 1
+
+
+@pytest.mark.asyncio
+async def test_bill_table_filled_by_scrapes_and_ingest(
+    session_feed_path, mock_bill_xml, mock_mp_xml
+):
+    """Test scraped and ingested bills land in the bill table"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "parl.ca" in request.url.host:
+            return httpx.Response(200, text=mock_bill_xml)
+        return httpx.Response(200, text=mock_mp_xml)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        await scrape_bill_info(
+            "https://www.parl.ca/legisinfo/en/bill/44-1/c-422", client
+        )
+        assert bill_table.get("44-1/c-422").sponsor_party == "NDP"
+
+        result = await ingest_session(
+            "44-1", client, resolve_sponsors=False, source=session_feed_path
+        )
+    assert len(bill_table) >= result.bills
+
+
+def make_table() -> BillTable:
+    table = BillTable()
+    rows = [
+        ("44-1/c-1", "NDP", "Royal Assent", "2024-01-10T09:00:00"),
+        ("44-1/c-2", "Liberal", "Royal Assent", "2024-03-01T09:00:00"),
+        ("44-1/c-3", "NDP", "Bill defeated", "2024-02-15T09:00:00"),
+        ("44-1/c-4", "NDP", "Royal Assent", "2024-04-20T09:00:00"),
+        ("44-1/c-5", "NDP", "Royal Assent", "Unknown"),
+    ]
+    for key, party, status, updated in rows:
+        bill = BillInfo(
+            bill_number=key.split("/")[1],
+            sponsor_party=party,
+            status=status,
+            last_updated=updated,
+        )
+        table.put(key, bill)
+    return table
+
+
+def keys(page) -> list[str]:
+    return [key for key, _ in page]
+
+
+def test_query_filters():
+    """Test combined, case-insensitive filters, newest first"""
+    table = make_table()
+
+    total, page = table.query({"sponsor_party": "ndp", "status": "ROYAL ASSENT"})
+    assert total == 3
+    assert keys(page) == ["44-1/c-4", "44-1/c-1", "44-1/c-5"]
+
+    assert table.query({"sponsor_party": "Green"}) == (0, [])
+    total, page = table.query()
+    assert total == 5
+    assert keys(page)[0] == "44-1/c-4"
+
+
+def test_query_dates_and_pages():
+    """Test date bounds exclude unknown dates and pages slice the matches"""
+    table = make_table()
+
+    total, page = table.query(updated_since="2024-02-01", updated_before="2024-04-20")
+    assert total == 2
+    assert keys(page) == ["44-1/c-2", "44-1/c-3"]
+
+    # An upper bound alone still leaves out c-5, whose date is unknown
+    total, page = table.query(updated_before="2024-06-01")
+    assert keys(page) == ["44-1/c-4", "44-1/c-2", "44-1/c-3", "44-1/c-1"]
+    total, page = table.query({"status": "Royal Assent"}, updated_before="2024-06-01")
+    assert keys(page) == ["44-1/c-4", "44-1/c-2", "44-1/c-1"]
+
+    total, page = table.query({"sponsor_party": "NDP"}, offset=1, limit=2)
+    assert total == 4
+    assert keys(page) == ["44-1/c-3", "44-1/c-1"]
+
+    total, page = table.query(
+        {"sponsor_party": "NDP", "status": "Royal Assent"}, updated_since="2024"
+    )
+    assert keys(page) == ["44-1/c-4", "44-1/c-1"]
+
+
+def test_query_index_updates():
+    """Test a bill put again moves between index entries"""
+    table = make_table()
+    table.put(
+        "44-1/c-1",
+        BillInfo(
+            bill_number="c-1",
+            sponsor_party="NDP",
+            status="Bill defeated",
+            last_updated="2024-05-01T09:00:00",
+        ),
+    )
+
+    total, page = table.query({"status": "bill defeated"})
+    assert total == 2
+    assert keys(page) == ["44-1/c-1", "44-1/c-3"]
+    assert table.query({"status": "royal assent", "sponsor_party": "ndp"})[0] == 2
+    assert len(table) == 5
+
+
+def test_query_filter_combinations():
+    """Test every query plan agrees with a scan of the table"""
+    table = BillTable()
+    for n in range(400):
+        table.put(
+            f"44-1/c-{n}",
+            BillInfo(
+                bill_number=f"c-{n}",
+                status="Royal Assent" if n % 3 == 0 else "Second reading",
+                sponsor_party="NDP" if n % 2 == 0 else "Liberal",
+                bill_type="Senate Public Bill" if n % 50 == 0 else "Government Bill",
+                last_updated=(
+                    "Unknown"
+                    if n % 7 == 0
+                    else f"2024-{n % 12 + 1:02}-{n % 28 + 1:02}T00:00:00"
+                ),
+            ),
+        )
+
+    def scan(filters, since, before):
+        rows = [
+            (date_key(record.last_updated), key)
+            for key, record in table.items()
+            if all(
+                getattr(record, f).casefold() == v.casefold()
+                for f, v in filters.items()
+            )
+        ]
+        if since or before:
+            # Undated bills match no date bound
+            rows = [
+                row
+                for row in rows
+                if row[0] and (since or "") <= row[0] < (before or "9")
+            ]
+        return [key for _, key in sorted(rows, reverse=True)]
+
+    # No, one and several filters; dense and sparse matches; with and without
+    # each date bound; shallow and deep pages
+    for filters in (
+        {},
+        {"sponsor_party": "ndp"},
+        {"sponsor_party": "ndp", "status": "royal assent"},
+        {"sponsor_party": "ndp", "bill_type": "senate public bill"},
+    ):
+        for since, before in (
+            (None, None),
+            ("2024-03-01", "2024-09-01"),
+            ("2024-03-01", None),
+            (None, "2024-06-01"),
+        ):
+            expected = scan(filters, since, before)
+            for offset in (0, 10, 60):
+                total, page = table.query(
+                    filters, since, before, offset=offset, limit=5
+                )
+                assert total == len(expected)
+                assert [key for key, _ in page] == expected[offset : offset + 5]
@@ -0,0 +1,145 @@
+import asyncio
+import httpx
+import pytest
+from unittest.mock import patch
+from src.models.bill import BillInfo
+from src.scraper.cache import bill_cache
+from src.scraper.deadline import DeadlineExceeded, request_deadline
+from src.scraper.limits import get_host_limiter
+from src.scraper.parser import scrape_bill_info
+from src.scraper.resilience import (
+    CircuitOpenError,
+    get_circuit_breaker,
+    get_latency_tracker,
+    resilient_get,
+)
+
+URL = "https://www.parl.ca/legisinfo/en/bill/44-1/c-422/xml"
+
+
+@pytest.fixture(autouse=True)
+def fast_backoff():
+    """Keep retry backoff short in tests"""
+    with patch("src.scraper.resilience.settings.UPSTREAM_RETRY_BACKOFF", 0.001):
+        yield
+
+
+def make_client(responses: list) -> httpx.AsyncClient:
+    """Client answering with the given status codes in order"""
+    calls = iter(responses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(calls))
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors():
+    """Test 5xx responses are retried until one succeeds"""
+    response = await resilient_get(make_client([503, 502, 200]), URL)
+    assert response.status_code == 200
+    assert get_circuit_breaker(URL).failures == 0
+
+
+@pytest.mark.asyncio
+async def test_retries_connection_errors():
+    """Test connection errors are retried and re-raised when retries run out"""
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        raise httpx.ConnectError("Connection failed", request=request)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with pytest.raises(httpx.ConnectError):
+        await resilient_get(client, URL)
+    assert attempts == 3
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_and_recovers():
+    """Test the circuit fails fast once open and closes after a good probe"""
+    with patch("src.scraper.resilience.settings.UPSTREAM_RETRIES", 0):
+        for _ in range(5):
+            await resilient_get(make_client([503]), URL)
+
+        breaker = get_circuit_breaker(URL)
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            await resilient_get(make_client([200]), URL)
+
+        with patch("src.scraper.resilience.settings.CIRCUIT_RESET_TIMEOUT", 0):
+            assert breaker.state == "half_open"
+            await resilient_get(make_client([200]), URL)
+        assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_unfinished_probe_releases_circuit():
+    """Test a probe ended by cancellation or the deadline lets the next one through"""
+    breaker = get_circuit_breaker(URL)
+    for _ in range(5):
+        breaker.record_failure()
+
+    async def hang(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(5)
+        return httpx.Response(200)
+
+    with patch("src.scraper.resilience.settings.CIRCUIT_RESET_TIMEOUT", 0):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(hang))
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(resilient_get(client, URL), 0.05)
+        assert breaker.state == "half_open"
+        assert not breaker.probing
+
+        # Every concurrency slot is taken, so the probe waits out its deadline
+        concurrency = get_host_limiter(URL).concurrency
+        concurrency.in_flight = int(concurrency.limit)
+        with request_deadline(0.05):
+            with pytest.raises(DeadlineExceeded):
+                await resilient_get(make_client([200]), URL)
+        concurrency.in_flight = 0
+        assert breaker.state == "half_open"
+        assert not breaker.probing
+
+        await resilient_get(make_client([200]), URL)
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_hedges_slow_requests():
+    """Test a duplicate request is sent when the first is slower than p95"""
+    tracker = get_latency_tracker(URL)
+    for _ in range(20):
+        tracker.record(0.01)
+
+    calls = 0
+
+    async def mock_get(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        # The first request hangs, the hedge answers at once
+        if calls == 1:
+            await asyncio.sleep(5)
+        return httpx.Response(200)
+
+    with patch("httpx.AsyncClient.get", side_effect=mock_get):
+        response = await asyncio.wait_for(resilient_get(httpx.AsyncClient(), URL), 1)
+
+    assert response.status_code == 200
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_serves_stale_bill():
+    """Test an expired cached bill is served while parl.ca is down"""
+    old = BillInfo(bill_number="c-422", status="Old status")
+    bill_cache.set("44-1/c-422", old, ttl=-1)
+    breaker = get_circuit_breaker(URL)
+    for _ in range(5):
+        breaker.record_failure()
+
+    result = await scrape_bill_info(URL.removesuffix("/xml"), make_client([]))
+    assert result == old
@@ -0,0 +1,91 @@
+import httpx
+import pytest
+import time
+from datetime import datetime
+from src.scraper.cache import bill_cache
+from src.scraper.scheduler import LEGISINFO_TZ, RefreshScheduler, updated_at
+
+
+def make_client(
+    mock_bill_xml: str, mock_mp_xml: str, failing: set
+) -> httpx.AsyncClient:
+    """Client serving the fixtures, with 503s for bills listed in `failing`"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if any(f"/{bill}/" in request.url.path for bill in failing):
+            return httpx.Response(503)
+        if "parl.ca" in request.url.host:
+            return httpx.Response(200, text=mock_bill_xml)
+        return httpx.Response(200, text=mock_mp_xml)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_scheduler_refreshes_watch_list(mock_bill_xml, mock_mp_xml):
+    """Test due bills are refreshed into the cache and rescheduled"""
+    client = make_client(mock_bill_xml, mock_mp_xml, failing=set())
+    scheduler = RefreshScheduler(["44-1/c-422", "not-a-bill"], client)
+
+    assert list(scheduler.bills) == ["44-1/c-422"]
+    assert await scheduler.refresh_due() == 1
+    assert "44-1/c-422" in bill_cache
+    assert scheduler.due_bills() == []
+
+    status = scheduler.status()[0]
+    assert status["lag"] < 1
+    assert status["next_refresh_in"] > 0
+    assert status["last_updated"] == "2024-12-02T11:00:00"
+
+
+@pytest.mark.asyncio
+async def test_scheduler_backs_off_on_errors(mock_bill_xml, mock_mp_xml):
+    """Test failing bills back off exponentially"""
+    client = make_client(mock_bill_xml, mock_mp_xml, failing={"c-1"})
+    scheduler = RefreshScheduler(["44-1/c-1"], client)
+
+    await scheduler.refresh_due()
+    bill = scheduler.bills["44-1/c-1"]
+    first_delay = bill.next_due - time.time()
+    assert bill.failures == 1
+    assert bill.last_refreshed is None
+
+    bill.next_due = 0
+    await scheduler.refresh_due()
+    assert bill.failures == 2
+    assert bill.next_due - time.time() > first_delay
+    assert scheduler.status()[0]["last_error"]
+
+
+def legisinfo_time(timestamp: float) -> str:
+    """A timestamp the way LegisInfo writes it: Ottawa time without an offset"""
+    local = datetime.fromtimestamp(timestamp, LEGISINFO_TZ).replace(tzinfo=None)
+    return local.isoformat(timespec="seconds")
+
+
+def test_scheduler_prioritizes_recently_updated_bills():
+    """Test bills LegisInfo updated recently are refreshed first, even unchanged"""
+    scheduler = RefreshScheduler(["44-1/c-1", "44-1/c-2", "44-1/c-3"])
+    now = time.time()
+    scheduler.bills["44-1/c-1"].next_due = now - 100
+    scheduler.bills["44-1/c-1"].last_updated = "2024-12-02T11:00:00"
+    scheduler.bills["44-1/c-2"].next_due = now - 10
+    scheduler.bills["44-1/c-2"].last_updated = legisinfo_time(now - 3600)
+    scheduler.bills["44-1/c-3"].next_due = now - 50
+
+    due = [bill.key for bill in scheduler.due_bills(now)]
+    assert due == ["44-1/c-2", "44-1/c-1", "44-1/c-3"]
+
+
+def test_updated_at():
+    """Test LegisInfo times are read as Ottawa time and unknown ones skipped"""
+    assert updated_at("2024-07-01T12:00:00") == 1719849600.0
+    assert updated_at("2024-07-01T12:00:00+00:00") == 1719835200.0
+    assert updated_at("Unknown") is None
+    assert updated_at(None) is None
+
+
+def test_refresh_status_disabled(app_client):
+    """Test the status endpoint without a watch list"""
+    response = app_client.get("/api/refresh/status")
+    assert response.json() == {"enabled": False, "bills": []}
@@ -0,0 +1,111 @@
+import asyncio
+import fcntl
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, patch
+from src.config.settings import settings
+from src.main import app
+from src.scraper.cache import bill_cache
+from src.scraper.limits import get_host_limiter
+from src.scraper.parser import _revalidations, drain_revalidations, prewarm_bill_cache
+from src.server import (
+    acquire_background_lock,
+    parse_args,
+    release_background_lock,
+    server_options,
+)
+
+
+def test_server_options_defaults():
+    """Test the production options: a worker per core, no reload, bounded drain"""
+    with patch("src.server.default_workers", return_value=8), patch(
+        "src.server.installed", return_value=False
+    ):
+        options = server_options(parse_args([]))
+
+    assert options["workers"] == 8
+    assert options["loop"] == "asyncio"
+    assert options["http"] == "h11"
+    assert "reload" not in options
+    assert options["timeout_graceful_shutdown"] == int(settings.SHUTDOWN_DRAIN_TIMEOUT)
+
+
+def test_server_options_fast_loop():
+    """Test uvloop and httptools are used when installed"""
+    with patch("src.server.installed", return_value=True):
+        options = server_options(parse_args(["--workers", "2", "--port", "9000"]))
+
+    assert options["workers"] == 2
+    assert options["port"] == 9000
+    assert options["loop"] == "uvloop"
+    assert options["http"] == "httptools"
+
+
+def test_background_lock_single_worker(tmp_path):
+    """Test only the worker holding the lock refreshes the store"""
+    path = str(tmp_path / "bills.db.lock")
+    with open(path, "a") as other_worker:
+        fcntl.flock(other_worker, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        assert not acquire_background_lock(path)
+
+    try:
+        assert acquire_background_lock(path)
+    finally:
+        release_background_lock()
+
+
+def test_every_worker_prewarms(tmp_path):
+    """Test a worker without the lock still pre-warms but leaves the store alone"""
+    path = str(tmp_path / "bills.db")
+    with patch("src.main.prewarm", new_callable=AsyncMock) as prewarm, patch(
+        "src.main.run_store_refresher"
+    ) as refresher, patch("src.config.settings.settings.BILL_STORE_PATH", path):
+        with open(f"{path}.lock", "a") as other_worker:
+            fcntl.flock(other_worker, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            with TestClient(app):
+                pass
+
+    prewarm.assert_awaited_once()
+    refresher.assert_not_called()
+
+
+def test_rate_limit_split_across_workers():
+    """Test each worker gets an equal share of the upstream rate limit"""
+    with patch("src.scraper.limits.settings.WORKERS", 4):
+        bucket = get_host_limiter("https://www.parl.ca/legisinfo").bucket
+
+    assert bucket.rate == settings.UPSTREAM_RATE_LIMIT / 4
+    assert bucket.burst == settings.UPSTREAM_BURST // 4
+
+
+@pytest.mark.asyncio
+async def test_prewarm_bill_cache(mock_bill_xml, mock_mp_xml):
+    """Test bills are loaded before traffic; unknown identifiers are skipped"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "parl.ca" in request.url.host:
+            return httpx.Response(200, text=mock_bill_xml)
+        return httpx.Response(200, text=mock_mp_xml)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        loaded = await prewarm_bill_cache(["44-1/c-422", "not a bill"], client)
+
+    assert loaded == 1
+    assert bill_cache.get("44-1/c-422").sponsor_party == "NDP"
+
+
+@pytest.mark.asyncio
+async def test_drain_revalidations():
+    """Test finished refreshes are awaited and stragglers cancelled"""
+    quick = asyncio.ensure_future(asyncio.sleep(0.01))
+    stuck = asyncio.ensure_future(asyncio.sleep(60))
+    _revalidations.update({"44-1/c-1": quick, "44-1/c-2": stuck})
+    try:
+        assert await drain_revalidations(0.2) == 1
+    finally:
+        _revalidations.clear()
+
+    assert quick.done() and not quick.cancelled()
+    await asyncio.sleep(0)
+    assert stuck.cancelled()
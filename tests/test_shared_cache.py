@@ -0,0 +1,182 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from src.models.bill import BillInfo
+from src.scraper.cache import bill_cache, sponsor_cache
+from src.scraper.parser import scrape_bill_info
+from src.scraper.shared_cache import (
+    MemoryBackend,
+    RedisBackend,
+    RedisError,
+    SharedCache,
+    decode_bill,
+    encode_bill,
+)
+
+URL = "https://www.parl.ca/legisinfo/en/bill/44-1/c-422"
+
+
+class FakeRedis:
+    """Redis-protocol server on localhost supporting GET, SET [PX] and DEL"""
+
+    def __init__(self):
+        self.data: dict[bytes, bytes] = {}
+        self.commands: list[list[bytes]] = []
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        while True:
+            header = await reader.readline()
+            if not header:
+                break
+            args = []
+            for _ in range(int(header[1:])):
+                length = int((await reader.readline())[1:])
+                args.append((await reader.readexactly(length + 2))[:-2])
+            self.commands.append(args)
+            name = args[0].upper()
+            if name == b"GET":
+                value = self.data.get(args[1])
+                reply = (
+                    b"$-1\r\n"
+                    if value is None
+                    else b"$%d\r\n%b\r\n" % (len(value), value)
+                )
+            elif name == b"SET":
+                self.data[args[1]] = args[2]
+                reply = b"+OK\r\n"
+            elif name == b"DEL":
+                reply = b":%d\r\n" % int(self.data.pop(args[1], None) is not None)
+            else:
+                reply = b"-ERR unknown command\r\n"
+            writer.write(reply)
+            await writer.drain()
+        writer.close()
+
+
+@pytest_asyncio.fixture
+async def fake_redis():
+    fake = FakeRedis()
+    server = await asyncio.start_server(fake.handle, "127.0.0.1", 0)
+    fake.url = f"redis://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+    yield fake
+    server.close()
+    await server.wait_closed()
+
+
+def test_bill_encoding_round_trip():
+    """Test a bill survives the compact encoding and foreign entries are misses"""
+    bill = BillInfo(bill_number="c-422", status="Royal Assent", sponsor_party="NDP")
+    data = encode_bill(bill, 1000.0)
+
+    assert b"bill_number" not in data
+    assert decode_bill(data) == (bill, 1000.0)
+    assert decode_bill(b"[0,1000.0]") is None
+    assert decode_bill(b"not json") is None
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_expiry():
+    """Test entries expire after their TTL"""
+    backend = MemoryBackend()
+    await backend.set("a", b"1", ttl=60)
+    await backend.set("b", b"2", ttl=-1)
+
+    assert await backend.get("a") == b"1"
+    assert await backend.get("b") is None
+    await backend.delete("a")
+    assert await backend.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_backend(fake_redis):
+    """Test the RESP client against a Redis-protocol server"""
+    backend = RedisBackend(fake_redis.url)
+    await backend.set("key", b"\x00value\r\n", ttl=1.5)
+
+    assert await backend.get("key") == b"\x00value\r\n"
+    assert await backend.get("missing") is None
+    await backend.delete("key")
+    assert await backend.get("key") is None
+    assert fake_redis.commands[0] == [b"SET", b"key", b"\x00value\r\n", b"PX", b"1500"]
+
+    with pytest.raises(RedisError):
+        await backend.execute("FLUSHALL")
+    # The connection is still usable after an error reply
+    assert len(backend._idle) == 1
+    assert await backend.get("key") is None
+    await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_errors_are_misses():
+    """Test an unreachable backend is logged and treated as a miss"""
+    shared = SharedCache(RedisBackend("redis://127.0.0.1:1"), timeout=1.0)
+
+    assert await shared.get_bill("44-1/c-422") is None
+    await shared.set_bill("44-1/c-422", BillInfo(bill_number="c-422"))
+    assert shared.stats()["errors"] == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_garbled_replies_are_misses():
+    """Test malformed, truncated and undecodable entries are errors, not exceptions"""
+    replies = iter([b"$abc\r\n", b"$10\r\nab"])
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        await reader.read(1024)
+        writer.write(next(replies))
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    shared = SharedCache(RedisBackend(f"redis://127.0.0.1:{port}"), timeout=1.0)
+    assert await shared.get_bill("44-1/c-422") is None
+    assert await shared.get_bill("44-1/c-422") is None
+    server.close()
+    await server.wait_closed()
+
+    backend = MemoryBackend()
+    await backend.set("sponsor:105837", b"\xff", ttl=60)
+    shared_memory = SharedCache(backend)
+    assert await shared_memory.get_sponsor("105837") is None
+
+    assert shared.stats()["errors"] == 2
+    assert shared_memory.stats()["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_scrape_fills_from_shared_cache(shared_cache, mock_upstream_client):
+    """Test another worker's cold L1 is filled from L2, not upstream"""
+    calls = []
+    client = mock_upstream_client(calls)
+    first = await scrape_bill_info(URL, client)
+    assert len(calls) == 2
+
+    # Simulate another worker
+    bill_cache.clear()
+    sponsor_cache.clear()
+    second = await scrape_bill_info(URL, client)
+
+    assert second == first
+    assert len(calls) == 2
+    assert shared_cache.stats()["hits"] == 1
+    assert bill_cache.get("44-1/c-422") == first
+
+
+@pytest.mark.asyncio
+async def test_sponsor_shared_across_bills(shared_cache, mock_upstream_client):
+    """Test a sponsor fetched by one worker is reused by another"""
+    calls = []
+    client = mock_upstream_client(calls)
+    await scrape_bill_info(URL, client)
+
+    bill_cache.clear()
+    sponsor_cache.clear()
+    await shared_cache.backend.delete(f"{shared_cache.prefix}bill:44-1/c-422")
+    bill = await scrape_bill_info(URL, client)
+
+    assert bill.sponsor_party == "NDP"
+    # The bill is fetched again but the MP profile is not
+    assert len(calls) == 3
+    assert sponsor_cache.get("105837") == "NDP"
@@ -0,0 +1,60 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+from typing import Any
+from src.scraper.parser import scrape_bill_info
+from src.scraper.singleflight import SingleFlight, bill_flight, sponsor_flight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_result():
+    """Test concurrent callers for one key share a single call"""
+    flight = SingleFlight("test")
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "done"
+
+    results = await asyncio.gather(*(flight.do("key", work) for _ in range(5)))
+    assert results == ["done"] * 5
+    assert calls == 1
+    assert flight.coalesced == 4
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_exception():
+    """Test a failure is raised to every waiting caller"""
+    flight = SingleFlight("test")
+
+    async def work():
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream down")
+
+    results = await asyncio.gather(
+        *(flight.do("key", work) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_bill_lookups_coalesce(mock_upstream_response):
+    """Test concurrent lookups of one bill trigger one bill and one sponsor fetch"""
+    calls = []
+
+    async def mock_get(*args: Any, **kwargs: Any):
+        calls.append(args[0])
+        await asyncio.sleep(0.01)
+        return mock_upstream_response(args[0])
+
+    url = "https://www.parl.ca/legisinfo/en/bill/44-1/c-422"
+    with patch("httpx.AsyncClient.get", side_effect=mock_get):
+        results = await asyncio.gather(*(scrape_bill_info(url) for _ in range(10)))
+
+    assert all(result.sponsor_party == "NDP" for result in results)
+    assert len(calls) == 2
+    assert bill_flight.coalesced == 9
+    assert sponsor_flight.calls == 1
@@ -0,0 +1,75 @@
+import pytest
+import time
+from unittest.mock import patch
+from src.models.bill import BillInfo
+from src.scraper.cache import bill_cache, sponsor_cache
+from src.scraper.ingest import ingest_session
+from src.scraper.parser import refresh_stale_bills, scrape_bill_info
+
+URL = "https://www.parl.ca/legisinfo/en/bill/44-1/c-422"
+
+
+def test_store_round_trip(bill_store):
+    """Test bills and sponsors are read back as written"""
+    bill = BillInfo(bill_number="c-1", status="Royal Assent", sponsor_party="NDP")
+    bill_store.put_bill("44-1/c-1", bill)
+    bill_store.put_sponsor("105837", "NDP")
+
+    stored, fetched_at = bill_store.get_bill("44-1/c-1")
+    assert stored == bill
+    assert fetched_at <= time.time()
+    assert bill_store.get_sponsor("105837")[0] == "NDP"
+    assert bill_store.get_bill("44-1/c-2") is None
+
+
+def test_store_stale_keys(bill_store):
+    """Test only rows older than max_age are reported stale"""
+    with patch("src.scraper.store.time.time", return_value=1000.0):
+        bill_store.put_bill("44-1/c-1", BillInfo(bill_number="c-1"))
+    bill_store.put_bill("44-1/c-2", BillInfo(bill_number="c-2"))
+
+    assert bill_store.stale_bill_keys(max_age=60, limit=10) == ["44-1/c-1"]
+
+
+@pytest.mark.asyncio
+async def test_scrape_serves_from_store(bill_store, mock_upstream_client):
+    """Test a cold in-process cache is filled from the store, not upstream"""
+    calls = []
+    client = mock_upstream_client(calls)
+    first = await scrape_bill_info(URL, client)
+    assert len(calls) == 2
+
+    # Simulate a restart or another worker
+    bill_cache.clear()
+    sponsor_cache.clear()
+    second = await scrape_bill_info(URL, client)
+
+    assert second == first
+    assert len(calls) == 2
+    assert bill_store.get_sponsor("105837")[0] == "NDP"
+
+
+@pytest.mark.asyncio
+async def test_refresh_stale_bills(bill_store, mock_upstream_client):
+    """Test the refresher re-scrapes stale rows only"""
+    with patch("src.scraper.store.time.time", return_value=1000.0):
+        bill_store.put_bill("44-1/c-422", BillInfo(bill_number="c-422"))
+    bill_store.put_bill("44-1/c-1", BillInfo(bill_number="c-1"))
+
+    calls = []
+    client = mock_upstream_client(calls)
+    assert await refresh_stale_bills(client, max_age=60) == 1
+
+    assert calls[0] == f"{URL}/xml"
+    assert bill_store.get_bill("44-1/c-422")[0].sponsor_party == "NDP"
+    assert bill_store.stale_bill_keys(max_age=60, limit=10) == []
+
+
+@pytest.mark.asyncio
+async def test_ingest_writes_store(bill_store, session_feed_path):
+    """Test session ingest persists every bill, with parties from stored sponsors"""
+    bill_store.put_sponsor("105837", "NDP")
+    await ingest_session("44-1", resolve_sponsors=False, source=session_feed_path)
+    assert bill_store.count_bills() == 3
+    assert bill_store.get_bill("44-1/s-2")[0].sponsor_party == "Senate"
+    assert bill_store.get_bill("44-1/c-423")[0].sponsor_party == "NDP"
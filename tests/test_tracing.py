@@ -0,0 +1,182 @@
+import _thread
+import asyncio
+import asyncio.runners
+import httpx
+import logging
+import pytest
+import threading
+from unittest.mock import patch
+from src.api.endpoints import upstream_client
+from src.main import app
+from src.scraper.profiler import ProfilerBusy, _lock, profile_thread
+from src.scraper.tracing import request_trace, slow_traces, span
+
+URL = "https://www.parl.ca/legisinfo/en/bill/44-1/c-422"
+ADMIN = {"X-Admin-Token": "secret"}
+
+
+@pytest.fixture
+def upstream(mock_bill_xml, mock_mp_xml):
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = mock_bill_xml if "parl.ca" in request.url.host else mock_mp_xml
+        return httpx.Response(200, text=body)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    app.dependency_overrides[upstream_client] = lambda: client
+    yield client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def admin_token():
+    with patch("src.api.admin.settings.ADMIN_TOKEN", "secret"):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_slow_traces():
+    slow_traces.clear()
+    yield
+    slow_traces.clear()
+
+
+def test_span_is_noop_without_trace():
+    """Test spans outside a traced request record nothing"""
+    with request_trace("untraced") as trace:
+        with span("stage"):
+            pass
+    assert trace is None
+
+
+def test_slow_request_dumps_trace(app_client, upstream, admin_token, caplog):
+    """Test every stage of a slow bill request is traced, logged and listed"""
+    with patch("src.scraper.tracing.settings.TRACING_ENABLED", True), patch(
+        "src.scraper.tracing.settings.TRACE_SLOW_THRESHOLD", 0.0
+    ):
+        with caplog.at_level(logging.WARNING, logger="src.scraper.tracing"):
+            assert app_client.get(f"/api/bill?url={URL}").status_code == 200
+
+    assert len(slow_traces) == 1
+    names = [s.name for s in slow_traces[0].spans]
+    assert names == [
+        "validate",
+        "bill_lookup",
+        "bill_fetch",
+        "bill_parse",
+        "sponsor_lookup",
+        "sponsor_fetch",
+        "sponsor_parse",
+        "build_model",
+        "serialize",
+    ]
+    assert "Slow request: GET /api/bill" in caplog.text
+
+    response = app_client.get("/api/admin/traces", headers=ADMIN)
+    trace = response.json()["traces"][0]
+    assert trace["name"] == f"GET /api/bill {URL}"
+    assert trace["spans"][2]["depth"] == 1
+
+
+def test_fast_requests_not_kept(app_client, upstream):
+    """Test requests under the threshold are not dumped"""
+    with patch("src.scraper.tracing.settings.TRACING_ENABLED", True):
+        assert app_client.get(f"/api/bill?url={URL}").status_code == 200
+    assert len(slow_traces) == 0
+
+
+def test_admin_requires_token(app_client, admin_token):
+    """Test admin endpoints reject requests without the token"""
+    assert app_client.get("/api/admin/traces").status_code == 403
+    assert (
+        app_client.get("/api/admin/traces", headers={"X-Admin-Token": "x"}).status_code
+        == 403
+    )
+    with patch("src.api.admin.settings.ADMIN_TOKEN", ""):
+        assert app_client.get("/api/admin/traces", headers=ADMIN).status_code == 404
+
+
+def busy_loop(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_profile_finds_hot_function():
+    """Test the sampler attributes a busy thread's time to its hot function"""
+    stop = threading.Event()
+    thread = threading.Thread(target=busy_loop, args=(stop,))
+    thread.start()
+    try:
+        report = profile_thread(thread.ident, seconds=0.2, interval=0.002)
+    finally:
+        stop.set()
+        thread.join()
+
+    assert report["samples"] > 10
+    assert report["busy_share"] > 0.9
+    assert any(
+        entry["function"] == "test_tracing.py:busy_loop"
+        for entry in report["hot_functions"]
+    )
+    assert report["collapsed"][0].endswith(str(report["hot_stacks"][0]["samples"]))
+
+
+def profile_idle_share(target, *args) -> float:
+    thread = threading.Thread(target=target, args=args)
+    thread.start()
+    try:
+        return profile_thread(thread.ident, seconds=0.1, interval=0.002)["idle_share"]
+    finally:
+        thread.join()
+
+
+@pytest.mark.parametrize("loop", ["asyncio", "uvloop"])
+def test_profile_idle_event_loop(loop):
+    """Test a loop waiting for I/O is reported idle"""
+    if loop == "uvloop":
+        uvloop = pytest.importorskip("uvloop")
+        policy = uvloop.EventLoopPolicy()
+    else:
+        policy = asyncio.DefaultEventLoopPolicy()
+
+    def run_idle_loop() -> None:
+        loop = policy.new_event_loop()
+        try:
+            loop.run_until_complete(asyncio.sleep(0.2))
+        finally:
+            loop.close()
+
+    assert profile_idle_share(run_idle_loop) > 0.8
+
+
+def test_profile_idle_c_loop():
+    """Test a loop written in C counts as idle below the frame that started it"""
+    # uvloop's frame shape without uvloop: asyncio.run's Runner.run calling
+    # into C code that blocks
+    namespace: dict = {}
+    exec(
+        compile(
+            "def run(lock):\n    lock.acquire()\n", asyncio.runners.__file__, "exec"
+        ),
+        namespace,
+    )
+    lock = _thread.allocate_lock()
+    lock.acquire()
+    threading.Timer(0.2, lock.release).start()
+
+    assert profile_idle_share(namespace["run"], lock) > 0.8
+
+
+def test_profile_endpoint(app_client, admin_token):
+    """Test the profile endpoint samples the worker and refuses overlapping runs"""
+    response = app_client.get(
+        "/api/admin/profile?seconds=0.05&interval=0.005", headers=ADMIN
+    )
+    assert response.status_code == 200
+    assert response.json()["samples"] > 0
+
+    with _lock:
+        response = app_client.get("/api/admin/profile?seconds=0.05", headers=ADMIN)
+    assert response.status_code == 409
+
+    with _lock, pytest.raises(ProfilerBusy):
+        profile_thread(threading.get_ident(), 0.01)
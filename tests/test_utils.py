@@ -1,4 +1,10 @@
-from src.scraper.utils import extract_bill_number
+from src.scraper.utils import (
+    BillId,
+    extract_bill_key,
+    extract_bill_number,
+    parse_bill_id,
+    resolve_bill_url,
+)
 
 
 def test_extract_bill_number():
@@ -16,3 +22,58 @@ def test_extract_bill_number():
     # Test malformed URL
     malformed_url = "https://www.parl.ca/legisinfo/en/bill/invalid"
     assert extract_bill_number(malformed_url) is None
+
+
+def test_extract_bill_key():
+    """
+    Test session/bill cache key extraction from URLs
+    """
+    url = "https://www.parl.ca/legisinfo/en/bill/44-1/c-422"
+    assert extract_bill_key(url) == "44-1/c-422"
+
+    # Case differences normalize to the same key
+    assert extract_bill_key("https://www.parl.ca/LegisInfo/en/bill/44-1/C-422") == (
+        "44-1/c-422"
+    )
+
+    assert extract_bill_key("https://www.parl.ca/legisinfo/en/bill/invalid") is None
+
+
+def test_resolve_bill_url():
+    """
+    Test bill identifiers resolve to LegisInfo URLs
+    """
+    url = "https://www.parl.ca/legisinfo/en/bill/44-1/c-422"
+    assert resolve_bill_url(url) == url
+    assert resolve_bill_url("44-1/C-422") == url
+    assert resolve_bill_url("c-422") is None
+
+
+def test_parse_bill_id():
+    """
+    Test URL and identifier variants normalize to one bill id
+    """
+    expected = BillId(44, 1, "c-422")
+    variants = [
+        "https://www.parl.ca/legisinfo/en/bill/44-1/c-422",
+        "https://www.parl.ca/legisinfo/en/bill/44-1/c-422/",
+        "https://www.parl.ca/legisinfo/en/bill/44-1/c-422/xml",
+        "https://www.parl.ca/legisinfo/en/bill/44-1/c-422?view=details#top",
+        "http://parl.ca/LegisInfo/EN/Bill/44-1/C-422",
+        "https://www.parl.ca/legisinfo/fr/projet-de-loi/44-1/c-422",
+        " 44-1/C-422 ",
+    ]
+    for variant in variants:
+        assert parse_bill_id(variant) == expected
+
+    assert expected.key == "44-1/c-422"
+    assert expected.xml_url == "https://www.parl.ca/legisinfo/en/bill/44-1/c-422/xml"
+
+    for invalid in [
+        "https://example.com/legisinfo/en/bill/44-1/c-422",
+        "https://www.parl.ca/legisinfo/en/bill/44-1/c-422/extra",
+        "https://www.parl.ca/legisinfo/en/bill/44/c-422",
+        "44-1/x-422",
+        "",
+    ]:
+        assert parse_bill_id(invalid) is None
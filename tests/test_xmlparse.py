@@ -0,0 +1,80 @@
+import pytest
+import xml.etree.ElementTree as ET
+from unittest.mock import patch
+from src.scraper.parser import (
+    extract_bill_fields,
+    parse_bill_document,
+    parse_sponsor_party,
+)
+from src.scraper.stream import iter_bill_elements, iter_file_chunks
+from src.scraper.xmlparse import lxml_available, read_bill_values, use_lxml
+
+BACKENDS = [
+    "etree",
+    pytest.param(
+        "lxml",
+        marks=pytest.mark.skipif(not lxml_available(), reason="lxml not installed"),
+    ),
+]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    with patch("src.scraper.xmlparse.settings.XML_BACKEND", request.param):
+        yield request.param
+
+
+def test_backend_selection(backend):
+    """Test XML_BACKEND picks the parser"""
+    assert use_lxml() == (backend == "lxml")
+
+
+def test_parse_bill_document_from_bytes(backend, mock_bill_xml: str):
+    """Test both backends extract the same fields from raw bytes"""
+    fields, sponsor = parse_bill_document(mock_bill_xml.encode())
+    assert fields == {
+        "bill_number": "c-422",
+        "bill_type": "Private Member's Bill",
+        "status": "Outside the Order of Precedence",
+        "sponsor_name": "Bonita Zarrillo",
+        "last_updated": "2024-12-02T11:00:00",
+    }
+    assert sponsor.person_id == "105837"
+    assert parse_bill_document(mock_bill_xml) == (fields, sponsor)
+
+
+def test_parse_senate_bill(backend, mock_senate_bill_xml: str):
+    """Test Senate bills need no sponsor lookup"""
+    fields, sponsor = parse_bill_document(mock_senate_bill_xml.encode())
+    assert fields["bill_number"] == "s-2"
+    assert sponsor == "Senate"
+
+
+def test_missing_bill_and_invalid_xml(backend):
+    """Test documents without a <Bill> and malformed documents"""
+    assert read_bill_values(b"<Bills></Bills>") is None
+    assert read_bill_values(b"<Bills><Bill/></Bills>") == {}
+    with pytest.raises(ET.ParseError):
+        read_bill_values(b"<Bills><Bill>")
+
+
+def test_parse_sponsor_party(backend, mock_mp_xml: str):
+    """Test the caucus is read from the current role, then past roles"""
+    assert parse_sponsor_party(mock_mp_xml.encode()) == "NDP"
+
+    past_roles = b"""<Profile><CaucusMemberRoles>
+        <CaucusMemberRole><CaucusShortName>Liberal</CaucusShortName></CaucusMemberRole>
+        <CaucusMemberRole><CaucusShortName>Independent</CaucusShortName></CaucusMemberRole>
+    </CaucusMemberRoles></Profile>"""
+    assert parse_sponsor_party(past_roles) == "Independent"
+    assert parse_sponsor_party(b"<Profile/>") is None
+
+
+@pytest.mark.asyncio
+async def test_stream_feed(backend, session_feed_path):
+    """Test both backends stream the same top-level bills"""
+    numbers = [
+        extract_bill_fields(bill)["bill_number"]
+        async for bill in iter_bill_elements(iter_file_chunks(session_feed_path, 64))
+    ]
+    assert numbers == ["c-422", "c-423", "s-2", "Unknown"]